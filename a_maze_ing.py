@@ -25,7 +25,7 @@ import random
 
 from typing import TYPE_CHECKING
 
-from src.utils import module_checker, ArgumentsError
+from src.utils import module_checker, ArgumentsError, MazePrefetcher
 
 if TYPE_CHECKING:
     from maze import MazeGenerator
@@ -37,6 +37,8 @@ def main() -> int:
     This function performs module checks, loads the configuration from
     'config.txt', initializes the generator, and runs the interactive
     menu loop. It catches known exceptions to exit gracefully.
+    The next maze is generated in background while the menu is shown, so
+    regenerating only has to render it.
 
     Returns:
         int: The process exit code.
@@ -44,6 +46,8 @@ def main() -> int:
             * 1: Unexpected runtime errors.
             * 2: Dependency errors, configuration errors, or invalid arguments.
     """
+    prefetcher = MazePrefetcher()
+    generator: "MazeGenerator | None" = None
     try:
         try:
             module_checker()
@@ -54,7 +58,7 @@ def main() -> int:
         from colorama import Cursor
 
         from maze import (MazeConfig, MazeConfigError, MazeGenerationError,
-                          MazeGenerator, MazeSolver)
+                          MazeGenerator)
         from maze.maze_customization import (ANIM, COLORS, STYLE, ALGO_MODE)
 
         if len(sys.argv) == 2:
@@ -70,6 +74,7 @@ def main() -> int:
         generator = MazeGenerator(config)
 
         generator.maze_generator(rendering=True)
+        prefetcher.start(generator)
 
         show_menu = True
         choice2 = True
@@ -121,18 +126,22 @@ def main() -> int:
                     print(Cursor.UP(1) + "\r" + ANIM.clear, end="")
 
             if choice == 1:
-                generator.maze_generator(rendering=True, regen=True)
+                prefetched = prefetcher.take(generator)
+                generator.maze_generator(rendering=True, regen=True,
+                                         prefetched=prefetched)
+                if prefetcher.error is not None:
+                    print(f"{COLORS.red}Prefetch failed: {prefetcher.error}"
+                          f"{COLORS.reset}", file=sys.stderr)
+                prefetcher.start(generator)
                 choice2 = True
 
             elif choice == 2:
                 print(ANIM.clear_screen, end="")
                 display_text(generator)
                 if choice2:
-                    solver = MazeSolver(generator)
-                    solver.find_path()
                     generator.y_offset = 2
                     generator.print_maze()
-                    solver.print_path()
+                    generator.get_solver().print_path()
                     choice2 = False
                 else:
                     generator.y_offset = 2
@@ -148,10 +157,7 @@ def main() -> int:
                 if choice2:
                     generator.print_maze()
                 else:
-                    if 'solver' in locals():
-                        solver.print_maze_solver()
-                    else:
-                        generator.print_maze()
+                    generator.get_solver().print_maze_solver()
                 print(Cursor.POS(1, generator.height + generator.y_offset + 1))
 
             elif choice == 4:
@@ -170,6 +176,7 @@ def main() -> int:
                             algo_choosen = int(algo_choose)
                             if 1 <= algo_choosen <= 2:
                                 generator._apply_algo_change(algo_choosen)
+                                prefetcher.restart(generator)
                                 break
                             else:
                                 raise ValueError
@@ -214,6 +221,11 @@ def main() -> int:
               file=sys.stderr)
         return 1
 
+    finally:
+        prefetcher.cancel()
+        if generator is not None:
+            generator.close()
+
     return 0
 
 
@@ -0,0 +1,124 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  batch.py                                          :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/23 11:02:48 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/23 11:02:48 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Command-line batch generator.
+
+Generates every maze of a spec file (`.jsonl` or `.csv`, see
+`load_specs`) and appends them to a maze archive (see `maze_archive`),
+instead of writing one output file per maze. The `OUTPUT_FILE` of the
+specs is not used. A maze identical to one already in the archive is
+stored as an alias of it (see `maze_dedupe`).
+
+With `--deadline`, a maze still being generated after that many seconds
+is cancelled and skipped; with `--progress`, the cells carved are shown
+on stderr while a maze is generated.
+
+Usage: python3 batch.py <specs> <archive.mza> [--skip-invalid]
+       [--deadline SECONDS] [--progress]
+"""
+
+import argparse
+import sys
+import time
+
+from typing import List, Tuple
+
+
+def main() -> int:
+    """Generates the mazes of the spec file into the archive.
+
+    Returns:
+        int: The process exit code.
+            * 0: Every maze was generated.
+            * 1: A maze could not be generated, or was cancelled by the
+                 deadline.
+            * 2: Invalid arguments or spec file.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("specs", help="the .jsonl or .csv spec file")
+    parser.add_argument("archive", help="the .mza archive, created or "
+                        "appended to")
+    parser.add_argument("--skip-invalid", action="store_true",
+                        help="report the invalid specs instead of stopping")
+    parser.add_argument("--deadline", type=float, default=None,
+                        metavar="SECONDS",
+                        help="cancel and skip a maze generated for longer")
+    parser.add_argument("--progress", action="store_true",
+                        help="show the cells carved on stderr")
+    args = parser.parse_args()
+
+    from maze import (MazeGenerationCancelled, MazeGenerationError,
+                      MazeGenerator, MazeProgress, load_specs)
+    from maze.maze_archive import ARCHIVE_SUFFIX
+    from maze.maze_cache import MazeCache
+    from maze.maze_dedupe import MazeDedupeStore
+    from maze.maze_errors import MazeError
+
+    if not args.archive.endswith(ARCHIVE_SUFFIX):
+        print(f"ArgumentsError: The archive must end with "
+              f"'{ARCHIVE_SUFFIX}'", file=sys.stderr)
+        return 2
+    if args.deadline is not None and args.deadline <= 0:
+        print("ArgumentsError: --deadline must be positive", file=sys.stderr)
+        return 2
+
+    def show(carved: int, total: int) -> None:
+        """Prints the progress of the current maze over its last line."""
+        print(f"\rMaze #{count}: {carved}/{total} cells "
+              f"({100 * carved // max(total, 1)}%)", end="", file=sys.stderr,
+              flush=True)
+
+    count = 0
+    cancelled: List[Tuple[int, str]] = []
+    errors: List[Tuple[int, str]] | None = [] if args.skip_invalid else None
+    start = time.perf_counter()
+    try:
+        with MazeDedupeStore(args.archive) as store:
+            for spec in load_specs(args.specs, errors):
+                progress = None
+                if args.deadline is not None or args.progress:
+                    progress = MazeProgress(show if args.progress else None,
+                                            timeout=args.deadline)
+                generator = MazeGenerator(spec, progress=progress)
+                try:
+                    maze = generator.generate()
+                except MazeGenerationCancelled as e:
+                    cancelled.append((count, str(e)))
+                    continue
+                finally:
+                    generator.close()
+                    if args.progress:
+                        print(file=sys.stderr)
+                    count += 1
+                store.add(maze, MazeCache.key(generator))
+    except MazeGenerationError as e:
+        print(f"{type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    except (FileNotFoundError, MazeError) as e:
+        print(f"{type(e).__name__}: {e}", file=sys.stderr)
+        return 2
+
+    for line, message in errors or []:
+        print(f"Skipped spec at line {line}: {message}", file=sys.stderr)
+    for number, message in cancelled:
+        print(f"Skipped maze #{number}: {message}", file=sys.stderr)
+    elapsed = time.perf_counter() - start
+    ratio = "n/a" if store.ratio is None else f"{store.ratio:.2f}x"
+    print(f"{store.added} mazes added to {args.archive} in {elapsed:.2f} s: "
+          f"{store.added - store.duplicates - store.existing} stored, "
+          f"{store.duplicates} duplicates, {store.existing} already in the "
+          f"archive (dedupe ratio {ratio})")
+    return 1 if cancelled else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
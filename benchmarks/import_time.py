@@ -0,0 +1,158 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  import_time.py                                    :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/20 09:02:37 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/20 09:02:37 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Import-time budget of the `maze` package.
+
+Each scenario runs a statement in a fresh interpreter with
+`python -X importtime`, several times, and keeps the fastest run. The
+time is the cumulative import time of everything the statement imported
+(the interpreter startup modules are left out). A scenario fails if it
+goes over its budget or if it imported a module that must stay lazy.
+
+Usage: PYTHONPATH=src python3 benchmarks/import_time.py [--runs N]
+       [--scale FACTOR]
+
+The exit code is 1 if a scenario failed, so it can gate a CI job.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class Scenario(NamedTuple):
+    """A statement to time.
+
+    Attributes:
+        statement: The Python code run with `-c`.
+        budget_ms: The maximum import time, in milliseconds.
+        forbidden: Modules the statement must not import.
+    """
+    statement: str
+    budget_ms: float
+    forbidden: Tuple[str, ...]
+
+
+# Budgets leave room for slower machines: the forbidden modules are the
+# strict part of the check.
+SCENARIOS = [
+    Scenario("import maze", 40,
+             ("pydantic", "colorama", "maze.maze_generator")),
+    Scenario("from maze import MazeGenerator", 60,
+             ("pydantic", "colorama", "maze.algorithms", "maze.maze_cache")),
+    Scenario("from maze import MazeSolver", 60,
+             ("pydantic", "colorama", "maze.algorithms")),
+    Scenario("import maze.algorithms.backtracking", 30,
+             ("pydantic", "colorama", "maze.algorithms.hunt_and_kill",
+              "maze.algorithms.tiled", "multiprocessing",
+              "concurrent.futures")),
+    Scenario("from maze import MazeConfig", 250, ("colorama",)),
+]
+
+
+def run_importtime(statement: str) -> Dict[str, Tuple[int, int]]:
+    """Runs `statement` with `-X importtime` in a fresh interpreter.
+
+    Args:
+        statement: The Python code to run.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: For each imported module, its nesting
+        level and its cumulative import time in microseconds.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(ROOT / "src"), str(ROOT), env.get("PYTHONPATH", "")])
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env, capture_output=True, text=True, check=True)
+
+    modules = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        modules[name.strip()] = (level, int(cumulative))
+    return modules
+
+
+def measure(statement: str, startup: Dict[str, Tuple[int, int]],
+            runs: int) -> Tuple[float, List[str]]:
+    """Times `statement`, keeping its fastest run.
+
+    Args:
+        statement: The Python code to run.
+        startup: The modules imported by an empty interpreter.
+        runs: The number of runs.
+
+    Returns:
+        Tuple[float, List[str]]: The import time in milliseconds and the
+        names of the modules imported by the statement.
+    """
+    best = float("inf")
+    imported: List[str] = []
+    for _ in range(runs):
+        modules = run_importtime(statement)
+        total = sum(cumulative for name, (level, cumulative)
+                    in modules.items()
+                    if level == 0 and name not in startup)
+        if total < best:
+            best = total
+            imported = [name for name in modules if name not in startup]
+    return best / 1000, imported
+
+
+def main() -> int:
+    """Runs every scenario and prints a report.
+
+    Returns:
+        int: 0 if every scenario is within its budget, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5,
+                        help="runs per scenario, the fastest is kept")
+    parser.add_argument("--scale", type=float, default=1.0,
+                        help="multiplies every budget (slow machines)")
+    args = parser.parse_args()
+
+    startup = run_importtime("pass")
+    failed = False
+    for scenario in SCENARIOS:
+        elapsed, imported = measure(scenario.statement, startup, args.runs)
+        budget = scenario.budget_ms * args.scale
+        leaked = [forbidden for forbidden in scenario.forbidden
+                  if any(name == forbidden or name.startswith(forbidden + ".")
+                         for name in imported)]
+
+        status = "ok"
+        if elapsed > budget or leaked:
+            status = "FAIL"
+            failed = True
+        print(f"{status:4} {scenario.statement:35} {elapsed:8.1f} ms "
+              f"(budget {budget:.0f} ms)")
+        if leaked:
+            print(f"     imported lazy modules: {', '.join(leaked)}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  jump_points.py                                    :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/03/04 09:12:47 by roandrie        #+#    #+#               #
+#  Updated: 2026/03/04 09:12:47 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Nodes expanded by BFS and by jump-point search, on a ladder of sizes.
+
+For each size of `--sizes`, generates an imperfect maze with
+`--algorithm` and solves it with `MazeSolver.find_path`, then with
+`find_path(jump_points=True)`. Prints the blocks each search expanded
+(`MazeSolver.expanded`) and its time. Both must find paths of the same
+length.
+
+Usage: PYTHONPATH=src python3 benchmarks/jump_points.py
+       [--sizes N,N,...] [--algorithm rb|huntandkill] [--seed SEED]
+
+The exit code is 1 if the two searches disagree on a length.
+"""
+
+import argparse
+import sys
+import time
+
+from typing import List, Tuple
+
+from maze import MazeGenerator, MazeSolver, MazeSpec
+
+
+def solve(generator: MazeGenerator,
+          jump_points: bool) -> Tuple[int, int, float]:
+    """Solves the maze of `generator` with a new solver.
+
+    Args:
+        generator: The generated maze.
+        jump_points: True for the jump-point search, False for the BFS.
+
+    Returns:
+        Tuple[int, int, float]: The length of the path, the blocks
+        expanded and the time in seconds.
+    """
+    solver = MazeSolver(generator)
+    start = time.perf_counter()
+    solver.find_path(jump_points=jump_points)
+    elapsed = time.perf_counter() - start
+    return len(solver.path), solver.expanded, elapsed
+
+
+def main() -> int:
+    """Climbs the ladder and prints a report.
+
+    Returns:
+        int: 0 if both searches found the same lengths, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="50,100,200",
+                        help="comma separated cells per side of the mazes")
+    parser.add_argument("--algorithm", default="rb",
+                        choices=("rb", "huntandkill"),
+                        help="generation algorithm")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="seed of the mazes")
+    args = parser.parse_args()
+    sizes: List[int] = [int(size) for size in args.sizes.split(",")]
+
+    print(f"{'size':>6} {'length':>7} {'BFS nodes':>10} {'BFS s':>8} "
+          f"{'JPS nodes':>10} {'JPS s':>8} {'ratio':>7}")
+    failed = False
+    for size in sizes:
+        spec = MazeSpec.from_mapping({
+            "width": size, "height": size, "entry": "0,0",
+            "exit": f"{size - 1},{size - 1}", "output_file": "maze.txt",
+            "perfect": False, "algorithm": args.algorithm,
+            "seed": args.seed})
+        generator = MazeGenerator(spec)
+        generator.generate()
+        length, bfs_nodes, bfs_time = solve(generator, False)
+        jump_length, jps_nodes, jps_time = solve(generator, True)
+        print(f"{size:>6} {length:>7} {bfs_nodes:>10} {bfs_time:>8.3f} "
+              f"{jps_nodes:>10} {jps_time:>8.3f} "
+              f"{bfs_nodes / max(jps_nodes, 1):>6.1f}x")
+        if jump_length != length:
+            print(f"FAIL: {size} x {size}: JPS found {jump_length} blocks, "
+                  f"BFS {length}")
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
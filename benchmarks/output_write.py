@@ -0,0 +1,135 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  output_write.py                                   :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/21 15:40:02 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/21 15:40:02 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Time to serialize a very large maze.
+
+Builds a random `Maze` of `--size` x `--size` cells (the content does not
+change the cost of the writer) and times its text output file, its binary
+format, and the encoding of a block grid of `--grid` x `--grid` cells.
+
+Usage: PYTHONPATH=src python3 benchmarks/output_write.py [--size N]
+       [--grid N] [--budget SECONDS]
+
+The exit code is 1 if writing the text file takes more than the budget.
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+from types import SimpleNamespace
+from typing import Callable, Tuple, TypeVar
+
+from maze.maze_customization import MAZE
+from maze.maze_result import Maze
+from maze.output.maze_encoding import encode_cells
+
+T = TypeVar("T")
+
+
+def timed(label: str, run: Callable[[], T]) -> Tuple[T, float]:
+    """Runs `run` once and prints how long it took.
+
+    Args:
+        label: The name printed in the report.
+        run: The work to time.
+
+    Returns:
+        Tuple[T, float]: The result of `run` and the time, in seconds.
+    """
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    print(f"{label:32} {elapsed:8.3f} s")
+    return result, elapsed
+
+
+def random_maze(size: int, rng: random.Random) -> Maze:
+    """Builds a maze of random cells and a random solution.
+
+    Args:
+        size: The number of cells per side.
+        rng: The random generator.
+
+    Returns:
+        Maze: The maze.
+    """
+    nibbles = bytes(i & 0xF for i in range(256))
+    cells = rng.randbytes(size * size).translate(nibbles)
+    letters = bytes.maketrans(bytes(range(256)), b"NESW" * 64)
+    moves = rng.randbytes(size * size // 4).translate(letters)
+    return Maze(size, size, cells, (0, 0), (size - 1, size - 1),
+                rng.randrange(10 ** 9), moves.decode("ascii"))
+
+
+def random_grid(size: int, rng: random.Random) -> SimpleNamespace:
+    """Builds a block grid of random walls, like `_fill_maze` lays it out.
+
+    Args:
+        size: The number of cells per side.
+        rng: The random generator.
+
+    Returns:
+        SimpleNamespace: An object with the `maze`, `width` and `height`
+        attributes of a `MazeGenerator`.
+    """
+    blocks = size * 2 + 1
+    walls = rng.randbytes(blocks * blocks)
+    grid = {(x, y): MAZE.wall if walls[y * blocks + x] & 1 else MAZE.empty
+            for y in range(blocks) for x in range(blocks)}
+    return SimpleNamespace(maze=grid, width=blocks, height=blocks)
+
+
+def main() -> int:
+    """Runs the timings and prints a report.
+
+    Returns:
+        int: 0 if the text file was written within the budget, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=5000,
+                        help="cells per side of the written maze")
+    parser.add_argument("--grid", type=int, default=500,
+                        help="cells per side of the encoded block grid")
+    parser.add_argument("--budget", type=float, default=1.0,
+                        help="maximum time to write the text file")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    maze = random_maze(args.size, rng)
+    print(f"{args.size} x {args.size} cells")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "maze.txt")
+        _, elapsed = timed("Maze.write (text)", lambda: maze.write(path))
+        print(f"{'':32} {os.path.getsize(path) / 2 ** 20:8.1f} MiB")
+
+    data, _ = timed("Maze.to_bytes (.mzb)", maze.to_bytes)
+    print(f"{'':32} {len(data) / 2 ** 20:8.1f} MiB")
+    timed("Maze.from_bytes", lambda: Maze.from_bytes(data))
+
+    grid = random_grid(args.grid, rng)
+    print(f"{args.grid} x {args.grid} cells block grid")
+    timed("encode_cells", lambda: encode_cells(grid))
+
+    if elapsed > args.budget:
+        print(f"FAIL: text file written in {elapsed:.3f} s "
+              f"(budget {args.budget} s)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  path_queries.py                                   :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/03/03 14:37:26 by roandrie        #+#    #+#               #
+#  Updated: 2026/03/03 14:37:26 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Cost of many path queries on one maze: BFS against the indexes.
+
+Generates a `--size` x `--size` maze and draws `--queries` random pairs
+of cells. Each pair is answered by a BFS (`CellSolver.solve`), by a
+`PathIndex` (distance, next step and full path) and by a
+`LandmarkIndex` with `--landmarks` landmarks (A*); the indexes are built
+once, and their build times are reported apart. All must agree on the
+distances.
+
+Usage: PYTHONPATH=src python3 benchmarks/path_queries.py [--size N]
+       [--queries N] [--landmarks N] [--seed SEED] [--imperfect]
+
+The exit code is 1 if an index and the BFS disagree.
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from typing import List, Tuple
+
+from maze import (CellSolver, LandmarkIndex, MazeGenerator, MazeSpec,
+                  PathIndex)
+
+
+def main() -> int:
+    """Runs the queries and prints a report.
+
+    Returns:
+        int: 0 if every answer matches the BFS, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=300,
+                        help="cells per side of the maze")
+    parser.add_argument("--queries", type=int, default=200,
+                        help="number of random pairs of cells")
+    parser.add_argument("--landmarks", type=int, default=8,
+                        help="landmarks of the A* index")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="seed of the maze and of the pairs")
+    parser.add_argument("--imperfect", action="store_true",
+                        help="query an imperfect maze (BFS fallback)")
+    args = parser.parse_args()
+
+    spec = MazeSpec.from_mapping({
+        "width": args.size, "height": args.size, "entry": "0,0",
+        "exit": f"{args.size - 1},{args.size - 1}",
+        "output_file": "maze.txt", "perfect": not args.imperfect,
+        "seed": args.seed})
+    maze = MazeGenerator(spec).generate()
+    rng = random.Random(args.seed)
+    pairs: List[Tuple[Tuple[int, int], Tuple[int, int]]] = [
+        ((rng.randrange(args.size), rng.randrange(args.size)),
+         (rng.randrange(args.size), rng.randrange(args.size)))
+        for _ in range(args.queries)]
+    print(f"{args.size} x {args.size} cells, {args.queries} queries")
+
+    solver = CellSolver(maze)
+    start = time.perf_counter()
+    expected = []
+    explored = 0
+    for first, second in pairs:
+        expected.append(solver.solve(first, second))
+        explored += solver.explored
+    bfs_time = time.perf_counter() - start
+    print(f"{'BFS per query':24} {bfs_time:8.3f} s "
+          f"({explored} cells expanded)")
+
+    start = time.perf_counter()
+    index = PathIndex(maze)
+    build_time = time.perf_counter() - start
+    print(f"{'PathIndex build':24} {build_time:8.3f} s "
+          f"({'tree' if index.perfect else 'BFS fallback'}, "
+          f"{index.levels} levels)")
+
+    start = time.perf_counter()
+    distances = [index.distance(first, second) for first, second in pairs]
+    print(f"{'  distance':24} {time.perf_counter() - start:8.3f} s")
+    start = time.perf_counter()
+    for first, second in pairs:
+        index.next_step(first, second)
+    print(f"{'  next_step':24} {time.perf_counter() - start:8.3f} s")
+    start = time.perf_counter()
+    paths = [index.path(first, second) for first, second in pairs]
+    print(f"{'  path':24} {time.perf_counter() - start:8.3f} s")
+
+    start = time.perf_counter()
+    landmarks = LandmarkIndex(maze, args.landmarks)
+    print(f"{'LandmarkIndex build':24} {time.perf_counter() - start:8.3f} s "
+          f"({len(landmarks.landmarks)} landmarks)")
+    start = time.perf_counter()
+    found = []
+    explored = 0
+    for first, second in pairs:
+        found.append(landmarks.path(first, second))
+        explored += landmarks.explored
+    print(f"{'  path (A*)':24} {time.perf_counter() - start:8.3f} s "
+          f"({explored} cells expanded)")
+
+    ok = all(distance == (-1 if moves is None else len(moves))
+             for distance, moves in zip(distances, expected))
+    ok = ok and all((moves is None) == (other is None)
+                    and (moves is None or len(moves) == len(other))
+                    for moves, other in zip(expected, found))
+    if index.perfect:
+        ok = ok and paths == expected
+    if not ok:
+        print("FAIL: an index and the BFS disagree")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
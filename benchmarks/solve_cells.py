@@ -0,0 +1,108 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  solve_cells.py                                    :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/03/01 11:26:08 by roandrie        #+#    #+#               #
+#  Updated: 2026/03/01 11:26:08 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Time and memory to solve a large maze, on blocks and on cells.
+
+Generates a `--size` x `--size` maze, then solves it twice: with
+`MazeSolver` on the block grid of the generator, and with `CellSolver` on
+the cells of the result. Both must find the moves written in the output
+file (`CellSolver` may find other ones on an imperfect hunt-and-kill
+maze with an opened corner block; the default algorithm never opens
+one). Each search runs twice: once timed, once under `tracemalloc` for
+its peak memory (tracing slows it down).
+
+Usage: PYTHONPATH=src python3 benchmarks/solve_cells.py [--size N]
+       [--seed SEED] [--imperfect]
+
+The exit code is 1 if a solver does not find the moves of the maze.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+
+from typing import Callable, Tuple, TypeVar
+
+from maze import CellSolver, MazeGenerator, MazeSolver, MazeSpec
+from maze.output.maze_encoding import path_to_directions
+
+T = TypeVar("T")
+
+
+def measured(label: str, run: Callable[[], T]) -> Tuple[T, float, int]:
+    """Runs `run` twice and prints its time and peak memory.
+
+    Args:
+        label: The name printed in the report.
+        run: The work to measure.
+
+    Returns:
+        Tuple[T, float, int]: The result of `run`, the time in seconds and
+        the peak memory in bytes.
+    """
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    run()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:24} {elapsed:8.3f} s {peak / 2 ** 20:8.1f} MiB")
+    return result, elapsed, peak
+
+
+def main() -> int:
+    """Runs the measures and prints a report.
+
+    Returns:
+        int: 0 if both solvers found the moves of the maze, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=500,
+                        help="cells per side of the maze")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="seed of the maze")
+    parser.add_argument("--imperfect", action="store_true",
+                        help="solve an imperfect maze")
+    args = parser.parse_args()
+
+    spec = MazeSpec.from_mapping({
+        "width": args.size, "height": args.size, "entry": "0,0",
+        "exit": f"{args.size - 1},{args.size - 1}",
+        "output_file": "maze.txt", "perfect": not args.imperfect,
+        "seed": args.seed})
+    generator = MazeGenerator(spec)
+    maze = generator.generate()
+    print(f"{args.size} x {args.size} cells, {len(maze.directions)} moves")
+
+    def on_blocks() -> str:
+        solver = MazeSolver(generator)
+        solver.find_path()
+        directions: str = path_to_directions(generator, solver.path)
+        return directions
+
+    blocks, block_time, block_peak = measured("MazeSolver (blocks)",
+                                              on_blocks)
+    cells, cell_time, cell_peak = measured(
+        "CellSolver (cells)", lambda: CellSolver(maze).solve())
+    print(f"{'':24} {block_time / cell_time:7.1f}x "
+          f"{block_peak / cell_peak:11.1f}x")
+
+    if blocks != maze.directions or cells != maze.directions:
+        print("FAIL: a solver did not find the moves of the maze")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
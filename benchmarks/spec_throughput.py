@@ -0,0 +1,152 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  spec_throughput.py                                :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/20 15:12:06 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/20 15:12:06 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Throughput of the batch spec loader, in specs per second.
+
+Writes a batch of random valid specs as JSON Lines and as CSV, then
+times `load_specs` on each file against the baseline: the JSON Lines file
+read line by line, with one `MazeConfig` built per spec.
+
+Usage: PYTHONPATH=src python3 benchmarks/spec_throughput.py [--count N]
+       [--seed SEED] [--repeat N]
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+import tempfile
+import time
+
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from maze import MazeConfig, get_fortytwo_pattern, load_specs
+
+SIZES = [(10, 10), (20, 15), (30, 30), (50, 40), (100, 100)]
+FIELDS = ["width", "height", "entry", "exit", "output_file", "perfect",
+          "seed", "algorithm"]
+
+
+def random_spec(rng: random.Random, index: int) -> Dict[str, Any]:
+    """Draws a valid spec, as the strings a config file would hold.
+
+    Args:
+        rng: The random generator.
+        index: The number of the spec, used for its output file.
+
+    Returns:
+        Dict[str, Any]: The spec, with string values.
+    """
+    width, height = rng.choice(SIZES)
+    pattern = get_fortytwo_pattern(width, height)
+    while True:
+        entry = (rng.randrange(width), rng.randrange(height))
+        exit = (rng.randrange(width), rng.randrange(height))
+        if (entry not in pattern and exit not in pattern and
+                abs(entry[0] - exit[0]) + abs(entry[1] - exit[1]) > 1):
+            break
+    return {
+        "width": str(width),
+        "height": str(height),
+        "entry": f"{entry[0]},{entry[1]}",
+        "exit": f"{exit[0]},{exit[1]}",
+        "output_file": f"maze_{index}.txt",
+        "perfect": rng.choice(["True", "False"]),
+        "seed": str(rng.randrange(10 ** 9)),
+        "algorithm": rng.choice(["rb", "huntandkill"]),
+    }
+
+
+def validate_with_model(path: Path) -> int:
+    """Validates a JSON Lines file with one `MazeConfig` per line.
+
+    Args:
+        path: The JSON Lines file.
+
+    Returns:
+        int: The number of valid specs.
+    """
+    with open(path) as file:
+        return sum(1 for line in file if MazeConfig(**json.loads(line)))
+
+
+def timed(label: str, count: int, repeat: int,
+          run: Callable[[], int]) -> float:
+    """Runs `run` several times and prints the throughput of the fastest.
+
+    Args:
+        label: The name printed in the report.
+        count: The number of specs expected.
+        repeat: The number of runs.
+        run: Validates the specs and returns how many were valid.
+
+    Returns:
+        float: The throughput, in specs per second.
+    """
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        valid = run()
+        elapsed = min(elapsed, time.perf_counter() - start)
+        if valid != count:
+            raise SystemExit(f"{label}: {valid} valid specs out of {count}")
+    rate = count / elapsed
+    print(f"{label:24} {elapsed:8.3f} s {rate:12,.0f} specs/s")
+    return rate
+
+
+def main() -> int:
+    """Writes the batch files and prints the throughput of each loader.
+
+    Returns:
+        int: Always 0.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100_000,
+                        help="number of specs in the batch")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="seed of the random specs")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="runs per loader, the fastest is kept")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    specs: List[Dict[str, Any]] = [random_spec(rng, i)
+                                   for i in range(args.count)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        jsonl = Path(tmp, "specs.jsonl")
+        with open(jsonl, "w") as file:
+            for spec in specs:
+                file.write(json.dumps(spec) + "\n")
+
+        csv_path = Path(tmp, "specs.csv")
+        with open(csv_path, "w", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=FIELDS)
+            writer.writeheader()
+            writer.writerows(specs)
+
+        print(f"{args.count:,} specs")
+        baseline = timed("MazeConfig per spec", args.count, args.repeat,
+                         lambda: validate_with_model(jsonl))
+        for label, path in (("load_specs (JSON Lines)", jsonl),
+                            ("load_specs (CSV)", csv_path)):
+            rate = timed(label, args.count, args.repeat,
+                         lambda: sum(1 for _ in load_specs(str(path))))
+            print(f"{'':24} x{rate / baseline:.1f} vs MazeConfig")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,122 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  wall_follower.py                                  :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/03/02 11:05:51 by roandrie        #+#    #+#               #
+#  Updated: 2026/03/02 11:05:51 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Cost of the wall follower solving maze files in place.
+
+For each size of `--sizes`, generates a perfect maze, writes it as '.txt'
+and '.mzb', then solves each file with `WallFollower` (dead ends pruned)
+into a temporary file. The result must be the moves `MazeSolver.find_path`
+found for the output file. The report gives the time, the cells read
+from the file (per cell of the maze: the I/O cost) and the peak memory
+traced during a second run.
+
+Usage: PYTHONPATH=src python3 benchmarks/wall_follower.py
+       [--sizes N,N,...] [--seed SEED] [--hand right|left]
+
+The exit code is 1 if a walk does not find the moves of the maze.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from maze import Maze, MazeGenerator, MazeSpec, WallFollower
+
+
+def walk(path: str, hand: str, sink_path: str) -> WallFollower:
+    """Solves the maze file at `path`, with the moves in `sink_path`.
+
+    Args:
+        path: The maze file.
+        hand: The hand kept on the wall.
+        sink_path: The file receiving the moves.
+
+    Returns:
+        WallFollower: The (closed) walker, with its counters.
+    """
+    with WallFollower(path, hand) as walker:
+        with open(sink_path, "w+b") as sink:
+            walker.solve(sink, prune=True)
+    return walker
+
+
+def solve_file(path: str, hand: str, maze: Maze, tmp: str) -> bool:
+    """Measures the walk of one maze file and prints a line.
+
+    Args:
+        path: The maze file.
+        hand: The hand kept on the wall.
+        maze: The maze written in the file.
+        tmp: A directory for the moves.
+
+    Returns:
+        bool: True if the walk found the moves of the maze.
+    """
+    sink_path = os.path.join(tmp, "moves")
+    start = time.perf_counter()
+    walker = walk(path, hand, sink_path)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    walk(path, hand, sink_path)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    with open(sink_path, "rb") as file:
+        found: bool = file.read().decode("ascii") == maze.directions
+    cells = maze.width * maze.height
+    print(f"{os.path.basename(path):10} {elapsed:8.3f} s "
+          f"{walker.steps:10} steps {walker.cells_read / cells:6.2f} "
+          f"reads/cell {peak / 2 ** 10:8.1f} KiB"
+          f"{'' if found else '  MISMATCH'}")
+    return found
+
+
+def main() -> int:
+    """Runs the walks and prints a report.
+
+    Returns:
+        int: 0 if every walk found the moves of its maze, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="50,200,500",
+                        help="cells per side of the mazes, comma separated")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="seed of the mazes")
+    parser.add_argument("--hand", choices=("right", "left"),
+                        default="right", help="hand kept on the wall")
+    args = parser.parse_args()
+
+    ok = True
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in (int(size) for size in args.sizes.split(",")):
+            spec = MazeSpec.from_mapping({
+                "width": size, "height": size, "entry": "0,0",
+                "exit": f"{size - 1},{size - 1}", "output_file": "maze.txt",
+                "perfect": True, "seed": args.seed})
+            maze = MazeGenerator(spec).generate()
+            print(f"{size} x {size} cells, {len(maze.directions)} moves")
+            for suffix in (".txt", ".mzb"):
+                path = os.path.join(tmp, "maze" + suffix)
+                maze.write(path)
+                ok = solve_file(path, args.hand, maze, tmp) and ok
+
+    if not ok:
+        print("FAIL: a walk did not find the moves of the maze")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  chunks.py                                         :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/16 14:02:11 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/16 14:02:11 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Infinite maze made of lazily generated chunks for the 'Endless' mode.
+
+The plane is split into square chunks of cells. A chunk is carved only
+when the player gets close to it, from a seed derived from the global
+seed and the chunk coordinates, so the same place always looks the same.
+Every chunk opens one door on each of its four sides, at a position that
+both neighbours derive from the same seed: the whole plane is connected
+without ever looking at another chunk. Only the most recently used
+chunks are kept in memory.
+"""
+
+import math
+import random
+
+from collections import OrderedDict
+from typing import NamedTuple, Tuple
+
+from maze.algorithms.tiled import carve_cells, EAST, SOUTH
+
+
+class Chunk(NamedTuple):
+    """A carved chunk and the position of its doors.
+
+    Attributes:
+        cells: One wall nibble per cell, row-major.
+        door_east: Row of the door on the east side.
+        door_south: Column of the door on the south side.
+    """
+    cells: bytearray
+    door_east: int
+    door_south: int
+
+
+def chunks_for_window(width: int, height: int, chunk_size: int = 16) -> int:
+    """Returns how many chunks to keep for a window of blocks.
+
+    A window overlaps at most `ceil(blocks / (2 * chunk_size)) + 1` chunks
+    per side; one more ring keeps the chunks the player just left, so
+    moving never carves again a chunk that is still on screen.
+
+    Args:
+        width: Width of the window, in blocks.
+        height: Height of the window, in blocks.
+        chunk_size: Number of cells per chunk side.
+
+    Returns:
+        int: The `max_chunks` for a `ChunkedMaze` drawn in this window.
+    """
+    return ((math.ceil(width / (2 * chunk_size)) + 2)
+            * (math.ceil(height / (2 * chunk_size)) + 2))
+
+
+class ChunkedMaze():
+    """Endless maze addressed with global block coordinates.
+
+    Block coordinates follow the `MazeGenerator` convention: cell (i, j)
+    lives at block (2i + 1, 2j + 1) and walls sit on even coordinates.
+    Coordinates may be negative.
+
+    Attributes:
+        seed (str): Global seed of the maze.
+        chunk_size (int): Number of cells per chunk side.
+        max_chunks (int): Number of chunks kept in memory.
+        algorithm (str): Algorithm used to carve each chunk.
+    """
+
+    def __init__(self, seed: str | int, chunk_size: int = 16,
+                 max_chunks: int = 64, algorithm: str = "rb") -> None:
+        """Initializes an empty chunk cache.
+
+        Args:
+            seed: Global seed; chunks are derived from it.
+            chunk_size: Number of cells per chunk side.
+            max_chunks: Maximum number of chunks kept in memory. It must
+                        cover the window the maze is drawn in (see
+                        `chunks_for_window`), or every redraw carves the
+                        evicted chunks again.
+            algorithm: 'rb' or 'huntandkill'.
+        """
+        self.seed = str(seed)
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.algorithm = algorithm
+        self._chunks: OrderedDict[Tuple[int, int], Chunk] = OrderedDict()
+
+    def __len__(self) -> int:
+        """Returns the number of chunks currently in memory."""
+        return len(self._chunks)
+
+    def chunk(self, chunk_x: int, chunk_y: int) -> Chunk:
+        """Returns a chunk, carving it on first use.
+
+        The least recently used chunk is evicted once more than
+        `max_chunks` are in memory.
+
+        Args:
+            chunk_x: Chunk column.
+            chunk_y: Chunk row.
+
+        Returns:
+            Chunk: The carved chunk.
+        """
+        key = (chunk_x, chunk_y)
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+
+        size = self.chunk_size
+        rng = random.Random(f"{self.seed}/chunk/{chunk_x}/{chunk_y}")
+        chunk = Chunk(carve_cells(size, size, rng, self.algorithm),
+                      rng.randrange(size), rng.randrange(size))
+
+        self._chunks[key] = chunk
+        if len(self._chunks) > self.max_chunks:
+            self._chunks.popitem(last=False)
+        return chunk
+
+    def is_wall(self, x: int, y: int) -> bool:
+        """Tells if the block at global coordinates (x, y) is a wall.
+
+        Args:
+            x: Block X coordinate.
+            y: Block Y coordinate.
+
+        Returns:
+            bool: True for walls and wall corners, False for passages.
+        """
+        odd_x, odd_y = x % 2, y % 2
+        if odd_x and odd_y:
+            return False
+        if not odd_x and not odd_y:
+            return True
+
+        size = self.chunk_size
+        # West or north cell of the wall.
+        if odd_y:
+            cell_x, cell_y, bit = x // 2 - 1, y // 2, EAST
+        else:
+            cell_x, cell_y, bit = x // 2, y // 2 - 1, SOUTH
+
+        chunk = self.chunk(cell_x // size, cell_y // size)
+        local_x, local_y = cell_x % size, cell_y % size
+
+        if bit == EAST and local_x == size - 1:
+            return local_y != chunk.door_east
+        if bit == SOUTH and local_y == size - 1:
+            return local_x != chunk.door_south
+        return bool(chunk.cells[local_y * size + local_x] & bit)
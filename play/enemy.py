@@ -14,138 +14,290 @@
 
 This module defines the `Enemy` class, which manages the behavior of the
 hostile entity within the maze. It handles the initialization, spawning
-mechanics (ensuring distance from the player), and pathfinding logic
-to chase the player using Breadth-First Search (BFS).
+mechanics (as far as possible from the player and from each other), and
+pathfinding logic to chase the player. Enemies follow a `FlowField`: a
+distance map from the player shared by every enemy, so each of them only
+has to step to a neighbour closer to the player.
 """
 
-from typing import Dict, Tuple
+from array import array
+from typing import List, Tuple
 
 from maze import MazeGenerator
 from maze.maze_customization import MAZE
 
 
+def spawn_points(maze: MazeGenerator, count: int,
+                 spacing: int = 0) -> List[Tuple[int, int]]:
+    """Chooses where `count` enemies spawn.
+
+    A single BFS distance map rooted at the player (the maze entry) ranks
+    the walkable cells from the farthest to the closest. Cells are then
+    taken in that order, skipping those less than `spacing` steps away
+    from an enemy already placed; that exclusion is a BFS bounded to
+    `spacing - 1` steps around each new enemy. Both searches use the
+    distance buffer of the maze solver.
+
+    Args:
+        maze: The generated maze.
+        count: The number of enemies to place.
+        spacing: The minimum walking distance between two enemies.
+
+    Returns:
+        List[Tuple[int, int]]: The spawn cells, farthest first. Fewer than
+        `count` cells are returned if the maze is too small for them.
+    """
+    solver = maze.get_solver()
+    walkable = (MAZE.empty, MAZE.entry)
+    distances = solver.distance_map([(maze.entry_x, maze.entry_y)], walkable)
+    ranked = sorted((cell for cell in solver.reached() if distances[cell]),
+                    key=distances.__getitem__, reverse=True)
+
+    width: int = maze.width
+    taken = bytearray(len(distances))
+    points: List[Tuple[int, int]] = []
+    for cell in ranked:
+        if len(points) == count:
+            break
+        if taken[cell]:
+            continue
+        point = (cell % width, cell // width)
+        points.append(point)
+        if spacing > 1:
+            solver.distance_map([point], walkable, limit=spacing - 1)
+            for near in solver.reached():
+                taken[near] = 1
+    return points
+
+
+class FlowField():
+    """Breadth-First distance field rooted at the player.
+
+    Distances live in flat arrays indexed by `y * width + x`. When the
+    player moves, the field is reset in O(1) by bumping an epoch counter
+    instead of clearing the arrays, and the BFS is not run to completion:
+    its frontier is kept and only extended until the cells asked for are
+    reached. Enemies close to the player therefore cost little, and while
+    the player stands still the field is reused as is.
+
+    The field is restarted rather than repaired when the player moves:
+    the block grid is bipartite, so a step of the source to a neighbour
+    changes the distance of every reachable block by exactly one (one
+    closer on the side the player stepped to, one farther elsewhere). An
+    incremental repair would rewrite all of them, like a new BFS, plus
+    its own bookkeeping, while the restart costs O(1) and only expands
+    what the enemies ask for (`distance`) or a budget per tick
+    (`advance`).
+
+    Attributes:
+        maze (MazeGenerator): The maze the field is computed on.
+        source (Tuple[int, int] | None): The cell the field is rooted at.
+    """
+
+    def __init__(self, maze: MazeGenerator) -> None:
+        """Builds the walkable mask and the empty field buffers.
+
+        Args:
+            maze: The generated maze. Enemies walk on empty cells and on
+                  the player cell, never through the exit.
+        """
+        self.maze = maze
+        self.source: Tuple[int, int] | None = None
+        self._width: int = maze.width
+        size = maze.width * maze.height
+
+        self._walkable = bytearray(size)
+        for (x, y), cell in maze.maze.items():
+            if cell in (MAZE.empty, MAZE.entry):
+                self._walkable[y * self._width + x] = 1
+
+        self._dist: "array[int]" = array('i', [0]) * size
+        self._stamp: "array[int]" = array('I', [0]) * size
+        self._epoch = 0
+        self._queue: "array[int]" = array('i', [0]) * size
+        self._head = 0
+        self._tail = 0
+
+    def update(self, player_x: int, player_y: int) -> None:
+        """Moves the root of the field to the player position.
+
+        Args:
+            player_x: The current X-coordinate of the player.
+            player_y: The current Y-coordinate of the player.
+        """
+        if self.source == (player_x, player_y):
+            return
+        self.source = (player_x, player_y)
+
+        self._epoch += 1
+        start = player_y * self._width + player_x
+        self._dist[start] = 0
+        self._stamp[start] = self._epoch
+        self._queue[0] = start
+        self._head, self._tail = 0, 1
+
+    def distance(self, x: int, y: int) -> int:
+        """Returns the walking distance from (x, y) to the player.
+
+        Args:
+            x: The X-coordinate of the cell.
+            y: The Y-coordinate of the cell.
+
+        Returns:
+            int: The number of steps, or -1 if the cell cannot reach the
+            player.
+        """
+        target = y * self._width + x
+        self._expand(target, -1)
+        if self._stamp[target] != self._epoch:
+            return -1
+        return self._dist[target]
+
+    def reached(self, x: int, y: int) -> bool:
+        """Tells if the BFS already reached (x, y).
+
+        Args:
+            x: The X-coordinate of the cell.
+            y: The Y-coordinate of the cell.
+
+        Returns:
+            bool: True if the distance of (x, y) is known.
+        """
+        return self._stamp[y * self._width + x] == self._epoch
+
+    def advance(self, budget: int) -> bool:
+        """Extends the BFS by at most `budget` cells.
+
+        Lets a caller with a time budget (like the real-time game loop)
+        spread the computation of the field over several frames.
+
+        Args:
+            budget: The maximum number of cells to expand.
+
+        Returns:
+            bool: True if the field is complete.
+        """
+        self._expand(-1, budget)
+        return self._head >= self._tail
+
+    def _expand(self, target: int, budget: int) -> None:
+        """Runs the BFS until `target` is reached or `budget` is spent.
+
+        Args:
+            target: Flat index of the cell to reach, or -1 for none.
+            budget: Maximum number of cells to expand, or -1 for no limit.
+        """
+        width = self._width
+        dist, stamp, queue = self._dist, self._stamp, self._queue
+        walkable, epoch = self._walkable, self._epoch
+        head, tail = self._head, self._tail
+
+        while head < tail and budget != 0:
+            if target >= 0 and stamp[target] == epoch:
+                break
+            cell = queue[head]
+            head += 1
+            budget -= 1
+            for neighbour in (cell + width, cell + 1, cell - width,
+                              cell - 1):
+                if walkable[neighbour] and stamp[neighbour] != epoch:
+                    stamp[neighbour] = epoch
+                    dist[neighbour] = dist[cell] + 1
+                    queue[tail] = neighbour
+                    tail += 1
+
+        self._head, self._tail = head, tail
+
+    def next_step(self, x: int, y: int) -> Tuple[int, int]:
+        """Returns the neighbour of (x, y) one step closer to the player.
+
+        Args:
+            x: The X-coordinate of the enemy.
+            y: The Y-coordinate of the enemy.
+
+        Returns:
+            Tuple[int, int]: The next cell, or (x, y) itself if the enemy
+            is on the player or cannot reach it.
+        """
+        current = self.distance(x, y)
+        if current <= 0:
+            return x, y
+
+        # Every cell at distance current - 1 is already reached.
+        for move_x, move_y in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+            index = (y + move_y) * self._width + x + move_x
+            if (self._stamp[index] == self._epoch
+                    and self._dist[index] == current - 1):
+                return x + move_x, y + move_y
+        return x, y
+
+
 class Enemy():
     """
     Represents the hostile entity in the maze.
     """
 
-    def __init__(self, maze: MazeGenerator) -> None:
+    def __init__(self, maze: MazeGenerator,
+                 field: FlowField | None = None) -> None:
         """Initializes the enemy with a reference to the maze.
 
         Args:
             maze: The MazeGenerator instance containing the grid layout
                   and dimensions.
+            field: The `FlowField` to follow. Share one field between all
+                   enemies; a private one is created if omitted.
 
         Attributes:
             maze (MazeGenerator): Reference to the game maze grid and
                                   dimensions.
+            field (FlowField): Distance field from the player.
             display_enemy (str): The visual character representing the enemy.
             enemy_x (int): The current X-coordinate of the enemy.
             enemy_y (int): The current Y-coordinate of the enemy.
         """
         self.maze = maze
+        self.field = field if field is not None else FlowField(maze)
         self.display_enemy = "🦖"
         self.enemy_x = 0
         self.enemy_y = 0
 
-    def spawn(self) -> None:
+    def spawn(self, position: Tuple[int, int] | None = None) -> None:
         """Determines and sets the initial spawn location of the enemy.
 
-        Scans the maze starting from the bottom-right corner (near the exit)
-        to find the first valid empty cell. This ensures the enemy starts
-        as far away from the player as possible.
-        """
-        player_x, player_y = self.maze.entry_coord
-
-        target_x = self.maze.width - 2
-        target_y = self.maze.height - 2
-
-        target_x = max(1, target_x)
-        target_y = max(1, target_y)
+        Without an explicit position, the enemy spawns on the cell the
+        farthest from the player (see `spawn_points`).
 
-        search_queue = [(target_x, target_y)]
-        visited_coords = set()
-
-        while search_queue:
-            curr_x, curr_y = search_queue.pop(0)
-
-            if not (0 <= curr_x < self.maze.width and
-                    0 <= curr_y < self.maze.height):
-                continue
-
-            if (curr_x, curr_y) in visited_coords:
-                continue
-            visited_coords.add((curr_x, curr_y))
-
-            if self.maze.maze[(curr_y, curr_x)] == MAZE.empty:
-                if (curr_x, curr_y) != (player_x, player_y):
-                    self.enemy_x = curr_x
-                    self.enemy_y = curr_y
-                    break
-
-            neighbors = [
-                (curr_x - 1, curr_y),
-                (curr_x, curr_y - 1),
-                (curr_x + 1, curr_y),
-                (curr_x, curr_y + 1)
-            ]
-            search_queue.extend(neighbors)
-
-        if self.enemy_x is None:
-            print("Warning: No empty space found for enemy, defaulting to 1,1")
-            self.enemy_x, self.enemy_y = 1, 1
+        Args:
+            position: The (x, y) cell to spawn on, if already chosen.
+        """
+        if position is None:
+            points = spawn_points(self.maze, 1)
+            if not points:
+                print("Warning: No empty space found for enemy, "
+                      "defaulting to 1,1")
+                points = [(1, 1)]
+            position = points[0]
+        self.enemy_x, self.enemy_y = position
 
     def move(self, player_x: int, player_y: int) -> None:
         """Calculates and executes the next move towards the player.
 
-        Uses a Breadth-First Search (BFS) algorithm to find the shortest
-        path from the enemy's current position to the player's position.
-        The enemy moves one step along this path.
+        Roots the shared `FlowField` at the player (a no-op if another
+        enemy already did it this turn) and steps to the neighbour that is
+        one step closer to the player.
 
         Args:
             player_x: The current X-coordinate of the player.
             player_y: The current Y-coordinate of the player.
         """
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        start = (self.enemy_x, self.enemy_y)
-        end = (player_x, player_y)
-
-        visited = []
-        queue = []
-        path = []
-        came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        self.field.update(player_x, player_y)
+        self.step()
 
-        visited.append(start)
-        queue.append(start)
+    def step(self) -> None:
+        """Steps down the field as it is, without moving its root.
 
-        while len(queue) > 0:
-            cell = queue.pop(0)
-
-            if cell == end:
-                while cell != start:
-                    path.append(cell)
-                    cell = came_from[cell]
-                break
-
-            cell_x, cell_y = cell
-
-            for move_x, move_y in directions:
-                neighbour_x = cell_x + move_x
-                neighbour_y = cell_y + move_y
-                neighbour = (neighbour_x, neighbour_y)
-
-                if ((0 <= neighbour_x < self.maze.width and
-                     0 <= neighbour_y < self.maze.height) and
-                        neighbour not in visited and
-                        self.maze.maze[(neighbour_x, neighbour_y)] in
-                        (MAZE.empty, MAZE.entry)):
-
-                    queue.append(neighbour)
-                    came_from[neighbour_x, neighbour_y] = (cell_x, cell_y)
-                    visited.append(neighbour)
-
-        if len(path) > 0:
-            next_move = path[-1]
-            self.enemy_x, self.enemy_y = next_move
-        else:
-            pass
+        Used when the field is kept up to date by the caller (see the
+        real-time game loop).
+        """
+        self.enemy_x, self.enemy_y = self.field.next_step(
+            self.enemy_x, self.enemy_y)
@@ -0,0 +1,551 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  game.py                                           :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/19 10:31:02 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/19 10:31:02 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Real-time game loop of the 'Normal', 'Fog of war' and 'Hunted' modes.
+
+The game runs on an asyncio event loop with two coroutines. The
+simulation ticks at a fixed rate: it applies the last key read by the
+`KeyReader` and moves the enemies on their own timer, whether the player
+moves or not. The enemy flow field is rebuilt over several ticks so no
+tick runs a full BFS. Everything drawn during a tick is appended to a
+frame buffer, which the render coroutine flushes in a single write per
+tick.
+
+In Fog of War, a bitmap remembers the revealed blocks: only blocks seen
+for the first time are drawn, and the minimap and the explored ratio
+are updated from the same reveals.
+
+The hint key shows the next blocks of a shortest path to the exit. The
+path is found by A* on the cells of the maze, with a `LandmarkIndex`
+built on the first hint: each hint then costs a few hundred cells
+instead of a BFS of the whole maze.
+"""
+
+import asyncio
+import math
+import sys
+
+from typing import List, Tuple
+from colorama import Cursor
+
+from maze import LandmarkIndex, Maze, MazeGenerator
+from maze.maze_customization import MAZE, STYLE, COLORS, DISPLAY_MODE
+from enemy import Enemy, FlowField, spawn_points
+from key_reader import KeyReader, QUIT_KEY
+
+CURSOR_HIDE = "\033[?25l"
+CURSOR_SHOW = "\033[?25h"
+
+TICK_RATE = 30
+# Seconds between two steps of the enemies.
+ENEMY_STEP_DELAY = 0.25
+# Minimum walking distance between two enemies at spawn.
+ENEMY_SPACING = 10
+# Cells of the next enemy flow field computed per tick.
+FIELD_BUDGET = 4000
+
+MOVES = {'w': (0, -1), 's': (0, 1), 'a': (-1, 0), 'd': (1, 0)}
+HINT_KEY = 'h'
+# Blocks of the path to the exit shown by a hint.
+HINT_LENGTH = 8
+
+# How far (in blocks) the player sees along a straight corridor.
+FOW_RADIUS = 6
+FOW_AROUND = [(0, 0), (-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0),
+              (-1, 1), (0, 1), (1, 1)]
+# Maximum height of the Fog of War minimap, in characters.
+MINIMAP_ROWS = 16
+MINIMAP_EXPLORED = "▒"
+MINIMAP_PLAYER = "◆"
+
+
+def status_text(maze: MazeGenerator, steps: int, extra: str = "") -> str:
+    """Builds the status text shown below the maze.
+
+    The quit instruction and the current step count, centered
+    horizontally relative to the maze width and positioned on the line
+    immediately following the maze bottom margin.
+
+    Args:
+        maze: The `MazeGenerator` instance used to calculate positioning.
+        steps: The current number of steps taken by the player.
+        extra: Text appended to the status, like the explored ratio.
+
+    Returns:
+        str: The text, prefixed with its cursor position.
+    """
+    if steps > 0:
+        text_infos = (f"Move: 'WASD', Hint: 'H', Quit: 'E' | "
+                      f"Steps: {steps}{extra}")
+    else:
+        text_infos = (f"Move: 'WASD', Hint: 'H', Quit: 'E' | "
+                      f"Step: {steps}{extra}")
+    line_y = maze.height + maze.y_offset + 1
+
+    visual_width = maze.width // 2
+    padding = " " * max(0, (visual_width - len(text_infos)) // 2)
+
+    position: str = Cursor.POS(1, line_y)
+    return f"{position}{padding}{text_infos}{STYLE.reset}"
+
+
+class Game():
+    """A game session on a generated maze.
+
+    Attributes:
+        maze (MazeGenerator): The maze being played. The player is its
+            entry, moved as the player walks.
+        gamemode (str): "normal", "fow" (Fog of War) or "enemy".
+        player_x (int): The current X-coordinate of the player.
+        player_y (int): The current Y-coordinate of the player.
+        steps (int): Number of steps taken by the player.
+        enemies (List[Enemy]): The enemies of the "enemy" mode.
+        running (bool): False once the game is over.
+        keys (KeyReader): The keyboard reader.
+    """
+
+    def __init__(self, maze: MazeGenerator, gamemode: str,
+                 enemy_count: int = 1) -> None:
+        """Initializes the session and spawns the enemies.
+
+        Args:
+            maze: The generated maze, already rendered unless the mode is
+                  "fow".
+            gamemode: The active mode.
+            enemy_count: The number of enemies of the "enemy" mode.
+        """
+        self.maze = maze
+        self.gamemode = gamemode
+        self.player_x, self.player_y = maze.entry_x, maze.entry_y
+        self.steps = 0
+        self.enemies: List[Enemy] = []
+        self.running = True
+        self.keys = KeyReader()
+        self._frame: List[str] = []
+        self._field: FlowField | None = None
+        self._next_field: FlowField | None = None
+        self._building = False
+        # The cells as generated: the player marks the blocks they walk.
+        self._cells = Maze.from_generator(maze, maze.get_solver().path)
+        self._landmarks: LandmarkIndex | None = None
+        self._hint: List[Tuple[int, int]] = []
+
+        size = maze.width * maze.height
+        self._revealed = bytearray(size)
+        self._revealed_count = 0
+        self._minimap_scale = max(1, math.ceil(maze.height / MINIMAP_ROWS))
+        self._minimap_width = math.ceil(maze.width / self._minimap_scale)
+        self._minimap = bytearray(self._minimap_width * math.ceil(
+            maze.height / self._minimap_scale))
+
+        if gamemode == "enemy":
+            self._field = FlowField(maze)
+            self._next_field = FlowField(maze)
+            self._field.update(self.player_x, self.player_y)
+            for point in spawn_points(maze, enemy_count, ENEMY_SPACING):
+                enemy = Enemy(maze, self._field)
+                enemy.spawn(point)
+                self._field.distance(*point)
+                self.enemies.append(enemy)
+
+    def run(self) -> None:
+        """Plays until the player wins, loses or quits."""
+        self.keys.start()
+        try:
+            asyncio.run(self._main())
+        finally:
+            self.keys.stop()
+            sys.stdout.write(CURSOR_SHOW)
+            sys.stdout.flush()
+
+    async def _main(self) -> None:
+        """Draws the first frame and runs the simulation and renderer."""
+        frame_ready = asyncio.Event()
+
+        self.draw_raw(CURSOR_HIDE)
+        for enemy in self.enemies:
+            self.draw(enemy.enemy_x, enemy.enemy_y, enemy.display_enemy)
+        if self.gamemode == "fow":
+            self.reveal(self.player_x, self.player_y)
+            self.draw_player(self.player_x, self.player_y)
+            self.draw_exit(self.maze.exit_x, self.maze.exit_y)
+            self.draw_minimap_player(self.player_x, self.player_y)
+        self.draw_status()
+
+        await asyncio.gather(self._simulate(frame_ready),
+                             self._render(frame_ready))
+
+    async def _simulate(self, frame_ready: asyncio.Event) -> None:
+        """Runs the game logic at `TICK_RATE` ticks per second.
+
+        Args:
+            frame_ready: Set after each tick for the renderer.
+        """
+        loop = asyncio.get_running_loop()
+        tick = 1 / TICK_RATE
+        next_tick = loop.time()
+        next_enemy_step = next_tick + ENEMY_STEP_DELAY
+
+        while self.running:
+            key = self.keys.pop()
+            if key is not None:
+                self.handle_key(key)
+            self.refresh_field()
+
+            now = loop.time()
+            if self.running and self.enemies and now >= next_enemy_step:
+                self.move_enemies()
+                next_enemy_step = max(next_enemy_step + ENEMY_STEP_DELAY,
+                                      now)
+
+            frame_ready.set()
+            # Skip the ticks missed after a slow one instead of rushing.
+            next_tick = max(next_tick + tick, now)
+            await asyncio.sleep(next_tick - loop.time())
+        frame_ready.set()
+
+    async def _render(self, frame_ready: asyncio.Event) -> None:
+        """Flushes the frame buffer once per tick.
+
+        Args:
+            frame_ready: Set by the simulation when a tick is done.
+        """
+        while True:
+            await frame_ready.wait()
+            frame_ready.clear()
+            if self._frame:
+                sys.stdout.write("".join(self._frame))
+                sys.stdout.flush()
+                self._frame.clear()
+            if not self.running:
+                break
+
+    def draw(self, x: int, y: int, text: str) -> None:
+        """Queues `text` at the screen position of the maze block (x, y).
+
+        Args:
+            x: The X-coordinate of the block.
+            y: The Y-coordinate of the block.
+            text: What to print there.
+        """
+        self._frame.append(Cursor.POS((x * self.maze.step_x) + 1,
+                                      y + self.maze.y_offset) + text)
+
+    def draw_raw(self, text: str) -> None:
+        """Queues `text` as is in the frame buffer.
+
+        Args:
+            text: Escape codes or text already positioned.
+        """
+        self._frame.append(text)
+
+    def draw_player(self, x: int, y: int) -> None:
+        """Queues the player symbol at (x, y)."""
+        if self.maze.display == DISPLAY_MODE.emoji:
+            self.draw(x, y, f"{self.maze.visual_entry}{COLORS.reset}")
+        else:
+            self.draw(x, y, f"{COLORS.magenta}{self.maze.visual_wall}"
+                            f"{COLORS.reset}")
+
+    def draw_exit(self, x: int, y: int) -> None:
+        """Queues the exit symbol at (x, y)."""
+        if self.maze.display == DISPLAY_MODE.emoji:
+            self.draw(x, y, f"{self.maze.visual_exit}{COLORS.reset}")
+        else:
+            self.draw(x, y, f"{COLORS.red}{self.maze.visual_wall}"
+                            f"{COLORS.reset}")
+
+    def end(self, message: str) -> None:
+        """Stops the game and queues its final message.
+
+        Args:
+            message: The message shown below the status text.
+        """
+        self.draw_raw(Cursor.POS(1, self.maze.height + self.maze.y_offset
+                                 + 3) + f"{message}{COLORS.reset}\n")
+        self.running = False
+
+    def handle_key(self, key: str) -> None:
+        """Applies a key press: moves the player, shows a hint or quits.
+
+        Args:
+            key: The key read from the keyboard.
+        """
+        maze = self.maze
+        if key == QUIT_KEY:
+            self.end(f"{COLORS.red}Goodbye 👋")
+            return
+        if key == HINT_KEY:
+            self.show_hint()
+            return
+        if key not in MOVES:
+            return
+
+        old_x, old_y = self.player_x, self.player_y
+        new_x, new_y = old_x + MOVES[key][0], old_y + MOVES[key][1]
+
+        if maze.maze[(new_x, new_y)] in (MAZE.wall, MAZE.fortytwo):
+            return
+
+        maze.maze[(old_x, old_y)] = MAZE.empty
+        maze.maze[(new_x, new_y)] = MAZE.entry
+        self.player_x, self.player_y = new_x, new_y
+        maze.entry_x, maze.entry_y = new_x, new_y
+
+        self.clear_hint()
+        self.steps += 1
+        self.draw(old_x, old_y, f"{maze.visual_empty}{COLORS.reset}")
+        self.draw_player(new_x, new_y)
+
+        if self.gamemode == "fow":
+            self.reveal(new_x, new_y)
+            self.draw_minimap_player(new_x, new_y, old_x, old_y)
+        self.draw_status()
+
+        self.check_end()
+
+    def hint_blocks(self) -> List[Tuple[int, int]]:
+        """Returns the next blocks of a shortest path to the exit.
+
+        The player stands on a cell or on an open wall between two cells:
+        the path goes through whichever of them is closer to the exit.
+
+        Returns:
+            List[Tuple[int, int]]: Up to `HINT_LENGTH` blocks, from the one
+            next to the player.
+        """
+        if self._landmarks is None:
+            self._landmarks = LandmarkIndex(self._cells)
+        x, y = self.player_x, self.player_y
+        if x % 2 and y % 2:
+            sides = [(x, y)]
+        elif x % 2:
+            sides = [(x, y - 1), (x, y + 1)]
+        else:
+            sides = [(x - 1, y), (x + 1, y)]
+
+        best: Tuple[int, int, str] | None = None
+        for side_x, side_y in sides:
+            moves = self._landmarks.path(((side_x - 1) // 2,
+                                          (side_y - 1) // 2))
+            if moves is not None and (best is None
+                                      or len(moves) < len(best[2])):
+                best = (side_x, side_y, moves)
+        if best is None:
+            return []
+
+        block_x, block_y, moves = best
+        blocks = [] if (block_x, block_y) == (x, y) else [(block_x, block_y)]
+        for move in moves:
+            step_x, step_y = MOVES["wdsa"["NESW".index(move)]]
+            blocks.append((block_x + step_x, block_y + step_y))
+            block_x, block_y = block_x + 2 * step_x, block_y + 2 * step_y
+            blocks.append((block_x, block_y))
+            if len(blocks) >= HINT_LENGTH:
+                break
+        return blocks[:HINT_LENGTH]
+
+    def show_hint(self) -> None:
+        """Draws the next blocks of a shortest path to the exit, until the
+        player moves."""
+        maze = self.maze
+        self.clear_hint()
+        exit_block = (maze.exit_x, maze.exit_y)
+        self._hint = [block for block in self.hint_blocks()
+                      if block != exit_block]
+        for x, y in self._hint:
+            if maze.display == DISPLAY_MODE.emoji:
+                self.draw(x, y, f"{maze.visual_path}{COLORS.reset}")
+            else:
+                self.draw(x, y, f"{maze.color_path}{maze.visual_wall}"
+                                f"{COLORS.reset}")
+
+    def clear_hint(self) -> None:
+        """Erases the blocks of the last hint still on screen."""
+        occupied = {(enemy.enemy_x, enemy.enemy_y) for enemy in self.enemies}
+        occupied.add((self.player_x, self.player_y))
+        for x, y in self._hint:
+            if (x, y) not in occupied:
+                self.draw(x, y, f"{self.maze.visual_empty}{COLORS.reset}")
+        self._hint = []
+
+    def move_enemies(self) -> None:
+        """Moves every enemy one step towards the player."""
+        for enemy in self.enemies:
+            if (enemy.enemy_x == self.maze.exit_x and
+                    enemy.enemy_y == self.maze.exit_y):
+                self.draw_exit(enemy.enemy_x, enemy.enemy_y)
+            else:
+                self.draw(enemy.enemy_x, enemy.enemy_y,
+                          f"{self.maze.visual_empty}{COLORS.reset}")
+
+        for enemy in self.enemies:
+            enemy.step()
+            self.draw(enemy.enemy_x, enemy.enemy_y, enemy.display_enemy)
+
+        self.check_end()
+
+    def refresh_field(self) -> None:
+        """Builds the flow field of the player position, a slice per tick.
+
+        A full BFS of a large maze takes longer than a tick. The enemies
+        keep following the last complete field while the next one, rooted
+        at where the player is now, is extended by `FIELD_BUDGET` cells
+        per tick. It replaces the current one once it reaches every enemy,
+        so the enemies chase a position at most a few ticks old.
+        """
+        if self._field is None or self._next_field is None:
+            return
+
+        player = (self.player_x, self.player_y)
+        if not self._building:
+            if self._field.source == player:
+                return
+            self._next_field.update(*player)
+            self._building = True
+
+        building = self._next_field
+        done = building.advance(FIELD_BUDGET)
+        if done or all(building.reached(enemy.enemy_x, enemy.enemy_y)
+                       for enemy in self.enemies):
+            self._field, self._next_field = building, self._field
+            for enemy in self.enemies:
+                enemy.field = building
+            self._building = False
+
+    def check_end(self) -> None:
+        """Ends the game if an enemy caught the player or if they won."""
+        player = (self.player_x, self.player_y)
+
+        if any((enemy.enemy_x, enemy.enemy_y) == player
+               for enemy in self.enemies):
+            self.end(f"{COLORS.red}Fail! The dino ate you.")
+
+        elif player == (self.maze.exit_x, self.maze.exit_y):
+            # The solution found at generation time, no need to solve again.
+            shortest = len(self.maze.get_solver().path) // 2
+            self.end(f"{COLORS.lightgreen}🎆🎆 GG! 🎆🎆 Steps: {self.steps} | "
+                     f"Shortest path: {shortest}")
+
+    def draw_status(self) -> None:
+        """Queues the status text, with the explored ratio in Fog of War."""
+        extra = ""
+        if self.gamemode == "fow":
+            explored = 100 * self._revealed_count // len(self._revealed)
+            extra = f" | Explored: {explored}%"
+        self.draw_raw(status_text(self.maze, self.steps, extra))
+
+    def reveal(self, pos_x: int, pos_y: int) -> None:
+        """Reveals what the player sees from (pos_x, pos_y) (Fog of War).
+
+        The player sees their block, the blocks around them and, in each
+        direction, along the corridor until a wall or `FOW_RADIUS` blocks,
+        with the walls (and openings) on both sides of it. Blocks already
+        revealed are skipped, so walking along a known corridor draws
+        nothing.
+
+        Args:
+            pos_x: The X-coordinate of the player.
+            pos_y: The Y-coordinate of the player.
+        """
+        maze = self.maze.maze
+        for dir_x, dir_y in FOW_AROUND:
+            self._reveal_block(pos_x + dir_x, pos_y + dir_y)
+
+        for dir_x, dir_y in MOVES.values():
+            x, y = pos_x, pos_y
+            for _ in range(FOW_RADIUS):
+                x, y = x + dir_x, y + dir_y
+                cell = maze.get((x, y))
+                if cell is None:
+                    break
+                self._reveal_block(x, y)
+                if cell in (MAZE.wall, MAZE.fortytwo):
+                    break
+                self._reveal_block(x + dir_y, y + dir_x)
+                self._reveal_block(x - dir_y, y - dir_x)
+
+    def _reveal_block(self, x: int, y: int) -> None:
+        """Marks (x, y) as revealed and draws it if it was not yet.
+
+        Args:
+            x: The X-coordinate of the block.
+            y: The Y-coordinate of the block.
+        """
+        maze = self.maze
+        if not (0 <= x < maze.width and 0 <= y < maze.height):
+            return
+        index = y * maze.width + x
+        if self._revealed[index]:
+            return
+        self._revealed[index] = 1
+        self._revealed_count += 1
+
+        scale = self._minimap_scale
+        mini = (y // scale) * self._minimap_width + x // scale
+        if not self._minimap[mini]:
+            self._minimap[mini] = 1
+            self.draw_minimap(x // scale, y // scale, MINIMAP_EXPLORED)
+
+        cell = maze.maze[(x, y)]
+        if cell not in (MAZE.wall, MAZE.fortytwo, MAZE.exit):
+            return
+        # Like `MazeGenerator.print_maze`: the '42' and exit emojis only
+        # exist in emoji mode, ascii colours the wall glyph instead.
+        if maze.display != DISPLAY_MODE.emoji:
+            if cell == MAZE.wall:
+                color = maze.color_wall
+            elif cell == MAZE.fortytwo:
+                color = maze.color_ft
+            else:
+                color = maze.color_exit
+            self.draw(x, y, f"{color}{maze.visual_wall}{COLORS.reset}")
+            return
+
+        if cell == MAZE.wall:
+            symbol = f"{maze.visual_wall}"
+        elif cell == MAZE.fortytwo:
+            symbol = f"{maze.visual_ft}"
+        else:
+            symbol = f"{maze.visual_exit}"
+        self.draw(x, y, f"{symbol}{COLORS.reset}")
+
+    def draw_minimap(self, mini_x: int, mini_y: int, symbol: str) -> None:
+        """Queues a character of the minimap, drawn right of the maze.
+
+        Args:
+            mini_x: The minimap column.
+            mini_y: The minimap row.
+            symbol: The character to draw.
+        """
+        column = self.maze.width * self.maze.step_x + 3
+        self.draw_raw(Cursor.POS(column + mini_x,
+                                 self.maze.y_offset + mini_y)
+                      + f"{COLORS.lightcyan}{symbol}{COLORS.reset}")
+
+    def draw_minimap_player(self, x: int, y: int, old_x: int = -1,
+                            old_y: int = -1) -> None:
+        """Moves the player marker of the minimap.
+
+        Args:
+            x: The X-coordinate of the player.
+            y: The Y-coordinate of the player.
+            old_x: The previous X-coordinate of the player, if any.
+            old_y: The previous Y-coordinate of the player, if any.
+        """
+        scale = self._minimap_scale
+        if (old_x // scale, old_y // scale) == (x // scale, y // scale):
+            return
+        if old_x >= 0:
+            self.draw_minimap(old_x // scale, old_y // scale,
+                              MINIMAP_EXPLORED)
+        self.draw_minimap(x // scale, y // scale, MINIMAP_PLAYER)
@@ -0,0 +1,100 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  key_reader.py                                     :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/19 10:12:44 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/19 10:12:44 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Non-blocking keyboard input for the real-time game loop.
+
+`readchar.readkey()` blocks until a key is pressed, which would freeze
+the game loop. The `KeyReader` calls it from a background thread and keeps
+only the last key pressed: a key held down sends many repeats, and
+queueing them would make the player keep moving after the key is
+released.
+"""
+
+import sys
+import threading
+
+from typing import Any, List
+
+import readchar
+
+QUIT_KEY = 'e'
+
+
+class KeyReader():
+    """Reads the keyboard in a background thread.
+
+    Attributes:
+        saved_terminal (List[Any] | None): Terminal settings restored by
+            `stop`, on terminals that have them.
+    """
+
+    def __init__(self) -> None:
+        """Initializes a stopped reader with an empty key slot."""
+        self.saved_terminal: List[Any] | None = None
+        self._key: str | None = None
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._read_keys, daemon=True)
+
+    def start(self) -> None:
+        """Turns the terminal echo off and starts reading keys.
+
+        `readchar` restores the terminal settings it found after each key,
+        so with the echo off for the whole game, keys pressed between two
+        reads are not printed over the maze.
+        """
+        if sys.platform != "win32" and sys.stdin.isatty():
+            import termios
+
+            fd = sys.stdin.fileno()
+            self.saved_terminal = termios.tcgetattr(fd)
+            quiet = termios.tcgetattr(fd)
+            quiet[3] &= ~termios.ECHO
+            termios.tcsetattr(fd, termios.TCSADRAIN, quiet)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Restores the terminal settings saved by `start`.
+
+        The reading thread is a daemon blocked on the keyboard: it is not
+        joined and ends with the program.
+        """
+        if self.saved_terminal is not None:
+            import termios
+
+            termios.tcsetattr(sys.stdin.fileno(), termios.TCSADRAIN,
+                              self.saved_terminal)
+            self.saved_terminal = None
+
+    def pop(self) -> str | None:
+        """Returns the last key pressed since the previous call, if any.
+
+        Returns:
+            str | None: The key, or None if no key was pressed.
+        """
+        with self._lock:
+            key, self._key = self._key, None
+        return key
+
+    def _read_keys(self) -> None:
+        """Thread body: stores each key read, replacing the previous one.
+
+        A pending quit is never replaced, and Ctrl+C is turned into a
+        quit so the game loop can restore the terminal.
+        """
+        while True:
+            try:
+                key = readchar.readkey()
+            except KeyboardInterrupt:
+                key = QUIT_KEY
+            with self._lock:
+                if self._key != QUIT_KEY:
+                    self._key = key
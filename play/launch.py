@@ -15,22 +15,29 @@
 This module serves as the entry point for the "play" mode. It initializes
 the game environment based on a configuration file, prompts the user to
 select a play mode, and enters the main interactive loop where keyboard inputs
-control the character.
+control the character. The 'Endless' mode walks an infinite maze generated
+chunk by chunk instead of the configured one.
+
+A maze of an archive (see `maze_archive`) can be played instead of a
+generated one: `python3 play/launch.py batch.mza 3` plays maze #3 of
+`batch.mza` (the first one if no number is given).
 """
 
 import sys
 import readchar
 
+from typing import List, Tuple
+
 from time import sleep
 from colorama import Cursor
 
-from maze import (MazeConfig, MazeGenerator, MazeConfigError,
-                  MazeGenerationError)
-from maze.maze_customization import (MAZE, STYLE, COLORS, ANIM, DISPLAY_MODE)
-from enemy import Enemy
+from maze import Maze, MazeConfig, MazeGenerator
+from maze.maze_errors import MazeError
+from maze.maze_customization import (STYLE, COLORS, ANIM, DISPLAY_MODE)
+from chunks import ChunkedMaze, chunks_for_window
+from game import Game, CURSOR_HIDE, CURSOR_SHOW, status_text
 
-CURSOR_HIDE = "\033[?25l"
-CURSOR_SHOW = "\033[?25h"
+MAX_ENEMIES = 9
 
 
 def launch_game() -> None:
@@ -38,7 +45,8 @@ def launch_game() -> None:
 
     Attempts to load the configuration from 'play/config.txt'. If successful,
     it prompts the user to choose the game mode, generates the maze
-    accordingly, and passes control to the `play` loop.
+    accordingly, and passes control to the `play` loop. If an archive is
+    given on the command line, its maze is played instead of a new one.
 
     Catches and logs configuration or generation errors to stderr to ensure
     a clean exit on failure.
@@ -46,19 +54,25 @@ def launch_game() -> None:
     try:
         maze_configuration = MazeConfig.from_config_file("play/config.txt")
 
-        maze = MazeGenerator(maze_configuration)
+        archive = archive_argument(sys.argv[1:])
+        if archive is not None:
+            maze = MazeGenerator.from_result(Maze.load(*archive),
+                                             maze_configuration)
+        else:
+            maze = MazeGenerator(maze_configuration)
 
         print(f"{COLORS.magenta}{STYLE.bright}\nChoose gamemode:")
         print(f"{COLORS.lightcyan}1. Normal")
         print(f"{COLORS.lightcyan}2. Fog of war")
-        print(f"{COLORS.lightcyan}3. Hunted{STYLE.reset}")
+        print(f"{COLORS.lightcyan}3. Hunted")
+        print(f"{COLORS.lightcyan}4. Endless{STYLE.reset}")
 
         while True:
-            user_choice = input(f"{COLORS.lightgreen}Choice (1-3): "
+            user_choice = input(f"{COLORS.lightgreen}Choice (1-4): "
                                 f"{COLORS.reset}")
             try:
                 choice = int(user_choice)
-                if 1 <= choice <= 3:
+                if 1 <= choice <= 4:
                     break
                 else:
                     raise ValueError
@@ -78,25 +92,77 @@ def launch_game() -> None:
             sleep(1)
             print(ANIM.clear_screen, end="")
             maze.maze_generator(rendering=False)
-        else:
+        elif choice == 3:
             gamemode = "enemy"
+            enemy_count = ask_enemy_count()
             print(f"{COLORS.green}✅ Launching 'hunted play mode'\n")
             sleep(1)
             print(ANIM.clear_screen, end="")
             maze.maze_generator(rendering=True)
+        else:
+            print(f"{COLORS.green}✅ Launching 'endless play mode'\n")
+            sleep(1)
+            with maze:
+                play_endless(maze)
+            return
 
-    except (FileNotFoundError, ValueError, MazeConfigError,
-            MazeGenerationError) as e:
+    except (FileNotFoundError, ValueError, IndexError, MazeError) as e:
         print(f"{type(e).__name__}: {e}", file=sys.stderr)
+        return
+
+    with maze:
+        play(maze, gamemode, enemy_count if gamemode == "enemy" else 0)
+
 
-    play(maze, gamemode)
+def archive_argument(args: List[str]) -> Tuple[str, int] | None:
+    """Finds the archive to play in the command line arguments.
+
+    Args:
+        args: The arguments, without the script name.
+
+    Returns:
+        Tuple[str, int] | None: The `.mza` archive and the position of the
+        maze in it, or None to generate a new maze.
+
+    Raises:
+        ValueError: If the position is not a number.
+    """
+    for i, arg in enumerate(args):
+        if arg.endswith(".mza"):
+            index = int(args[i + 1]) if i + 1 < len(args) else 0
+            return arg, index
+    return None
+
+
+def ask_enemy_count() -> int:
+    """Prompts the user for the number of enemies of the 'Hunted' mode.
+
+    Returns:
+        int: A number of enemies between 1 and `MAX_ENEMIES`.
+    """
+    while True:
+        user_choice = input(f"{COLORS.lightgreen}Number of enemies "
+                            f"(1-{MAX_ENEMIES}): {COLORS.reset}")
+        try:
+            count = int(user_choice)
+            if 1 <= count <= MAX_ENEMIES:
+                return count
+            else:
+                raise ValueError
+        except ValueError:
+            print(f"{COLORS.red}❌ Error!{COLORS.reset}", end="",
+                  flush=True)
+            print(Cursor.UP(1) + "\r" + ANIM.clear, end="")
 
 
-def play(maze: "MazeGenerator", gamemode: str) -> None:
+def play(maze: "MazeGenerator", gamemode: str,
+         enemy_count: int = 1) -> None:
     """Executes the main interactive game loop.
 
     Captures keyboard input (WASD) to move the player, performs collision
     detection against walls and obstacles, and updates the terminal display.
+    The loop runs in real time (see `Game`): enemies keep moving while the
+    player stands still.
 
     Args:
         maze: The `MazeGenerator` instance containing the grid and
@@ -104,181 +170,87 @@ def play(maze: "MazeGenerator", gamemode: str) -> None:
         gamemode: A string indicating the active mode.
                   If "fow" (Fog of War) is selected, only the surrounding of
                   the player is rendered as he walk throught.
+        enemy_count: The number of enemies of the "enemy" mode. They
+                     spawn far from the player and from each other.
     """
-    print(CURSOR_HIDE, end="", flush=True)
-    player_pos = [maze.entry_x, maze.entry_y]
-    exit_pos = [maze.exit_x, maze.exit_y]
+    Game(maze, gamemode, enemy_count).run()
+
+
+def play_endless(maze: "MazeGenerator") -> None:
+    """Executes the game loop of the 'Endless' mode.
+
+    The player walks through an infinite `ChunkedMaze` seeded with the
+    maze seed. The screen is a fixed window (the size of the configured
+    maze) centered on the player, redrawn in a single write per move, so
+    the cost of a step does not depend on how far the player went.
+
+    Args:
+        maze: The `MazeGenerator` instance providing the seed, the window
+              size and the visuals. Its grid is not used.
+    """
+    world = ChunkedMaze(maze.seed, algorithm=maze.algorithm,
+                        max_chunks=chunks_for_window(maze.width,
+                                                     maze.height))
+    maze.y_offset = 1
+    player_x, player_y = 1, 1
     steps = 0
-    obs_to_render = [
-                    (-2, -1), (-1, -1), (0, -1), (1, -1), (2, -1),
-                    (-2, 0),  (-1, 0), (1, 0),  (2, 0),
-                    (-2, 1),  (-1, 1),  (0, 1),  (1, 1),  (2, 1)
-                    ]
-
-    if gamemode == "enemy":
-        enemy = Enemy(maze)
-        enemy.spawn()
-        print(Cursor.POS((enemy.enemy_x * maze.step_x) + 1,
-              enemy.enemy_y + maze.y_offset) + f"{enemy.display_enemy}",
-              end="", flush=True)
-
-    display_text(maze, steps)
-
-    def render_fow(pos_x: int, pos_y: int) -> None:
-        """Renders the visible area around the player (Fog of War)."""
-        for dir_x, dir_y in obs_to_render:
-            x, y = (pos_x + dir_x), (pos_y + dir_y)
-
-            if (x, y) in maze.maze:
-                curs_x = (x * maze.step_x) + 1
-                curs_y = y + maze.y_offset
-
-                if maze.display == DISPLAY_MODE.emoji:
-                    if maze.maze[(x, y)] == MAZE.wall:
-                        print(Cursor.POS(curs_x, curs_y) +
-                              f"{maze.visual_wall}{COLORS.reset}", end="",
-                              flush=True)
-                    elif maze.maze[(x, y)] == MAZE.fortytwo:
-                        print(Cursor.POS(curs_x, curs_y) +
-                              f"{maze.visual_ft}{COLORS.reset}", end="",
-                              flush=True)
-                    elif maze.maze[(x, y)] == MAZE.exit:
-                        print(Cursor.POS(curs_x, curs_y) +
-                              f"{maze.visual_exit}{COLORS.reset}", end="",
-                              flush=True)
+
+    if maze.display == DISPLAY_MODE.emoji:
+        wall = f"{maze.visual_wall}"
+        player = f"{maze.visual_entry}"
+    else:
+        wall = f"{maze.color_wall}{maze.visual_wall}{COLORS.reset}"
+        player = f"{COLORS.magenta}{maze.visual_wall}{COLORS.reset}"
+    empty = f"{maze.visual_empty}"
+
+    def render() -> None:
+        """Draws the window centered on the player in one write."""
+        left = player_x - maze.width // 2
+        top = player_y - maze.height // 2
+        rows = []
+        for y in range(top, top + maze.height):
+            row = []
+            for x in range(left, left + maze.width):
+                if (x, y) == (player_x, player_y):
+                    row.append(player)
+                elif world.is_wall(x, y):
+                    row.append(wall)
                 else:
-                    if maze.maze[(x, y)] == MAZE.wall:
-                        print(Cursor.POS(curs_x, curs_y) +
-                              f"{maze.color_wall}{maze.visual_wall}"
-                              f"{COLORS.reset}", end="", flush=True)
-                    elif maze.maze[(x, y)] == MAZE.fortytwo:
-                        print(Cursor.POS(curs_x, curs_y) +
-                              f"{maze.color_ft}{maze.visual_wall}"
-                              f"{COLORS.reset}", end="", flush=True)
-                    elif maze.maze[(x, y)] == MAZE.exit:
-                        print(Cursor.POS(curs_x, curs_y) +
-                              f"{maze.color_exit}{maze.visual_wall}"
-                              f"{COLORS.reset}", end="", flush=True)
-
-    if gamemode == "fow":
-        render_fow(player_pos[0], player_pos[1])
-
-        px_screen_entry = (player_pos[0] * maze.step_x) + 1
-        py_screen_entry = player_pos[1] + maze.y_offset
-        px_screen_exit = (exit_pos[0] * maze.step_x) + 1
-        py_screen_exit = exit_pos[1] + maze.y_offset
-        if maze.display == DISPLAY_MODE.emoji:
-            print(Cursor.POS(px_screen_entry, py_screen_entry) +
-                  f"{maze.visual_entry}", end="", flush=True)
-            print(Cursor.POS(px_screen_exit, py_screen_exit) +
-                  f"{maze.visual_exit}", end="", flush=True)
-        else:
-            print(Cursor.POS(px_screen_entry, py_screen_entry) +
-                  f"{COLORS.magenta}{maze.visual_wall}{COLORS.reset}",
-                  end="", flush=True)
-            print(Cursor.POS(px_screen_exit, py_screen_exit) +
-                  f"{COLORS.red}{maze.visual_wall}{COLORS.reset}",
-                  end="", flush=True)
+                    row.append(empty)
+            rows.append("".join(row))
+        print(Cursor.POS(1, maze.y_offset) + "\n".join(rows), end="",
+              flush=True)
+        display_text(maze, steps)
 
-    while True:
-        old_x, old_y = player_pos[0], player_pos[1]
-        new_x, new_y = old_x, old_y
+    print(ANIM.clear_screen + CURSOR_HIDE, end="", flush=True)
+    render()
 
+    while True:
+        new_x, new_y = player_x, player_y
         k = readchar.readkey()
 
         if k == 'w':
-            new_y = old_y - 1
+            new_y -= 1
         elif k == 's':
-            new_y = old_y + 1
+            new_y += 1
         elif k == 'a':
-            new_x = old_x - 1
+            new_x -= 1
         elif k == 'd':
-            new_x = old_x + 1
+            new_x += 1
         elif k == 'e':
             print(Cursor.POS(1, maze.height + maze.y_offset + 3) +
-                  f"{COLORS.red}Goodbye 👋{COLORS.reset}")
+                  f"{COLORS.red}Goodbye 👋 Distance from start: "
+                  f"{abs(player_x - 1) // 2 + abs(player_y - 1) // 2}"
+                  f"{COLORS.reset}")
             print(CURSOR_SHOW, end="", flush=True)
             break
 
-        if (new_x, new_y) != (old_x, old_y):
-            if maze.maze[(new_x, new_y)] in (MAZE.wall, MAZE.fortytwo):
-                new_x, new_y = old_x, old_y
-                if gamemode == "fow":
-                    render_fow(old_x, old_y)
+        if (new_x, new_y) != (player_x, player_y):
+            if world.is_wall(new_x, new_y):
                 continue
-
-            else:
-                maze.maze[(old_x, old_y)] = MAZE.empty
-                player_pos[0], player_pos[1] = new_x, new_y
-                maze.maze[(new_x, new_y)] = MAZE.entry
-                maze.entry_x, maze.entry_y = new_x, new_y
-
-                steps += 1
-                display_text(maze, steps)
-
-                curs_old_x = (old_x * maze.step_x) + 1
-                curs_old_y = old_y + maze.y_offset
-                curs_new_x = (new_x * maze.step_x) + 1
-                curs_new_y = new_y + maze.y_offset
-
-                if maze.display == DISPLAY_MODE.emoji:
-                    print(Cursor.POS(curs_old_x, curs_old_y) +
-                          f"{maze.visual_empty}{COLORS.reset}", end="",
-                          flush=True)
-                    print(Cursor.POS(curs_new_x, curs_new_y) +
-                          f"{maze.visual_entry}{COLORS.reset}", end="",
-                          flush=True)
-
-                if maze.display in (DISPLAY_MODE.ascii, DISPLAY_MODE.simple):
-                    print(Cursor.POS(curs_old_x, curs_old_y) +
-                          f"{maze.visual_empty}{COLORS.reset}", end="",
-                          flush=True)
-                    print(Cursor.POS(curs_new_x, curs_new_y) +
-                          f"{COLORS.magenta}{maze.visual_wall}{COLORS.reset}",
-                          end="", flush=True)
-
-                if gamemode == "fow":
-                    render_fow(old_x, old_y)
-
-                if gamemode == "enemy":
-                    if (enemy.enemy_x == maze.exit_x and
-                            enemy.enemy_y == maze.exit_y):
-                        old_enemy_x = enemy.enemy_x
-                        old_enemy_y = enemy.enemy_y
-                        if maze.display == DISPLAY_MODE.emoji:
-                            print(Cursor.POS((old_enemy_x * maze.step_x) + 1,
-                                  old_enemy_y + maze.y_offset) +
-                                  f"{maze.visual_exit}{COLORS.reset}", end="",
-                                  flush=True)
-                        else:
-                            print(Cursor.POS((old_enemy_x * maze.step_x) + 1,
-                                  old_enemy_y + maze.y_offset) +
-                                  f"{COLORS.red}{maze.visual_wall}"
-                                  f"{COLORS.reset}", end="", flush=True)
-                    else:
-                        print(Cursor.POS((enemy.enemy_x * maze.step_x) + 1,
-                              enemy.enemy_y + maze.y_offset) +
-                              f"{maze.visual_empty}{COLORS.reset}",
-                              end="", flush=True)
-
-                    enemy.move(new_x, new_y)
-
-                    print(Cursor.POS((enemy.enemy_x * maze.step_x) + 1,
-                          enemy.enemy_y + maze.y_offset) +
-                          f"{enemy.display_enemy}", end="", flush=True)
-
-        if gamemode == "enemy":
-            if (new_x == enemy.enemy_x and new_y == enemy.enemy_y):
-                print(Cursor.POS(1, maze.height + maze.y_offset + 3) +
-                      f"{COLORS.red}Fail! The dino ate you.{COLORS.reset}")
-                print(CURSOR_SHOW, end="", flush=True)
-                break
-
-        if (new_x == maze.exit_x and new_y == maze.exit_y):
-            print(Cursor.POS(1, maze.height + maze.y_offset + 3) +
-                  f"{COLORS.lightgreen}🎆🎆 GG! 🎆🎆{COLORS.reset}")
-            print(CURSOR_SHOW, end="", flush=True)
-            break
+            player_x, player_y = new_x, new_y
+            steps += 1
+            render()
 
 
 def display_text(maze: "MazeGenerator", steps: int) -> None:
@@ -292,17 +264,7 @@ def display_text(maze: "MazeGenerator", steps: int) -> None:
         maze: The `MazeGenerator` instance used to calculate positioning.
         steps: The current number of steps taken by the player.
     """
-    if steps > 0:
-        text_infos = f"Move: 'WASD', Quit: 'E' | Steps: {steps}"
-    else:
-        text_infos = f"Move: 'WASD', Quit: 'E' | Step: {steps}"
-    line_y = maze.height + maze.y_offset + 1
-
-    visual_width = maze.width // 2
-    padding = " " * max(0, (visual_width - len(text_infos)) // 2)
-
-    print(Cursor.POS(1, line_y) + f"{padding}{text_infos}{STYLE.reset}",
-          end="", flush=True)
+    print(status_text(maze, steps), end="", flush=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,763 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_service.py                                   :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/25 09:48:03 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/25 09:48:03 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Local maze generation service.
+
+A long-running HTTP server, on the loopback interface or on a Unix socket
+only, so tools can generate mazes without running `a_maze_ing.py` and
+reading its output file:
+
+    POST /maze     The body is a JSON object with the keys of the
+                   configuration file (`output_file` is optional and not
+                   used). The maze is streamed back in the text format
+                   (`text/plain`), or in the binary format with
+                   `?format=mzb` or `Accept: application/octet-stream`.
+                   `grid_file` is refused.
+    POST /path     The same body with a `seed`, plus optional `from` and
+                   `to` cells (`[x, y]`, the entry and the exit by
+                   default). Answers a shortest path between them as JSON:
+                   `{"distance": 12, "moves": "EESW..."}` (-1 and null if
+                   there is none). Each worker keeps the `LandmarkIndex`
+                   of its last `INDEX_CACHE` mazes, so the queries on a
+                   maze only pay for its generation once.
+    GET /health    The state of the service, as JSON.
+
+The mazes are generated by a pool of worker processes that imported the
+generator and ran a first generation at start up, so no request pays for
+the imports. Identical requests (same spec and seed) in progress at the
+same time share one generation, and each worker keeps the results of its
+last `MAZE_CACHE` mazes with a seed in a `MazeCache`. At most `--queue`
+generations can wait for a worker: above that, requests get a 503 with
+`Retry-After`, instead of piling up.
+
+Every maze response has timing headers: `X-Queue-Ms` (waiting for a
+worker), `X-Generate-Ms` (in the worker), `X-Total-Ms` (up to the
+headers), also given as `Server-Timing`, and `X-Coalesced: 1` when the
+maze came from another request's generation.
+
+A request can be given a deadline, in milliseconds from its arrival, with
+the `X-Deadline-Ms` header; `--deadline` sets the default one and its
+maximum. A maze not generated in time is cancelled in its worker (see
+`MazeProgress`), which is freed at once, and the answer is a 504.
+
+Usage: PYTHONPATH=src python3 service/maze_service.py [--port N]
+       [--unix PATH] [--workers N] [--queue N] [--deadline SECONDS]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, NamedTuple, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from maze.maze_batch import MazeSpec
+from maze.maze_errors import (MazeConfigError, MazeError,
+                              MazeGenerationCancelled)
+from maze.maze_rules import CONFIG_KEYS
+
+LOOPBACK_HOSTS = ("127.0.0.1", "::1", "localhost")
+DEFAULT_PORT = 4242
+MAX_BODY = 64 * 1024
+MAX_HEADERS = 100
+STREAM_CHUNK = 1 << 16
+# Generation results kept by each worker, for the requests with a seed.
+MAZE_CACHE = 64
+# Landmark indexes kept by each worker, for the path queries.
+INDEX_CACHE = 8
+# Configuration keys naming files on the machine running the generation:
+# a client must not choose them.
+_LOCAL_KEYS = ("grid_file",)
+Cell = Tuple[int, int]
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found",
+            405: "Method Not Allowed", 413: "Payload Too Large",
+            500: "Internal Server Error", 503: "Service Unavailable",
+            504: "Gateway Timeout"}
+
+
+class HttpError(Exception):
+    """An error answered to the client with its status code."""
+
+    def __init__(self, status: int, message: str) -> None:
+        """Initializes the error.
+
+        Args:
+            status: The HTTP status code.
+            message: The reason, sent as the body.
+        """
+        super().__init__(message)
+        self.status = status
+
+
+class Generated(NamedTuple):
+    """A maze generated by a worker.
+
+    Attributes:
+        payload (bytes): The maze, in the requested format.
+        seed (str): The seed it was generated with.
+        generate_time (float): Time spent in the worker, in seconds.
+    """
+    payload: bytes
+    seed: str
+    generate_time: float
+
+
+class Routed(NamedTuple):
+    """A path found by a worker.
+
+    Attributes:
+        moves (str | None): The moves, or None if there is no path.
+        route_time (float): Time spent in the worker, in seconds.
+    """
+    moves: str | None
+    route_time: float
+
+
+# The landmark indexes of a worker, least recently used first.
+_INDEXES: "OrderedDict[MazeSpec, Any]" = OrderedDict()
+# The generation cache of a worker (a `MazeCache`), created on first use.
+_CACHE: Any = None
+
+
+def _new_generator(spec: MazeSpec, deadline: float | None) -> Any:
+    """Returns a `MazeGenerator` for `spec`, using the worker cache.
+
+    Only a spec with a seed can be asked again, so the ones without are
+    not cached.
+
+    Args:
+        spec: The validated spec.
+        deadline: The `time.monotonic()` time after which the generation
+                  is cancelled, or None.
+
+    Returns:
+        MazeGenerator: The generator, not run yet.
+    """
+    global _CACHE
+    from maze import MazeCache, MazeGenerator, MazeProgress
+
+    cache = None
+    if spec.seed is not None:
+        if _CACHE is None:
+            _CACHE = MazeCache(max_entries=MAZE_CACHE)
+        cache = _CACHE
+    progress = MazeProgress(deadline=deadline) if deadline else None
+    return MazeGenerator(spec, cache=cache, progress=progress)
+
+
+def _warm_up() -> None:
+    """Worker initializer: imports the generator and runs it once."""
+    from maze import MazeGenerator
+
+    MazeGenerator(MazeSpec(4, 4, (0, 0), (3, 3), "maze.txt", True,
+                           seed=0)).generate()
+
+
+def _ping() -> None:
+    """Worker task doing nothing, to start a worker (and its warm up)."""
+    time.sleep(0.05)
+
+
+def _generate(spec: MazeSpec, binary: bool,
+              deadline: float | None) -> Generated:
+    """Worker entry point: generates a maze and serializes it.
+
+    A maze with a seed already generated by this worker comes from its
+    cache.
+
+    Args:
+        spec: The validated spec.
+        binary: True for the binary format, False for the text one.
+        deadline: The `time.monotonic()` time after which the generation
+                  is cancelled, or None.
+
+    Returns:
+        Generated: The serialized maze and its timing.
+
+    Raises:
+        MazeGenerationCancelled: If the deadline is reached.
+    """
+    start = time.perf_counter()
+    generator = _new_generator(spec, deadline)
+    maze = generator.generate()
+    payload = maze.to_bytes() if binary else maze.to_hex().encode("ascii")
+    return Generated(payload, str(generator.seed),
+                     time.perf_counter() - start)
+
+
+def _route(spec: MazeSpec, start: Cell | None, end: Cell | None,
+           deadline: float | None) -> Routed:
+    """Worker task: finds a shortest path in the maze of `spec`.
+
+    The maze is indexed on its first query only, and taken from the
+    worker cache if it was already generated.
+
+    Args:
+        spec: The validated spec, with a seed.
+        start: The starting cell, or None for the entry.
+        end: The target cell, or None for the exit.
+        deadline: The `time.monotonic()` time after which the generation
+                  is cancelled, or None.
+
+    Returns:
+        Routed: The moves and the timing.
+
+    Raises:
+        MazeGenerationCancelled: If the deadline is reached.
+    """
+    from maze import LandmarkIndex
+
+    began = time.perf_counter()
+    index = _INDEXES.get(spec)
+    if index is None:
+        index = LandmarkIndex(_new_generator(spec, deadline).generate())
+        _INDEXES[spec] = index
+        if len(_INDEXES) > INDEX_CACHE:
+            _INDEXES.popitem(last=False)
+    else:
+        _INDEXES.move_to_end(spec)
+    return Routed(index.path(start, end), time.perf_counter() - began)
+
+
+def _json_fields(body: bytes) -> Dict[str, Any]:
+    """Parses a JSON object body, with lowercase keys.
+
+    Raises:
+        HttpError: 400 if the body is not a JSON object.
+    """
+    try:
+        raw = json.loads(body)
+    except ValueError:
+        raise HttpError(400, "The body must be a JSON object")
+    if not isinstance(raw, dict):
+        raise HttpError(400, "The body must be a JSON object")
+    return {str(key).lower(): value for key, value in raw.items()}
+
+
+def _spec_from(fields: Dict[str, Any]) -> MazeSpec:
+    """Validates the configuration keys of a request.
+
+    Raises:
+        HttpError: 400 with the message of the configuration error.
+    """
+    for key in fields:
+        if key not in CONFIG_KEYS or key in _LOCAL_KEYS:
+            raise HttpError(400, f"Key: '{key}' is not valid")
+    fields.setdefault("output_file", "maze.txt")
+    try:
+        return MazeSpec.from_mapping(fields)
+    except MazeConfigError as e:
+        raise HttpError(400, str(e))
+
+
+def parse_spec(body: bytes) -> MazeSpec:
+    """Validates the JSON body of a request.
+
+    Args:
+        body: The body, a JSON object with the configuration keys.
+
+    Returns:
+        MazeSpec: The validated spec.
+
+    Raises:
+        HttpError: 400 with the message of the configuration error.
+    """
+    return _spec_from(_json_fields(body))
+
+
+def parse_route(body: bytes) -> Tuple[MazeSpec, Cell | None, Cell | None]:
+    """Validates the JSON body of a path query.
+
+    Args:
+        body: The body, a JSON object with the configuration keys (and a
+              seed), and the optional `from` and `to` cells.
+
+    Returns:
+        Tuple[MazeSpec, Cell | None, Cell | None]: The spec and the two
+        cells (None for the entry and the exit).
+
+    Raises:
+        HttpError: 400 if the spec or a cell is invalid.
+    """
+    fields = _json_fields(body)
+    raw_cells = [fields.pop(name, None) for name in ("from", "to")]
+    spec = _spec_from(fields)
+    if spec.seed is None:
+        raise HttpError(400, "A seed is required to query a path")
+    cells: List[Cell | None] = []
+    for name, raw in zip(("from", "to"), raw_cells):
+        if raw is None:
+            cells.append(None)
+            continue
+        if (not isinstance(raw, list) or len(raw) != 2
+                or not all(type(value) is int for value in raw)
+                or not (0 <= raw[0] < spec.width
+                        and 0 <= raw[1] < spec.height)):
+            raise HttpError(400, f"'{name}' must be a cell [x, y] of the "
+                            "maze")
+        cells.append((raw[0], raw[1]))
+    return spec, cells[0], cells[1]
+
+
+class MazeService():
+    """Serves generation requests with a pool of warm worker processes.
+
+    Attributes:
+        workers (int): Number of worker processes.
+        queue_size (int): Maximum number of generations waiting for, or
+            running in, a worker.
+        deadline (float | None): Default and maximum time allowed to a
+            request, in seconds, or None.
+        stats (Dict[str, int]): Counters of the requests served.
+    """
+
+    def __init__(self, workers: int, queue_size: int,
+                 deadline: float | None = None) -> None:
+        """Starts the worker processes.
+
+        Args:
+            workers: Number of worker processes.
+            queue_size: Maximum number of generations in progress.
+            deadline: Default and maximum time allowed to a request, in
+                      seconds, or None for no limit.
+        """
+        self.workers = workers
+        self.queue_size = queue_size
+        self.deadline = deadline
+        self.stats = {"requests": 0, "generated": 0, "coalesced": 0,
+                      "rejected": 0, "timed_out": 0, "routed": 0}
+        self._pool = ProcessPoolExecutor(max_workers=workers,
+                                         initializer=_warm_up)
+        self._pending: Dict[Tuple[MazeSpec, bool],
+                            "asyncio.Future[Generated]"] = {}
+        self._running = 0
+
+    def close(self) -> None:
+        """Stops the worker processes."""
+        self._pool.shutdown(cancel_futures=True)
+
+    async def generate(self, spec: MazeSpec, binary: bool,
+                       deadline: float | None = None
+                       ) -> Tuple[Generated, float, bool]:
+        """Generates a maze in a worker, or joins an identical generation.
+
+        Args:
+            spec: The validated spec.
+            binary: True for the binary format, False for the text one.
+            deadline: The `time.monotonic()` time after which the request
+                      gives up, or None.
+
+        Returns:
+            Tuple[Generated, float, bool]: The maze, the time waited for
+            it (in seconds) and True if it was coalesced.
+
+        Raises:
+            HttpError: 503 if the queue is full, 504 if the deadline is
+            reached, 500 if the generation failed.
+        """
+        start = time.perf_counter()
+        # Without a seed, each request asks for a different maze.
+        key = (spec, binary) if spec.seed is not None else None
+        pending = self._pending.get(key) if key is not None else None
+        if pending is not None:
+            self.stats["coalesced"] += 1
+            # The generation joined has its own deadline: wait for ours.
+            timeout = (None if deadline is None
+                       else max(0.0, deadline - time.monotonic()))
+            try:
+                generated = await asyncio.wait_for(asyncio.shield(pending),
+                                                   timeout)
+            except (asyncio.TimeoutError, MazeGenerationCancelled):
+                self.stats["timed_out"] += 1
+                raise HttpError(504, "The maze was not generated in time")
+            except MazeError as e:
+                raise HttpError(500, str(e))
+            except Exception as e:
+                raise HttpError(500, f"Generation failed: "
+                                f"{type(e).__name__}")
+            return generated, time.perf_counter() - start, True
+
+        if self._running >= self.queue_size:
+            self.stats["rejected"] += 1
+            raise HttpError(503, "Too many mazes in progress, retry later")
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._pool, _generate, spec, binary,
+                                      deadline)
+        self._running += 1
+        if key is not None:
+            self._pending[key] = future
+        # Counted until the worker is done, even if the client leaves.
+        future.add_done_callback(lambda _: self._done(key))
+        try:
+            generated = await asyncio.shield(future)
+        except MazeGenerationCancelled:
+            self.stats["timed_out"] += 1
+            raise HttpError(504, "The maze was not generated in time")
+        except MazeError as e:
+            raise HttpError(500, str(e))
+        except Exception as e:
+            raise HttpError(500, f"Generation failed: {type(e).__name__}")
+        self.stats["generated"] += 1
+        return generated, time.perf_counter() - start, False
+
+    async def route(self, spec: MazeSpec, start: Cell | None,
+                    end: Cell | None, deadline: float | None = None
+                    ) -> Tuple[Routed, float]:
+        """Finds a shortest path in a worker.
+
+        Args:
+            spec: The validated spec, with a seed.
+            start: The starting cell, or None for the entry.
+            end: The target cell, or None for the exit.
+            deadline: The `time.monotonic()` time after which the request
+                      gives up, or None.
+
+        Returns:
+            Tuple[Routed, float]: The path and the time waited for it (in
+            seconds).
+
+        Raises:
+            HttpError: 503 if the queue is full, 504 if the deadline is
+            reached, 500 if the generation failed.
+        """
+        began = time.perf_counter()
+        if self._running >= self.queue_size:
+            self.stats["rejected"] += 1
+            raise HttpError(503, "Too many mazes in progress, retry later")
+
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._pool, _route, spec, start, end,
+                                      deadline)
+        self._running += 1
+        future.add_done_callback(lambda _: self._done(None))
+        try:
+            routed = await asyncio.shield(future)
+        except MazeGenerationCancelled:
+            self.stats["timed_out"] += 1
+            raise HttpError(504, "The maze was not generated in time")
+        except MazeError as e:
+            raise HttpError(500, str(e))
+        except Exception as e:
+            raise HttpError(500, f"Generation failed: {type(e).__name__}")
+        self.stats["routed"] += 1
+        return routed, time.perf_counter() - began
+
+    def _done(self, key: Tuple[MazeSpec, bool] | None) -> None:
+        """Frees the queue slot of a finished generation."""
+        self._running -= 1
+        if key is not None:
+            self._pending.pop(key, None)
+
+    async def warm_up(self) -> None:
+        """Starts every worker and waits for their first generation."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._pool, _ping)
+                               for _ in range(self.workers)))
+
+    async def handle(self, reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter) -> None:
+        """Serves the requests of one connection (kept alive).
+
+        Args:
+            reader: The connection input.
+            writer: The connection output.
+        """
+        try:
+            while True:
+                keep_alive = await self._serve_one(reader, writer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_one(self, reader: asyncio.StreamReader,
+                         writer: asyncio.StreamWriter) -> bool:
+        """Reads one request and answers it.
+
+        Returns:
+            bool: True if the connection can serve another request.
+        """
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return False
+        received = time.perf_counter()
+        arrived = time.monotonic()
+        self.stats["requests"] += 1
+
+        keep_alive = True
+        try:
+            method, target, headers = await _read_head(request_line, reader)
+            keep_alive = headers.get("connection", "").lower() != "close"
+            body = await _read_body(headers, reader)
+            url = urlsplit(target)
+            if url.path == "/health":
+                if method != "GET":
+                    raise HttpError(405, "Use GET")
+                await _respond(writer, 200, "application/json",
+                               json.dumps(self.health()).encode(), {},
+                               keep_alive)
+                return keep_alive
+            if url.path == "/path":
+                if method != "POST":
+                    raise HttpError(405, "Use POST")
+                spec, start, end = parse_route(body)
+                deadline = self.request_deadline(headers, arrived)
+                routed, waited = await self.route(spec, start, end,
+                                                  deadline)
+                answer = {"distance": (-1 if routed.moves is None
+                                       else len(routed.moves)),
+                          "moves": routed.moves}
+                await _respond(writer, 200, "application/json",
+                               json.dumps(answer).encode(),
+                               _timing(received, waited, routed.route_time),
+                               keep_alive)
+                return keep_alive
+            if url.path != "/maze":
+                raise HttpError(404, f"No such path: {url.path}")
+            if method != "POST":
+                raise HttpError(405, "Use POST")
+
+            query = parse_qs(url.query)
+            binary = (query.get("format", [""])[0] == "mzb"
+                      or "application/octet-stream"
+                      in headers.get("accept", ""))
+            spec = parse_spec(body)
+            deadline = self.request_deadline(headers, arrived)
+            generated, waited, coalesced = await self.generate(spec, binary,
+                                                               deadline)
+        except HttpError as e:
+            extra = {"Retry-After": "1"} if e.status == 503 else {}
+            await _respond(writer, e.status, "text/plain",
+                           f"{e}\n".encode(), extra, keep_alive)
+            return keep_alive
+
+        timing = _timing(received, waited, generated.generate_time)
+        timing["X-Coalesced"] = "1" if coalesced else "0"
+        timing["X-Maze-Seed"] = generated.seed
+        content_type = ("application/octet-stream" if binary
+                        else "text/plain")
+        await _respond(writer, 200, content_type, generated.payload, timing,
+                       keep_alive)
+        return keep_alive
+
+    def request_deadline(self, headers: Dict[str, str],
+                         arrived: float) -> float | None:
+        """Computes the deadline of a request.
+
+        Args:
+            headers: The request headers; `X-Deadline-Ms` can shorten the
+                     deadline of the service.
+            arrived: The `time.monotonic()` time the request arrived.
+
+        Returns:
+            float | None: The `time.monotonic()` time after which the
+            request gives up, or None.
+
+        Raises:
+            HttpError: 400 if `X-Deadline-Ms` is not a positive number.
+        """
+        limit = self.deadline
+        if "x-deadline-ms" in headers:
+            try:
+                asked = float(headers["x-deadline-ms"]) / 1000
+            except ValueError:
+                asked = -1.0
+            if not asked > 0:
+                raise HttpError(400, "X-Deadline-Ms must be a positive "
+                                "number")
+            limit = asked if limit is None else min(limit, asked)
+        return None if limit is None else arrived + limit
+
+    def health(self) -> Dict[str, Any]:
+        """Returns the state of the service.
+
+        Returns:
+            Dict[str, Any]: The workers, the queue and the counters.
+        """
+        return {"workers": self.workers, "queue_size": self.queue_size,
+                "deadline": self.deadline, "in_progress": self._running,
+                **self.stats}
+
+
+def _timing(received: float, waited: float,
+            worked: float) -> Dict[str, str]:
+    """Builds the timing headers of a response.
+
+    Args:
+        received: The `time.perf_counter()` time the request arrived.
+        waited: Time waited for the worker, in seconds.
+        worked: Time spent in the worker, in seconds.
+
+    Returns:
+        Dict[str, str]: The `X-*-Ms` and `Server-Timing` headers.
+    """
+    queue_ms = max(0.0, waited - worked) * 1000
+    generate_ms = worked * 1000
+    total_ms = (time.perf_counter() - received) * 1000
+    return {
+        "X-Queue-Ms": f"{queue_ms:.2f}",
+        "X-Generate-Ms": f"{generate_ms:.2f}",
+        "X-Total-Ms": f"{total_ms:.2f}",
+        "Server-Timing": (f"queue;dur={queue_ms:.2f}, "
+                          f"generate;dur={generate_ms:.2f}, "
+                          f"total;dur={total_ms:.2f}"),
+    }
+
+
+async def _read_head(request_line: bytes, reader: asyncio.StreamReader
+                     ) -> Tuple[str, str, Dict[str, str]]:
+    """Parses the request line and the headers.
+
+    Returns:
+        Tuple[str, str, Dict[str, str]]: The method, the target and the
+        headers (lowercase names).
+
+    Raises:
+        HttpError: 400 if the request is malformed.
+    """
+    parts = request_line.decode("latin-1").split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+        raise HttpError(400, "Malformed request line")
+    headers: Dict[str, str] = {}
+    for _ in range(MAX_HEADERS):
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return parts[0], parts[1], headers
+        name, sep, value = line.decode("latin-1").partition(":")
+        if not sep:
+            raise HttpError(400, "Malformed header")
+        headers[name.strip().lower()] = value.strip()
+    raise HttpError(400, "Too many headers")
+
+
+async def _read_body(headers: Dict[str, str],
+                     reader: asyncio.StreamReader) -> bytes:
+    """Reads the body announced by `Content-Length`.
+
+    Raises:
+        HttpError: 400 on an invalid length, 413 if it is too large.
+    """
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError:
+        raise HttpError(400, "Invalid Content-Length")
+    if length < 0:
+        raise HttpError(400, "Invalid Content-Length")
+    if length > MAX_BODY:
+        raise HttpError(413, f"The body must not exceed {MAX_BODY} bytes")
+    return await reader.readexactly(length)
+
+
+async def _respond(writer: asyncio.StreamWriter, status: int,
+                   content_type: str, body: bytes, headers: Dict[str, str],
+                   keep_alive: bool) -> None:
+    """Sends a response, streaming its body by chunks.
+
+    Waiting for the socket to drain between the chunks keeps the memory
+    of a slow client bounded to the chunks in flight.
+    """
+    connection = "keep-alive" if keep_alive else "close"
+    head: List[str] = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+                       f"Content-Type: {content_type}",
+                       f"Content-Length: {len(body)}",
+                       f"Connection: {connection}"]
+    head += [f"{name}: {value}" for name, value in headers.items()]
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+    view = memoryview(body)
+    for start in range(0, len(view), STREAM_CHUNK):
+        writer.write(view[start:start + STREAM_CHUNK])
+        await writer.drain()
+    await writer.drain()
+
+
+async def serve(service: MazeService, host: str, port: int,
+                unix: str | None) -> None:
+    """Runs the server until it is cancelled.
+
+    Args:
+        service: The service answering the requests.
+        host: The loopback address to listen on (ignored with `unix`).
+        port: The TCP port (ignored with `unix`).
+        unix: A Unix socket path to listen on instead of TCP.
+    """
+    await service.warm_up()
+    if unix is not None:
+        server = await asyncio.start_unix_server(service.handle, path=unix)
+        where = unix
+    else:
+        server = await asyncio.start_server(service.handle, host=host,
+                                            port=port)
+        where = f"http://{host}:{port}"
+    print(f"Maze service listening on {where} "
+          f"({service.workers} workers)", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> int:
+    """Parses the arguments and runs the service.
+
+    Returns:
+        int: The process exit code (2 on invalid arguments).
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1",
+                        help=f"loopback address, one of {LOOPBACK_HOSTS}")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--unix", help="listen on this Unix socket instead")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: all CPUs)")
+    parser.add_argument("--queue", type=int, default=None,
+                        help="generations in progress before answering 503 "
+                        "(default: 4 per worker)")
+    parser.add_argument("--deadline", type=float, default=None,
+                        metavar="SECONDS",
+                        help="default and maximum time allowed to a request "
+                        "(default: no limit)")
+    args = parser.parse_args()
+
+    if args.host not in LOOPBACK_HOSTS:
+        print(f"ArgumentsError: The service only listens on "
+              f"{LOOPBACK_HOSTS}", file=sys.stderr)
+        return 2
+    if args.workers < 1 or (args.queue is not None and args.queue < 1):
+        print("ArgumentsError: --workers and --queue must be at least 1",
+              file=sys.stderr)
+        return 2
+    if args.deadline is not None and args.deadline <= 0:
+        print("ArgumentsError: --deadline must be positive", file=sys.stderr)
+        return 2
+
+    service = MazeService(args.workers, args.queue or args.workers * 4,
+                          args.deadline)
+    try:
+        asyncio.run(serve(service, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+        if args.unix is not None and os.path.exists(args.unix):
+            os.unlink(args.unix)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
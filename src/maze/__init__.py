@@ -12,13 +12,34 @@
 
 """
 Maze Generator Package.
+
+The public names are loaded lazily on first access (PEP 562), so that
+`import maze` does not import pydantic, colorama or the algorithms before
+they are needed.
 """
 
-from .maze_config import MazeConfig
-from .maze_errors import MazeConfigError, MazeGenerationError
-from .maze_fortytwo_pattern import get_fortytwo_pattern
-from .maze_generator import MazeGenerator
-from .maze_solver import MazeSolver
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .maze_archive import MazeArchive, MazeArchiveWriter
+    from .maze_batch import MazeSpec, load_specs
+    from .maze_cell_solver import CellSolver
+    from .maze_checkpoint import MazeCheckpoint
+    from .maze_dedupe import MazeDedupeStore
+    from .maze_config import MazeConfig
+    from .maze_errors import (MazeConfigError, MazeGenerationError,
+                              MazeGenerationCancelled)
+    from .maze_fortytwo_pattern import get_fortytwo_pattern
+    from .maze_generator import MazeGenerator
+    from .maze_landmarks import LandmarkIndex
+    from .maze_grid import MazeGrid, MmapMazeGrid
+    from .maze_path_index import PathIndex
+    from .maze_progress import MazeProgress
+    from .maze_result import Maze
+    from .maze_solver import MazeSolver
+    from .maze_wall_follower import WallFollower
+    from .maze_cache import MazeCache
 
 __version__ = "1.0.0"
 
@@ -26,7 +47,73 @@ __all__ = [
     "MazeConfig",
     "MazeConfigError",
     "MazeGenerationError",
+    "MazeGenerationCancelled",
     "get_fortytwo_pattern",
     "MazeGenerator",
-    "MazeSolver"
+    "Maze",
+    "MazeSolver",
+    "MazeCache",
+    "MazeSpec",
+    "load_specs",
+    "MazeArchive",
+    "MazeArchiveWriter",
+    "MazeDedupeStore",
+    "MazeProgress",
+    "MazeCheckpoint",
+    "MazeGrid",
+    "MmapMazeGrid",
+    "CellSolver",
+    "WallFollower",
+    "PathIndex",
+    "LandmarkIndex"
 ]
+
+_LAZY_NAMES = {
+    "MazeConfig": ".maze_config",
+    "MazeConfigError": ".maze_errors",
+    "MazeGenerationError": ".maze_errors",
+    "MazeGenerationCancelled": ".maze_errors",
+    "get_fortytwo_pattern": ".maze_fortytwo_pattern",
+    "MazeGenerator": ".maze_generator",
+    "Maze": ".maze_result",
+    "MazeSolver": ".maze_solver",
+    "MazeCache": ".maze_cache",
+    "MazeSpec": ".maze_batch",
+    "load_specs": ".maze_batch",
+    "MazeArchive": ".maze_archive",
+    "MazeArchiveWriter": ".maze_archive",
+    "MazeDedupeStore": ".maze_dedupe",
+    "MazeProgress": ".maze_progress",
+    "MazeCheckpoint": ".maze_checkpoint",
+    "MazeGrid": ".maze_grid",
+    "MmapMazeGrid": ".maze_grid",
+    "CellSolver": ".maze_cell_solver",
+    "WallFollower": ".maze_wall_follower",
+    "PathIndex": ".maze_path_index",
+    "LandmarkIndex": ".maze_landmarks",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the submodule defining `name` on first access.
+
+    Args:
+        name: The attribute looked up on the package.
+
+    Returns:
+        Any: The public object, cached in the package namespace.
+
+    Raises:
+        AttributeError: If `name` is not a public name of the package.
+    """
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Lists the public names, including the ones not loaded yet."""
+    return sorted(set(globals()) | set(__all__))
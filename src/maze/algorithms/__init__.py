@@ -6,17 +6,63 @@
 #  By: roandrie, rruiz                           +#+  +:+       +#+         #
 #                                              +#+#+#+#+#+   +#+            #
 #  Created: 2026/01/27 16:18:00 by roandrie        #+#    #+#               #
-#  Updated: 2026/02/10 13:18:25 by rruiz           ###   ########.fr        #
+#  Updated: 2026/03/04 16:02:11 by roandrie        ###   ########.fr        #
 #                                                                           #
 # ************************************************************************* #
 
-from .backtracking import recursive_backtracking, break_random_walls
-from .hunt_and_kill import hunt_and_kill, break_walls_hak
+"""Maze generation algorithms.
+
+Each algorithm is loaded on first access (PEP 562): selecting one does
+not import the others, nor the process pool and the shared memory of
+`tiled`.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .backtracking import recursive_backtracking, break_random_walls
+    from .hunt_and_kill import hunt_and_kill, break_walls_hak
+    from .tiled import tiled_generation
 
 
 __all__ = [
     "recursive_backtracking",
     "break_random_walls",
     "hunt_and_kill",
-    "break_walls_hak"
+    "break_walls_hak",
+    "tiled_generation"
 ]
+
+_LAZY_NAMES = {
+    "recursive_backtracking": ".backtracking",
+    "break_random_walls": ".backtracking",
+    "hunt_and_kill": ".hunt_and_kill",
+    "break_walls_hak": ".hunt_and_kill",
+    "tiled_generation": ".tiled",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Imports the algorithm module defining `name` on first access.
+
+    Args:
+        name: The attribute looked up on the package.
+
+    Returns:
+        Any: The public object, cached in the package namespace.
+
+    Raises:
+        AttributeError: If `name` is not a public name of the package.
+    """
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """Lists the public names, including the ones not loaded yet."""
+    return sorted(set(globals()) | set(__all__))
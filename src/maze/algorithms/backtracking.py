@@ -19,116 +19,144 @@ post-processing utilities to introduce loops into the maze for
 """
 
 import random
-import sys
 
+from array import array
 from typing import Any
 
 from maze.maze_customization import MAZE
 
 
+# Steps towards the neighbours, by direction code, in the order the
+# candidates are listed before being shuffled.
+_STEPS = ((-2, 0), (2, 0), (0, -2), (0, 2))
+
+
 def recursive_backtracking(generator: Any, rendering: bool) -> None:
     """Generates a perfect maze using the Recursive Backtracking algorithm.
 
-    This function increases the system recursion limit to handle the grid
-    size, selects a valid starting point ensuring parity alignment, and
-    initiates the recursive `visit` function to carve paths.
+    This function selects a valid starting point ensuring parity
+    alignment, and runs the depth-first search on an explicit stack, so
+    the size of the grid is not bound by the recursion limit. Each cell
+    carved is counted by `generator.progress` (see `break_wall`), whose
+    deadline stops the search with `MazeGenerationCancelled`.
 
     The algorithm works by:
     1. Choosing a starting cell.
     2. Randomly choosing an unvisited neighbor.
     3. Moving to that neighbor (breaking the wall between them).
-    4. Recursively repeating step 2 until dead-end.
+    4. Repeating step 2 until dead-end.
     5. Backtracking to the previous cell.
 
+    The stack holds, for each cell of the current path, its index and
+    its neighbours not tried yet (see `_pack_options`). With a
+    `generator.checkpoint`, it is saved periodically, and a search
+    resumed from a checkpoint starts from the saved stack.
+
     Args:
         generator: The `MazeGenerator` instance containing the grid and
                    configuration.
         rendering: If True, visualizes the wall breaking process in
                    real-time.
     """
-    recursion_limit = generator.width * generator.height
-    sys.setrecursionlimit(recursion_limit)
-
-    start_coords = generator.entry_coord
-
-    if start_coords[0] % 2 == 0:
-        if random.choice([True, False]):
-            start_coords = (start_coords[0] + 1, start_coords[1])
-        else:
-            start_coords = (start_coords[0] - 1, start_coords[1])
-    if start_coords[1] % 2 == 0:
-        if random.choice([True, False]):
-            start_coords = (start_coords[0], start_coords[1] + 1)
-        else:
-            start_coords = (start_coords[0], start_coords[1] - 1)
-
-    start_coords_x, start_coords_y = start_coords
-    generator.break_wall(start_coords_x, start_coords_y, rendering)
-
-    def visit(x: int, y: int) -> None:
-        walls_list = {}
-        walls_random = []
-
-        if 0 <= x - 2 < generator.width:
-            if (generator.maze[(x - 2, y)] in
-                    (MAZE.wall, MAZE.entry, MAZE.exit) and
-                    generator.maze[(x - 1, y)] == MAZE.wall):
-                walls_list.update({"west": x - 2})
+    width = generator.width
+    checkpoint = generator.checkpoint
+    resumed = checkpoint.take_resumed() if checkpoint is not None else None
+
+    if resumed is not None:
+        stack_cells, stack_options = resumed
+    else:
+        start_coords = generator.entry_coord
+
+        if start_coords[0] % 2 == 0:
+            if random.choice([True, False]):
+                start_coords = (start_coords[0] + 1, start_coords[1])
+            else:
+                start_coords = (start_coords[0] - 1, start_coords[1])
+        if start_coords[1] % 2 == 0:
+            if random.choice([True, False]):
+                start_coords = (start_coords[0], start_coords[1] + 1)
+            else:
+                start_coords = (start_coords[0], start_coords[1] - 1)
+
+        start_coords_x, start_coords_y = start_coords
+        generator.break_wall(start_coords_x, start_coords_y, rendering)
+        stack_cells = array('I', [start_coords_y * width + start_coords_x])
+        stack_options = array('H', [_pack_options(generator, start_coords_x,
+                                                  start_coords_y)])
+
+    while stack_cells:
+        options = stack_options[-1]
+        if not options:
+            stack_cells.pop()
+            stack_options.pop()
+            continue
+        # Take the next neighbour to try out of the packed options.
+        stack_options[-1] = ((options >> 5) << 3) | ((options & 7) - 1)
+        step_x, step_y = _STEPS[(options >> 3) & 3]
+        x, y = stack_cells[-1] % width, stack_cells[-1] // width
+        target_x, target_y = x + step_x, y + step_y
+        mid_x, mid_y = x + step_x // 2, y + step_y // 2
+
+        if (generator.maze[(target_x, target_y)] in
+                (MAZE.wall, MAZE.entry, MAZE.exit) and
+                generator.maze[(mid_x, mid_y)] == MAZE.wall and
+                (mid_x, mid_y) not in generator.fourtytwo_coord):
+
+            generator.break_wall(target_x, target_y, rendering)
+            generator.break_wall(mid_x, mid_y, rendering)
+
+            stack_cells.append(target_y * width + target_x)
+            stack_options.append(_pack_options(generator, target_x,
+                                               target_y))
+            if checkpoint is not None and checkpoint.due():
+                checkpoint.save(generator, stack_cells, stack_options)
+
+
+def _pack_options(generator: Any, x: int, y: int) -> int:
+    """Lists, in random order, the neighbours of a cell to try.
+
+    A neighbour is a candidate if it is not carved yet and the wall
+    between them stands. The candidates are shuffled once, when the cell
+    is reached.
 
-        if x + 2 < generator.width:
-            if (generator.maze[(x + 2, y)] in
-                    (MAZE.wall, MAZE.entry, MAZE.exit) and
-                    generator.maze[(x + 1, y)] == MAZE.wall):
-                walls_list.update({"east": x + 2})
-
-        if 0 <= y - 2 < generator.height:
-            if (generator.maze[(x, y - 2)] in
-                    (MAZE.wall, MAZE.entry, MAZE.exit) and
-                    generator.maze[(x, y - 1)] == MAZE.wall):
-                walls_list.update({"south": y - 2})
-
-        if y + 2 < generator.height:
-            if (generator.maze[(x, y + 2)] in
-                    (MAZE.wall, MAZE.entry, MAZE.exit) and
-                    generator.maze[(x, y + 1)] == MAZE.wall):
-                walls_list.update({"north": y + 2})
-
-        if len(walls_list) > 0:
-
-            walls_random = list(walls_list)
-            random.shuffle(walls_random)
-
-            for item in walls_random:
-                target_x, target_y = x, y
-                mid_x, mid_y = x, y
-
-                if item == "north":
-                    target_y = walls_list[item]
-                    mid_y = (y + target_y) // 2
-
-                elif item == "south":
-                    target_y = walls_list[item]
-                    mid_y = (y + target_y) // 2
-
-                elif item == "east":
-                    target_x = walls_list[item]
-                    mid_x = (x + target_x) // 2
+    Args:
+        generator: The `MazeGenerator` instance being carved.
+        x: The grid X coordinate of the cell.
+        y: The grid Y coordinate of the cell.
+
+    Returns:
+        int: The number of candidates in the 3 low bits, then the
+        direction code (an index of `_STEPS`) of each candidate, 2 bits
+        each, the next one to try first.
+    """
+    targets = (MAZE.wall, MAZE.entry, MAZE.exit)
+    candidates = []
 
-                elif item == "west":
-                    target_x = walls_list[item]
-                    mid_x = (x + target_x) // 2
+    if 0 <= x - 2 < generator.width:
+        if (generator.maze[(x - 2, y)] in targets and
+                generator.maze[(x - 1, y)] == MAZE.wall):
+            candidates.append(0)
 
-                if (generator.maze[(target_x, target_y)] in
-                        (MAZE.wall, MAZE.entry, MAZE.exit) and
-                        generator.maze[(mid_x, mid_y)] == MAZE.wall and
-                        (mid_x, mid_y) not in generator.fourtytwo_coord):
+    if x + 2 < generator.width:
+        if (generator.maze[(x + 2, y)] in targets and
+                generator.maze[(x + 1, y)] == MAZE.wall):
+            candidates.append(1)
 
-                    generator.break_wall(target_x, target_y, rendering)
-                    generator.break_wall(mid_x, mid_y, rendering)
+    if 0 <= y - 2 < generator.height:
+        if (generator.maze[(x, y - 2)] in targets and
+                generator.maze[(x, y - 1)] == MAZE.wall):
+            candidates.append(2)
 
-                    visit(target_x, target_y)
+    if y + 2 < generator.height:
+        if (generator.maze[(x, y + 2)] in targets and
+                generator.maze[(x, y + 1)] == MAZE.wall):
+            candidates.append(3)
 
-    visit(start_coords_x, start_coords_y)
+    random.shuffle(candidates)
+    options = len(candidates)
+    for shift, code in enumerate(candidates):
+        options |= code << (3 + 2 * shift)
+    return options
 
 
 def break_random_walls(generator: Any, rendering: bool) -> None:
@@ -136,7 +164,8 @@ def break_random_walls(generator: Any, rendering: bool) -> None:
 
     Scans the generated maze for dead-ends or specific wall configurations
     and randomly removes walls to create loops and alternative paths.
-    This is only executed if the `perfect` configuration is set to False.
+    This is only executed if the `perfect` configuration is set to False. The
+    scan checks the deadline of `generator.progress` once per row.
 
     Args:
         generator: The `MazeGenerator` instance to modify.
@@ -147,6 +176,8 @@ def break_random_walls(generator: Any, rendering: bool) -> None:
     directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
 
     for y in range(generator.height):
+        if generator.progress is not None:
+            generator.progress.check()
         for x in range(generator.width):
             if (generator.maze[(x, y)] == MAZE.empty):
                 totals_walls = 0
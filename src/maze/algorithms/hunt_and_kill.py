@@ -23,8 +23,8 @@ This implementation also handles the "imperfect" maze logic (creating loops)
 directly within the scanning phase if configured.
 """
 
+from array import array
 from random import choice, shuffle
-
 from typing import Any
 
 from maze.maze_customization import MAZE
@@ -35,7 +35,11 @@ def hunt_and_kill(generator: Any, rendering: bool) -> None:
 
     The function modifies the `generator.maze` grid in-place. It respects
     the reserved '42' pattern coordinates by checking
-    `generator.fourtytwo_coord` before carving walls.
+    `generator.fourtytwo_coord` before carving walls. The carved cells
+    and the rows scanned by the hunt phase are counted by
+    `generator.progress`, if any. With a `generator.checkpoint`, the cell
+    the kill phase is at is saved periodically, and the walk resumes from
+    it.
 
     Args:
         generator: The `MazeGenerator` instance containing the grid state,
@@ -44,14 +48,22 @@ def hunt_and_kill(generator: Any, rendering: bool) -> None:
                    enabled to animate the process in the terminal.
     """
     targets = (MAZE.wall, MAZE.entry, MAZE.exit)
-    x, y = generator.entry_x, generator.entry_y
-
-    if x % 2 == 0:
-        x += 1 if x < generator.width - 1 else -1
-    if y % 2 == 0:
-        y += 1 if y < generator.height - 1 else -1
-
-    generator.break_wall(x, y, rendering)
+    checkpoint = generator.checkpoint
+    resumed = checkpoint.take_resumed() if checkpoint is not None else None
+
+    if resumed is not None:
+        # The saved stack only holds the cell the kill phase is at.
+        x = resumed[0][-1] % generator.width
+        y = resumed[0][-1] // generator.width
+    else:
+        x, y = generator.entry_x, generator.entry_y
+
+        if x % 2 == 0:
+            x += 1 if x < generator.width - 1 else -1
+        if y % 2 == 0:
+            y += 1 if y < generator.height - 1 else -1
+
+        generator.break_wall(x, y, rendering)
     while True:
         # Kill phase #
         while True:
@@ -90,9 +102,15 @@ def hunt_and_kill(generator: Any, rendering: bool) -> None:
             generator.break_wall(mid_x, mid_y, rendering)
             generator.break_wall(target_x, target_y, rendering)
             x, y = target_x, target_y
+            if checkpoint is not None and checkpoint.due():
+                checkpoint.save(generator,
+                                array('I', [y * generator.width + x]),
+                                array('H', [0]))
         # Hunt phase #
         found = False
         for ty in range(1, generator.height - 1, 2):
+            if generator.progress is not None:
+                generator.progress.advance()
             for tx in range(1, generator.width - 1, 2):
                 if (generator.maze[(tx, ty)] in targets
                         and (tx, ty) not in generator.fourtytwo_coord):
@@ -167,6 +185,9 @@ def break_walls_hak(generator: Any, rendering: bool) -> None:
     a second pass targets any internal wall separating two empty cells,
     which is guaranteed to introduce a cycle.
 
+    Each `path_checker` call is stopped by the deadline of
+    `generator.progress` too, as it can explore most of the maze.
+
     Args:
         generator: The `MazeGenerator` instance to modify.
         rendering: If True, animates the wall removal in the terminal.
@@ -175,6 +196,8 @@ def break_walls_hak(generator: Any, rendering: bool) -> None:
     directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
 
     for y in range(generator.height):
+        if generator.progress is not None:
+            generator.progress.check()
         for x in range(generator.width):
             if generator.maze[(x, y)] == MAZE.empty:
                 totals_walls = 0
@@ -226,6 +249,8 @@ def break_walls_hak(generator: Any, rendering: bool) -> None:
 
     cycle_walls = []
     for y in range(1, generator.height - 1):
+        if generator.progress is not None:
+            generator.progress.check()
         for x in range(1, generator.width - 1):
             if (generator.maze[(x, y)] == MAZE.wall
                     and (x, y) not in generator.fourtytwo_coord):
@@ -0,0 +1,393 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  tiled.py                                          :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/16 09:12:05 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/16 09:12:05 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Tiled parallel generation for very large mazes.
+
+The cell grid is split into rectangular tiles. Each tile is carved into
+a spanning tree by a separate process, seeded from the maze seed and the
+tile position, and writes its cells straight into a shared memory buffer.
+The tiles are then joined by a random spanning tree over the tile graph:
+exactly one door is opened per chosen tile edge, so a perfect maze stays
+perfect.
+
+Cells are stored with the same wall encoding as the output file (one
+byte per cell, bit 0 = North, 1 = East, 2 = South, 3 = West).
+"""
+
+import random
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import AbstractSet, Any, Iterable, List, Set, Tuple
+
+from maze.maze_customization import ALGO_MODE
+from maze.output.maze_encoding import (NORTH, EAST, SOUTH, WEST, CLOSED,
+                                       decode_cells)
+
+
+def carve_cells(width: int, height: int, rng: random.Random,
+                algorithm: str = ALGO_MODE.rb,
+                blocked_cells: Iterable[int] = (),
+                blocked_walls: Iterable[Tuple[int, int]] = ()) -> bytearray:
+    """Carves a spanning tree over a `width` x `height` cell grid.
+
+    Every reachable cell is visited, so the result is a perfect maze on
+    its own. Blocked cells are left fully closed and blocked walls are
+    never opened (this is how the '42' pattern is preserved).
+
+    Args:
+        width: Number of cell columns.
+        height: Number of cell rows.
+        rng: Random generator used for every choice.
+        algorithm: `ALGO_MODE.rb` (iterative backtracking) or
+                   `ALGO_MODE.hunt_kill`.
+        blocked_cells: Row-major indexes of cells that must stay closed.
+        blocked_walls: Pairs of row-major indexes (lowest first) of
+                       adjacent cells whose shared wall must stay closed.
+
+    Returns:
+        bytearray: One wall nibble per cell, row-major.
+    """
+    size = width * height
+    cells = bytearray([CLOSED]) * size
+    visited = bytearray(size)
+    blocked = bytearray(size)
+    for index in blocked_cells:
+        visited[index] = 1
+        blocked[index] = 1
+    walls = set(blocked_walls)
+
+    def neighbours_of(i: int) -> List[Tuple[int, int, int]]:
+        """Lists the cells sharing an openable wall with cell `i`.
+
+        Each entry is `(cell, wall bit of i, wall bit of cell)`.
+        """
+        x, y = i % width, i // width
+        found = []
+        if y > 0 and (i - width, i) not in walls:
+            found.append((i - width, NORTH, SOUTH))
+        if x < width - 1 and (i, i + 1) not in walls:
+            found.append((i + 1, EAST, WEST))
+        if y < height - 1 and (i, i + width) not in walls:
+            found.append((i + width, SOUTH, NORTH))
+        if x > 0 and (i - 1, i) not in walls:
+            found.append((i - 1, WEST, EAST))
+        return found
+
+    def neighbours(i: int) -> List[Tuple[int, int, int]]:
+        """Lists the unvisited neighbours reachable from cell `i`."""
+        return [option for option in neighbours_of(i)
+                if not visited[option[0]]]
+
+    def open_wall(i: int, j: int, bit: int, opposite: int) -> None:
+        """Removes the wall shared by cells `i` and `j`."""
+        cells[i] &= ~bit
+        cells[j] &= ~opposite
+        visited[j] = 1
+
+    if algorithm == ALGO_MODE.hunt_kill:
+        hunt_row = 0
+        for start in range(size):
+            if visited[start]:
+                continue
+            visited[start] = 1
+            current = start
+            while current >= 0:
+                # Kill phase: random walk until stuck.
+                options = neighbours(current)
+                while options:
+                    nxt, bit, opposite = rng.choice(options)
+                    open_wall(current, nxt, bit, opposite)
+                    current = nxt
+                    options = neighbours(current)
+                # Hunt phase: first unvisited cell next to a visited one.
+                current = -1
+                while (hunt_row < height
+                       and all(visited[hunt_row * width:
+                                       (hunt_row + 1) * width])):
+                    hunt_row += 1
+                for i in range(hunt_row * width, size):
+                    if visited[i]:
+                        continue
+                    links = [(j, bit_j, bit_i)
+                             for j, bit_i, bit_j in neighbours_of(i)
+                             if visited[j] and not blocked[j]]
+                    if links:
+                        other, bit, opposite = rng.choice(links)
+                        open_wall(other, i, bit, opposite)
+                        current = i
+                        break
+        return cells
+
+    for start in range(size):
+        if visited[start]:
+            continue
+        visited[start] = 1
+        stack = [start]
+        while stack:
+            current = stack[-1]
+            options = neighbours(current)
+            if not options:
+                stack.pop()
+                continue
+            nxt, bit, opposite = rng.choice(options)
+            open_wall(current, nxt, bit, opposite)
+            stack.append(nxt)
+    return cells
+
+
+def _pattern_to_cells(pattern: AbstractSet[Tuple[int, int]]
+                      ) -> Tuple[Set[Tuple[int, int]],
+                                 Set[Tuple[Tuple[int, int], Tuple[int, int]]]]:
+    """Converts the block coordinates of the '42' pattern to cell terms.
+
+    Args:
+        pattern: The `(x, y)` block coordinates reserved for the pattern.
+
+    Returns:
+        Tuple: The blocked cells and the blocked walls (pairs of adjacent
+        cells), both in cell coordinates.
+    """
+    blocked_cells = set()
+    blocked_walls = set()
+    for block_x, block_y in pattern:
+        if block_x % 2 == 1 and block_y % 2 == 1:
+            blocked_cells.add((block_x // 2, block_y // 2))
+        elif block_x % 2 == 0 and block_y % 2 == 1:
+            cell = (block_x // 2, block_y // 2)
+            blocked_walls.add(((cell[0] - 1, cell[1]), cell))
+        elif block_x % 2 == 1 and block_y % 2 == 0:
+            cell = (block_x // 2, block_y // 2)
+            blocked_walls.add(((cell[0], cell[1] - 1), cell))
+    return blocked_cells, blocked_walls
+
+
+def _tile_starts(length: int, tile_size: int, keep_out: Tuple[int, int]
+                 ) -> List[int]:
+    """Computes where tiles start along one axis.
+
+    Tile borders falling inside the `keep_out` range are dropped so the
+    '42' pattern (and one cell around it) always lives in a single tile.
+
+    Args:
+        length: Number of cells along the axis.
+        tile_size: Requested tile size.
+        keep_out: Inclusive range of cells that must not be split.
+
+    Returns:
+        List[int]: The first cell of each tile, starting with 0.
+    """
+    low, high = keep_out
+    return [start for start in range(0, length, tile_size)
+            if start == 0 or not low < start <= high]
+
+
+def _carve_tile(shm_name: str, grid_width: int,
+                bounds: Tuple[int, int, int, int], seed: str, algorithm: str,
+                blocked_cells: List[int],
+                blocked_walls: List[Tuple[int, int]]) -> None:
+    """Worker entry point: carves one tile into the shared buffer.
+
+    Args:
+        shm_name: Name of the shared memory block holding the cell grid.
+        grid_width: Width of the whole cell grid.
+        bounds: `(x0, y0, width, height)` of the tile, in cells.
+        seed: Seed derived for this tile.
+        algorithm: Algorithm identifier passed to `carve_cells`.
+        blocked_cells: Tile-local indexes of the '42' cells.
+        blocked_walls: Tile-local index pairs of the '42' walls.
+    """
+    x0, y0, tile_width, tile_height = bounds
+    cells = carve_cells(tile_width, tile_height, random.Random(seed),
+                        algorithm, blocked_cells, blocked_walls)
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        buffer: Any = shm.buf
+        for row in range(tile_height):
+            offset = (y0 + row) * grid_width + x0
+            buffer[offset:offset + tile_width] = \
+                cells[row * tile_width:(row + 1) * tile_width]
+    finally:
+        shm.close()
+
+
+def _tile_cells(job: Tuple[Any, ...]) -> int:
+    """Returns the number of cells carved by a `_carve_tile` job."""
+    _, _, (_, _, tile_width, tile_height), _, _, blocked, _ = job
+    count: int = tile_width * tile_height - len(blocked)
+    return count
+
+
+def tiled_generation(generator: Any, rendering: bool) -> None:
+    """Generates the maze tile by tile across several processes.
+
+    The grid of `generator` must already be filled (see `_fill_maze`).
+    Tiles are carved in parallel, joined with a random spanning tree over
+    the tile graph, then written back into `generator.maze`.
+
+    Args:
+        generator: The `MazeGenerator` instance to carve. Its configuration
+                   provides `tile_size` and `workers`.
+        rendering: Unused; tiles are carved off-screen and the caller
+                   prints the final maze.
+
+    Raises:
+        MazeGenerationCancelled: If the deadline of `generator.progress`
+                                 is reached; it is checked after each tile.
+    """
+    grid_width = (generator.width - 1) // 2
+    grid_height = (generator.height - 1) // 2
+    tile_size = generator.cfg.tile_size
+    workers = getattr(generator.cfg, "workers", None)
+    seed = str(generator.seed)
+
+    pattern_cells, pattern_walls = _pattern_to_cells(
+        generator.fourtytwo_coord)
+    if pattern_cells:
+        xs = [x for x, _ in pattern_cells]
+        ys = [y for _, y in pattern_cells]
+        keep_x = (min(xs) - 1, max(xs) + 1)
+        keep_y = (min(ys) - 1, max(ys) + 1)
+    else:
+        keep_x = keep_y = (0, -1)
+
+    col_starts = _tile_starts(grid_width, tile_size, keep_x)
+    row_starts = _tile_starts(grid_height, tile_size, keep_y)
+    col_ends = col_starts[1:] + [grid_width]
+    row_ends = row_starts[1:] + [grid_height]
+
+    tiles = []
+    for y0, y1 in zip(row_starts, row_ends):
+        for x0, x1 in zip(col_starts, col_ends):
+            tile_width = x1 - x0
+            local = {(x, y): (y - y0) * tile_width + x - x0
+                     for x, y in pattern_cells | {c for w in pattern_walls
+                                                  for c in w}
+                     if x0 <= x < x1 and y0 <= y < y1}
+            blocked = [local[c] for c in pattern_cells if c in local]
+            walls = [(local[a], local[b]) for a, b in pattern_walls
+                     if a in local and b in local]
+            tiles.append(((x0, y0, tile_width, y1 - y0),
+                          f"{seed}/tile/{x0}/{y0}", blocked, walls))
+
+    size = grid_width * grid_height
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        jobs = [(shm.name, grid_width, bounds, tile_seed, generator.algorithm,
+                 blocked, walls)
+                for bounds, tile_seed, blocked, walls in tiles]
+        progress = generator.progress
+        if workers == 1 or len(jobs) == 1:
+            for job in jobs:
+                _carve_tile(*job)
+                if progress is not None:
+                    progress.advance(_tile_cells(job))
+                    progress.check()
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            try:
+                futures = {pool.submit(_carve_tile, *job): job
+                           for job in jobs}
+                for future in as_completed(futures):
+                    future.result()
+                    if progress is not None:
+                        progress.advance(_tile_cells(futures[future]))
+                        progress.check()
+            except BaseException:
+                # Cancelled: drop the tiles not started, without waiting
+                # for the ones being carved.
+                pool.shutdown(wait=False, cancel_futures=True)
+                raise
+            pool.shutdown()
+
+        _join_tiles(shm.buf, grid_width, col_starts, row_starts,
+                    col_ends, row_ends, pattern_cells, pattern_walls,
+                    random.Random(f"{seed}/join"))
+        decode_cells(generator, shm.buf)
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def _join_tiles(cells: Any, grid_width: int, col_starts: List[int],
+                row_starts: List[int], col_ends: List[int],
+                row_ends: List[int], pattern_cells: Set[Tuple[int, int]],
+                pattern_walls: Set[Tuple[Tuple[int, int], Tuple[int, int]]],
+                rng: random.Random) -> None:
+    """Connects the tiles with a random spanning tree (Kruskal).
+
+    One door is opened on each chosen tile edge, at a random position
+    where neither cell nor the wall belongs to the '42' pattern.
+
+    Args:
+        cells: The writable cell buffer.
+        grid_width: Width of the whole cell grid.
+        col_starts: First column of each tile column.
+        row_starts: First row of each tile row.
+        col_ends: End column (excluded) of each tile column.
+        row_ends: End row (excluded) of each tile row.
+        pattern_cells: Cells reserved to the '42' pattern.
+        pattern_walls: Walls reserved to the '42' pattern.
+        rng: Random generator used for the tree and the doors.
+    """
+    columns, rows = len(col_starts), len(row_starts)
+    parent = list(range(columns * rows))
+
+    def find(tile: int) -> int:
+        while parent[tile] != tile:
+            parent[tile] = parent[parent[tile]]
+            tile = parent[tile]
+        return tile
+
+    edges = []
+    for row in range(rows):
+        for col in range(columns):
+            if col + 1 < columns:
+                edges.append((row, col, EAST))
+            if row + 1 < rows:
+                edges.append((row, col, SOUTH))
+    rng.shuffle(edges)
+
+    def usable(a: Tuple[int, int], b: Tuple[int, int]) -> bool:
+        return (a not in pattern_cells and b not in pattern_cells
+                and (a, b) not in pattern_walls)
+
+    for row, col, direction in edges:
+        tile = row * columns + col
+        other = tile + 1 if direction == EAST else tile + columns
+        root_a, root_b = find(tile), find(other)
+        if root_a == root_b:
+            continue
+
+        if direction == EAST:
+            x = col_ends[col] - 1
+            doors = [((x, y), (x + 1, y))
+                     for y in range(row_starts[row], row_ends[row])]
+        else:
+            y = row_ends[row] - 1
+            doors = [((x, y), (x, y + 1))
+                     for x in range(col_starts[col], col_ends[col])]
+        doors = [door for door in doors if usable(*door)]
+        if not doors:
+            continue
+
+        (ax, ay), (bx, by) = rng.choice(doors)
+        a = ay * grid_width + ax
+        b = by * grid_width + bx
+        if direction == EAST:
+            cells[a] &= ~EAST
+            cells[b] &= ~WEST
+        else:
+            cells[a] &= ~SOUTH
+            cells[b] &= ~NORTH
+        parent[root_a] = root_b
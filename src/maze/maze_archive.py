@@ -0,0 +1,416 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_archive.py                                   :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/23 09:31:26 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/23 09:31:26 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Archive of many mazes in one file, with random access.
+
+A batch run stores its mazes back to back in a single `.mza` file
+instead of one small output file each. The archive is made of two files,
+three with aliases:
+
+- `name.mza`: the magic `MZA1`, then the records, each one a maze in the
+  binary format of `Maze.to_bytes` (a record describes its own size, so
+  the file can also be read sequentially).
+- `name.mza.idx`: the magic `MZI1`, then one fixed-size entry per maze:
+  the key of the maze (16 bytes of its configuration hash), the offset of
+  its record and its size.
+- `name.mza.aliases` (only if needed): the seeds of the aliases, as JSON
+  Lines. An alias is an index entry pointing to the record of an earlier,
+  identical maze (see `maze_dedupe`): the maze is stored once, and each
+  seed that produced it only costs an index entry.
+
+Both files are read through `mmap`: maze #k is found at a computed
+position of the index and loaded without reading any other record. The
+lookup by key builds a dict from the index on first use.
+
+Records are only appended. The data of a record is written before its
+index entry, so an interrupted append leaves, at worst, data that no
+entry points to; it is cut off when the archive is opened for appending.
+"""
+
+import json
+import mmap
+import os
+import struct
+
+from typing import Any, Dict, Iterator, List, Tuple
+
+from .maze_errors import MazeError
+from .maze_result import Maze
+from .output.maze_codecs import MZB_HEADER, SEED_INT, SEED_STR
+from .output.maze_encoding import fingerprint
+
+ARCHIVE_SUFFIX = ".mza"
+INDEX_SUFFIX = ".idx"
+ALIASES_SUFFIX = ".aliases"
+
+_DATA_MAGIC = b"MZA1"
+_INDEX_MAGIC = b"MZI1"
+# Key, offset and size of a record. The top bit of the size marks an
+# alias.
+_ENTRY = struct.Struct("<16sQQ")
+_ALIAS = 1 << 63
+KEY_SIZE = 16
+
+
+def archive_key(key: str | bytes) -> bytes:
+    """Returns the 16 bytes stored in the index for `key`.
+
+    Args:
+        key: A hexadecimal key (as computed by `MazeCache.key`) or raw
+             bytes.
+
+    Returns:
+        bytes: The first `KEY_SIZE` bytes of the key, zero padded.
+    """
+    raw = bytes.fromhex(key) if isinstance(key, str) else bytes(key)
+    return raw[:KEY_SIZE].ljust(KEY_SIZE, b"\0")
+
+
+class MazeArchive():
+    """Read-only, memory-mapped view of a maze archive.
+
+    Example:
+        >>> with MazeArchive("batch.mza") as archive:
+        ...     maze = archive[42]
+
+    Attributes:
+        path (str): The path of the `.mza` file.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Opens and maps the archive and its index.
+
+        Args:
+            path: The `.mza` file; its index is `path + '.idx'`.
+
+        Raises:
+            FileNotFoundError: If the archive or its index is missing.
+            MazeError: If the files are not a maze archive.
+        """
+        self.path = path
+        self._files = [open(path, 'rb'), open(path + INDEX_SUFFIX, 'rb')]
+        self._maps: List[mmap.mmap] = []
+        self._keys: Dict[bytes, int] | None = None
+        self._alias_seeds: Dict[int, Any] | None = None
+        try:
+            for file in self._files:
+                self._maps.append(mmap.mmap(file.fileno(), 0,
+                                            access=mmap.ACCESS_READ))
+        except ValueError:
+            self.close()
+            raise MazeError("Not a maze archive")
+        self._data, self._index = self._maps
+        if (self._data[:4] != _DATA_MAGIC
+                or self._index[:4] != _INDEX_MAGIC):
+            self.close()
+            raise MazeError("Not a maze archive")
+        self._count = (len(self._index) - 4) // _ENTRY.size
+
+    def __enter__(self) -> "MazeArchive":
+        """Returns the archive itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Unmaps and closes the files."""
+        self.close()
+
+    def close(self) -> None:
+        """Unmaps and closes the files."""
+        for mapping in self._maps:
+            mapping.close()
+        for file in self._files:
+            file.close()
+        self._maps = []
+
+    def __len__(self) -> int:
+        """Returns the number of mazes in the archive."""
+        return self._count
+
+    def __iter__(self) -> Iterator[Maze]:
+        """Yields the mazes, in the order they were appended."""
+        for index in range(self._count):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> Maze:
+        """Loads maze #`index`, without reading the other records.
+
+        Args:
+            index: The position of the maze (negative counts from the end).
+
+        Returns:
+            Maze: The maze. For an alias, the seed is its own one.
+
+        Raises:
+            IndexError: If there is no such maze.
+            MazeError: If the record is damaged.
+        """
+        maze = Maze.from_bytes(self.record(index))
+        if self.is_alias(index):
+            if self._alias_seeds is None:
+                self._alias_seeds = _read_aliases(self.path)
+            maze = maze._replace(seed=self._alias_seeds.get(
+                index % self._count, maze.seed))
+        return maze
+
+    def record(self, index: int) -> bytes:
+        """Returns the raw record of maze #`index` (its binary format).
+
+        Args:
+            index: The position of the maze (negative counts from the end).
+
+        Returns:
+            bytes: The record, as written by `Maze.to_bytes`.
+
+        Raises:
+            IndexError: If there is no such maze.
+            MazeError: If the index points outside of the archive.
+        """
+        _, offset, size = self._entry(index)
+        size &= ~_ALIAS
+        if offset + size > len(self._data):
+            raise MazeError("Truncated maze data")
+        return self._data[offset:offset + size]
+
+    def key(self, index: int) -> bytes:
+        """Returns the key stored for maze #`index`.
+
+        Args:
+            index: The position of the maze (negative counts from the end).
+
+        Returns:
+            bytes: The `KEY_SIZE` bytes of its key.
+        """
+        key: bytes = self._entry(index)[0]
+        return key
+
+    def is_alias(self, index: int) -> bool:
+        """Tells if maze #`index` shares the record of an earlier maze.
+
+        Args:
+            index: The position of the maze (negative counts from the end).
+
+        Returns:
+            bool: True for an alias.
+        """
+        return bool(self._entry(index)[2] & _ALIAS)
+
+    def fingerprint(self, index: int) -> bytes:
+        """Returns the fingerprint of maze #`index` (see `Maze.fingerprint`),
+        computed on its packed cells without decoding them.
+
+        Args:
+            index: The position of the maze (negative counts from the end).
+
+        Returns:
+            bytes: The fingerprint.
+        """
+        record = self.record(index)
+        (_, width, height, entry_x, entry_y, exit_x, exit_y, _, seed_size,
+         moves) = MZB_HEADER.unpack_from(record)
+        packed = memoryview(record)[MZB_HEADER.size + seed_size + moves:]
+        return fingerprint(width, height, (entry_x, entry_y),
+                           (exit_x, exit_y), packed)
+
+    def seed(self, index: int) -> str | int | None:
+        """Returns the seed of maze #`index`, without decoding the maze.
+
+        Args:
+            index: The position of the maze (negative counts from the end).
+
+        Returns:
+            str | int | None: Its seed; for an alias, its own one.
+        """
+        if self.is_alias(index):
+            if self._alias_seeds is None:
+                self._alias_seeds = _read_aliases(self.path)
+            if index % self._count in self._alias_seeds:
+                alias_seed: str | int | None = \
+                    self._alias_seeds[index % self._count]
+                return alias_seed
+        record = self.record(index)
+        kind, seed_size = MZB_HEADER.unpack_from(record)[7:9]
+        seed = record[MZB_HEADER.size:MZB_HEADER.size + seed_size]
+        if kind == SEED_INT:
+            return int(seed)
+        if kind == SEED_STR:
+            return seed.decode()
+        return None
+
+    def _entry(self, index: int) -> Tuple[bytes, int, int]:
+        """Returns the key, offset and size (with its alias flag) of maze
+        #`index`."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(f"No maze #{index} in {self.path}")
+        key, offset, size = _ENTRY.unpack_from(self._index,
+                                               4 + index * _ENTRY.size)
+        return key, offset, size
+
+    def find(self, key: str | bytes) -> int | None:
+        """Returns the position of the first maze stored under `key`.
+
+        Args:
+            key: A key given to `MazeArchiveWriter.append`.
+
+        Returns:
+            int | None: The position, or None if the key is not stored.
+        """
+        if self._keys is None:
+            self._keys = {}
+            for index in range(self._count - 1, -1, -1):
+                self._keys[self.key(index)] = index
+        return self._keys.get(archive_key(key))
+
+
+def _read_aliases(path: str) -> Dict[int, Any]:
+    """Reads the seeds of the aliases of the archive at `path`.
+
+    Args:
+        path: The `.mza` file.
+
+    Returns:
+        Dict[int, Any]: The seed of each alias, by position.
+    """
+    seeds: Dict[int, Any] = {}
+    try:
+        with open(path + ALIASES_SUFFIX, 'r') as file:
+            for line in file:
+                try:
+                    alias = json.loads(line)
+                    seeds[alias["maze"]] = alias["seed"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+    except FileNotFoundError:
+        pass
+    return seeds
+
+
+class MazeArchiveWriter():
+    """Appends mazes to an archive, creating it if needed.
+
+    Example:
+        >>> with MazeArchiveWriter("batch.mza") as archive:
+        ...     archive.append(maze, key)
+    """
+
+    def __init__(self, path: str) -> None:
+        """Opens the archive for appending.
+
+        A record whose index entry is missing (an interrupted append) is
+        cut off first.
+
+        Args:
+            path: The `.mza` file; its index is `path + '.idx'`.
+
+        Raises:
+            MazeError: If the files exist but are not a maze archive.
+        """
+        self.path = path
+        index_path = path + INDEX_SUFFIX
+        new = not os.path.exists(path) or not os.path.exists(index_path)
+        self._data = open(path, 'w+b' if new else 'r+b')
+        self._index = open(index_path, 'w+b' if new else 'r+b')
+        if new:
+            self._data.write(_DATA_MAGIC)
+            self._index.write(_INDEX_MAGIC)
+            self._count = 0
+            self._end = len(_DATA_MAGIC)
+            return
+
+        if (self._data.read(4) != _DATA_MAGIC
+                or self._index.read(4) != _INDEX_MAGIC):
+            self.close()
+            raise MazeError("Not a maze archive")
+        self._count = (os.fstat(self._index.fileno()).st_size - 4) \
+            // _ENTRY.size
+        # The data ends with the record of the last entry that is not an
+        # alias.
+        self._end = len(_DATA_MAGIC)
+        for position in range(self._count - 1, -1, -1):
+            self._index.seek(4 + position * _ENTRY.size)
+            _, offset, size = _ENTRY.unpack(self._index.read(_ENTRY.size))
+            if not size & _ALIAS:
+                self._end = offset + size
+                break
+        self._index.truncate(4 + self._count * _ENTRY.size)
+        self._index.seek(0, os.SEEK_END)
+        self._data.truncate(self._end)
+        self._data.seek(self._end)
+
+    def __enter__(self) -> "MazeArchiveWriter":
+        """Returns the writer itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Flushes and closes the files."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Returns the number of mazes in the archive."""
+        return self._count
+
+    def close(self) -> None:
+        """Flushes and closes the files."""
+        self._data.close()
+        self._index.close()
+
+    def append(self, maze: Maze, key: str | bytes) -> int:
+        """Appends a maze at the end of the archive.
+
+        Args:
+            maze: The maze to store.
+            key: Its key, usually `MazeCache.key` of its generator.
+
+        Returns:
+            int: The position of the maze in the archive.
+        """
+        record = maze.to_bytes()
+        self._data.write(record)
+        self._data.flush()
+        self._index.write(_ENTRY.pack(archive_key(key), self._end,
+                                      len(record)))
+        self._index.flush()
+        self._end += len(record)
+        self._count += 1
+        return self._count - 1
+
+    def alias(self, original: int, key: str | bytes,
+              seed: str | int | None) -> int:
+        """Appends a maze identical to maze #`original`, without storing
+        its record again.
+
+        Args:
+            original: The position of the identical maze.
+            key: The key of the new maze.
+            seed: The seed of the new maze, kept in the aliases file.
+
+        Returns:
+            int: The position of the new maze in the archive.
+
+        Raises:
+            IndexError: If there is no maze #`original`.
+        """
+        if not 0 <= original < self._count:
+            raise IndexError(f"No maze #{original} in {self.path}")
+        self._index.seek(4 + original * _ENTRY.size)
+        _, offset, size = _ENTRY.unpack(self._index.read(_ENTRY.size))
+        self._index.seek(0, os.SEEK_END)
+        position = self._count
+        with open(self.path + ALIASES_SUFFIX, 'a') as file:
+            file.write(json.dumps({"maze": position, "same_as": original,
+                                   "seed": seed}) + "\n")
+        self._index.write(_ENTRY.pack(archive_key(key), offset,
+                                      size | _ALIAS))
+        self._index.flush()
+        self._count += 1
+        return position
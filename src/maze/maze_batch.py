@@ -0,0 +1,454 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_batch.py                                     :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/20 14:31:50 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/20 14:31:50 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Bulk loading of maze specifications.
+
+A batch job describes many mazes in a single file, one spec per record:
+
+- JSON Lines (`.jsonl`, `.ndjson`): one object per line, with the keys of
+  the config file, e.g. `{"width": 20, "height": 15, "entry": "0,0", ...}`.
+- CSV (`.csv`): a header line with the keys, then one spec per line.
+  An empty cell is a missing key.
+
+Specs are validated one record at a time, with the rules and messages of
+`MazeConfig` (see `maze_rules`). Building a pydantic model costs more than
+the checks themselves, so a record whose fields already have the expected
+types is checked with plain Python, with memoized conversions (the
+values of a batch repeat a lot). Any other record goes through
+`MazeConfig`, which gives the exact same result as the config file.
+"""
+
+import csv
+import json
+import re
+
+from functools import lru_cache
+from pathlib import Path
+from typing import (Any, Callable, Dict, Iterator, List, Mapping, NamedTuple,
+                    TextIO, Tuple)
+
+from . import maze_rules as rules
+from .maze_errors import MazeConfigError
+
+JSONL_SUFFIXES = (".jsonl", ".ndjson")
+CSV_SUFFIXES = (".csv",)
+JSONL_CHUNK = 1024
+
+_OUTPUT_FILE = re.compile(rules.OUTPUT_FILE_PATTERN)
+_BOOLEANS = {"true": True, "false": False}
+_MISSING = object()
+
+
+class MazeSpec(NamedTuple):
+    """A validated maze specification, lighter than a `MazeConfig`.
+
+    It has the fields of `MazeConfig`, already normalized, and can be
+    given to `MazeGenerator` in place of one. Being a tuple, it is
+    immutable and cheap to build.
+
+    Attributes:
+        width (int): Grid width, in cells.
+        height (int): Grid height, in cells.
+        entry (Tuple[int, int]): Coordinates (x, y) of the starting point.
+        exit (Tuple[int, int]): Coordinates (x, y) of the ending point.
+        output_file (str): Path for the output file.
+        perfect (bool): If True, generates a perfect maze (no loops).
+        seed (str | int | None): Seed for the random number generator.
+        display (str | None): Rendering mode ('ascii' or 'emoji').
+        algorithm (str | None): Algorithm choice ('rb' or 'huntandkill').
+        tile_size (int | None): Tile size of the tiled generation.
+        workers (int | None): Number of processes of the tiled generation.
+        grid_file (str | None): File of the memory-mapped block grid.
+    """
+    width: int
+    height: int
+    entry: Tuple[int, int]
+    exit: Tuple[int, int]
+    output_file: str
+    perfect: bool
+    seed: str | int | None = None
+    display: str | None = "ascii"
+    algorithm: str | None = "rb"
+    tile_size: int | None = None
+    workers: int | None = None
+    grid_file: str | None = None
+
+    @classmethod
+    def from_mapping(cls, raw: Mapping[str, Any]) -> "MazeSpec":
+        """Validates a spec given as a field -> value mapping.
+
+        Args:
+            raw: The spec, with lowercase keys. Values may be strings, as
+                 read from a config file, or already typed.
+
+        Returns:
+            MazeSpec: The validated spec.
+
+        Raises:
+            MazeConfigError: With the message `MazeConfig` would give.
+        """
+        spec = _fast_spec(raw)
+        if spec is None:
+            spec = _checked_spec(raw)
+        return spec
+
+    def model_dump(self) -> Dict[str, Any]:
+        """Returns the fields as a dict, like `MazeConfig.model_dump`.
+
+        Returns:
+            Dict[str, Any]: The field -> value mapping.
+        """
+        return self._asdict()
+
+
+def load_specs(filepath: str,
+               errors: List[Tuple[int, str]] | None = None
+               ) -> Iterator[MazeSpec]:
+    """Reads and validates the specs of a batch file, one at a time.
+
+    The file is streamed: memory does not grow with the number of specs.
+    Blank lines (and, in JSON Lines, lines starting with '#') are skipped.
+
+    Args:
+        filepath: A `.jsonl`, `.ndjson` or `.csv` file.
+        errors: If given, invalid specs are skipped and recorded in it as
+                `(line, message)` pairs. Otherwise the first invalid spec
+                stops the loading.
+
+    Yields:
+        MazeSpec: Each valid spec, in file order.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+        MazeConfigError: If the file type is unknown, or on the first
+                         invalid spec when `errors` is None. The message
+                         starts with the line of the spec.
+    """
+    path = Path(filepath)
+    if not path.is_file():
+        raise FileNotFoundError("Missing spec file")
+
+    suffix = path.suffix.lower()
+    if suffix in JSONL_SUFFIXES:
+        read_records = _read_jsonl
+    elif suffix in CSV_SUFFIXES:
+        read_records = _read_csv
+    else:
+        raise MazeConfigError("Spec file must end with "
+                              f"{list(JSONL_SUFFIXES + CSV_SUFFIXES)}")
+
+    with open(path, 'r', newline='') as file:
+        for line, raw in read_records(file):
+            try:
+                if isinstance(raw, str):
+                    raise MazeConfigError(raw)
+                if not raw.keys() <= rules.CONFIG_KEYS:
+                    raw = _lower_keys(raw, line)
+                spec = _fast_spec(raw)
+                yield spec if spec is not None else _checked_spec(raw)
+            except MazeConfigError as e:
+                if errors is None:
+                    raise MazeConfigError(f"Spec at line {line}: {e}")
+                errors.append((line, str(e)))
+
+
+def _read_jsonl(file: TextIO) -> Iterator[Tuple[int, Dict[str, Any] | str]]:
+    """Yields the records of a JSON Lines file.
+
+    Lines are decoded `JSONL_CHUNK` at a time, as a single JSON array: one
+    call to the decoder costs about as much as decoding a short line.
+
+    Args:
+        file: The open file.
+
+    Yields:
+        Tuple[int, Dict[str, Any] | str]: The line number and the record,
+        or an error message if the line is not a JSON object.
+    """
+    chunk: List[Tuple[int, str]] = []
+    for i, line in enumerate(file, 1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        chunk.append((i, line))
+        if len(chunk) == JSONL_CHUNK:
+            yield from _decode_chunk(chunk)
+            chunk = []
+    yield from _decode_chunk(chunk)
+
+
+def _decode_chunk(chunk: List[Tuple[int, str]]
+                  ) -> Iterator[Tuple[int, Dict[str, Any] | str]]:
+    """Decodes JSON lines, all at once if they are all valid.
+
+    Args:
+        chunk: The `(line number, line)` pairs.
+
+    Yields:
+        Tuple[int, Dict[str, Any] | str]: The line number and the record,
+        or an error message if the line is not a JSON object.
+    """
+    try:
+        records = json.loads("[" + ",".join(line for _, line in chunk) + "]")
+    except ValueError:
+        records = None
+    # A line holding "1, 2" would give two items: decode line by line.
+    if records is None or len(records) != len(chunk):
+        records = []
+        for _, line in chunk:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                records.append(None)
+
+    for (i, line), record in zip(chunk, records):
+        if type(record) is dict:
+            yield i, record
+        else:
+            yield i, f"Error at line {i} ({line})"
+
+
+def _read_csv(file: TextIO) -> Iterator[Tuple[int, Dict[str, Any] | str]]:
+    """Yields the records of a CSV file with a header line.
+
+    Args:
+        file: The open file.
+
+    Yields:
+        Tuple[int, Dict[str, Any] | str]: The line number and the record
+        (without its empty cells), or an error message if the line has
+        more cells than the header.
+    """
+    reader = csv.reader(file)
+    header = next(reader, [])
+    for row in reader:
+        line = reader.line_num
+        if len(row) > len(header):
+            yield line, f"Error at line {line} (too many values)"
+        elif row:
+            yield line, {key: value for key, value in zip(header, row)
+                         if value and not value.isspace()}
+
+
+def _lower_keys(raw: Dict[str, Any], line: int) -> Dict[str, Any]:
+    """Normalizes the keys of a record, like the config file parser.
+
+    Args:
+        raw: The record.
+        line: Its line number, for the error message.
+
+    Returns:
+        Dict[str, Any]: The record with stripped lowercase keys.
+
+    Raises:
+        MazeConfigError: If a key is not a configuration key.
+    """
+    spec = {}
+    for key, value in raw.items():
+        key = key.strip().lower()
+        if key not in rules.CONFIG_KEYS:
+            raise MazeConfigError(f"Key: '{key}' at line {line} is not valid")
+        spec[key] = value
+    return spec
+
+
+# The converters below return None when `MazeConfig` has to decide. The
+# values of a batch repeat a lot (sizes, coordinates, modes), so the
+# conversions are memoized on the raw values, and so are the combinations
+# of values below. `typed` keeps `1` and `True` apart.
+
+@lru_cache(maxsize=1024, typed=True)
+def _to_int(value: Any, minimum: int) -> int | None:
+    """Converts an int or a string of digits, with a lower bound."""
+    if type(value) is str:
+        value = value.strip()
+        if not (value.isascii() and value.isdigit()):
+            return None
+        value = int(value)
+    if type(value) is not int or value < minimum:
+        return None
+    return value
+
+
+@lru_cache(maxsize=65536, typed=True)
+def _to_coordinate(value: Any) -> Tuple[int, int] | None:
+    """Converts a "x,y" string or a pair of ints to a coordinate."""
+    try:
+        value = rules.parse_coordinate(
+            value.strip() if type(value) is str else value)
+    except ValueError:
+        return None
+    if (type(value) is tuple and len(value) == 2
+            and type(value[0]) is int and type(value[1]) is int):
+        return value
+    return None
+
+
+def _to_mode(value: Any, normalize: Callable[[str | None], str]
+             ) -> str | None:
+    """Normalizes a display or algorithm mode."""
+    if value is not None and type(value) is not str:
+        return None
+    try:
+        return normalize(value.strip() if value is not None else None)
+    except MazeConfigError:
+        return None
+
+
+def _as_tuple(value: Any) -> Any:
+    """Turns a JSON list into a tuple, so it can be memoized."""
+    return tuple(value) if type(value) is list else value
+
+
+@lru_cache(maxsize=65536, typed=True)
+def _layout(width: Any, height: Any, entry: Any, exit: Any
+            ) -> Tuple[int, int, Tuple[int, int], Tuple[int, int],
+                       str | None] | None:
+    """Converts and checks the size, the entry and the exit.
+
+    The error of a misplaced entry or exit is returned rather than raised:
+    `MazeConfig` only reports it once all the fields are valid.
+
+    Returns:
+        Tuple | None: The converted fields and the error message (None if
+        they are valid), or None if `MazeConfig` has to decide.
+    """
+    size_x = _to_int(width, rules.MIN_SIZE)
+    size_y = _to_int(height, rules.MIN_SIZE)
+    start = _to_coordinate(entry)
+    end = _to_coordinate(exit)
+    if size_x is None or size_y is None or start is None or end is None:
+        return None
+    try:
+        rules.check_layout(size_x, size_y, start, end)
+    except MazeConfigError as e:
+        return size_x, size_y, start, end, str(e)
+    return size_x, size_y, start, end, None
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _options(perfect: Any, display: Any, algorithm: Any, tile_size: Any,
+             workers: Any) -> Tuple[bool, str, str, int | None,
+                                    int | None] | None:
+    """Converts the other fields, but the output file and the seed.
+
+    `display` is the `_MISSING` marker when the key is absent: it then
+    defaults to "ascii", while a null display means "emoji" (like
+    `MazeConfig`).
+
+    Returns:
+        Tuple | None: The converted fields, or None if `MazeConfig` has
+        to decide.
+    """
+    if type(perfect) is str:
+        perfect = _BOOLEANS.get(perfect.strip().lower())
+    if display is _MISSING:
+        display = "ascii"
+    else:
+        display = _to_mode(display, rules.normalize_display)
+    algorithm = _to_mode(algorithm, rules.normalize_algorithm)
+    if type(perfect) is not bool or display is None or algorithm is None:
+        return None
+
+    if tile_size is not None:
+        tile_size = _to_int(tile_size, rules.MIN_TILE_SIZE)
+        if tile_size is None:
+            return None
+    if workers is not None:
+        workers = _to_int(workers, rules.MIN_WORKERS)
+        if workers is None:
+            return None
+    return perfect, display, algorithm, tile_size, workers
+
+
+def _fast_spec(raw: Mapping[str, Any]) -> MazeSpec | None:
+    """Validates a record without pydantic, when its fields are clear.
+
+    Only the cross-field checks can fail here: as soon as a field has an
+    unusual type or an invalid value, the record is left to `MazeConfig`,
+    which knows how to coerce it and which error to report.
+
+    Args:
+        raw: The record, with lowercase keys.
+
+    Returns:
+        MazeSpec | None: The spec, or None if `MazeConfig` has to decide.
+
+    Raises:
+        MazeConfigError: If the entry or the exit is misplaced.
+    """
+    get = raw.get
+    try:
+        layout = _layout(get("width"), get("height"),
+                         _as_tuple(get("entry")), _as_tuple(get("exit")))
+        options = _options(get("perfect"), get("display", _MISSING),
+                           get("algorithm"), get("tile_size"),
+                           get("workers"))
+    except TypeError:
+        # An unhashable value, left to `MazeConfig`.
+        return None
+    if layout is None or options is None:
+        return None
+
+    output_file = get("output_file")
+    if type(output_file) is not str:
+        return None
+    output_file = output_file.strip()
+    if '\n' in output_file or not _OUTPUT_FILE.search(output_file):
+        return None
+
+    grid_file = get("grid_file")
+    if type(grid_file) is str:
+        grid_file = grid_file.strip()
+        if not grid_file:
+            return None
+    elif grid_file is not None:
+        return None
+
+    seed = get("seed")
+    if type(seed) is str:
+        seed = seed.strip()
+    elif seed is not None and type(seed) is not int:
+        return None
+
+    width, height, entry, exit, error = layout
+    if error is not None:
+        raise MazeConfigError(error)
+    perfect, display, algorithm, tile_size, workers = options
+    return MazeSpec(width, height, entry, exit, output_file, perfect, seed,
+                    display, algorithm, tile_size, workers, grid_file)
+
+
+def _checked_spec(raw: Mapping[str, Any]) -> MazeSpec:
+    """Validates a record with `MazeConfig`.
+
+    Args:
+        raw: The record, with lowercase keys.
+
+    Returns:
+        MazeSpec: The spec built from the validated model.
+
+    Raises:
+        MazeConfigError: With the message of the config file parser.
+    """
+    from pydantic import ValidationError
+
+    from .maze_config import MazeConfig
+
+    values: Dict[str, Any] = {
+        key: value.strip() if isinstance(value, str) else value
+        for key, value in raw.items()}
+    try:
+        config = MazeConfig(**values)
+    except ValidationError as e:
+        raise MazeConfigError(rules.describe_errors(e.errors()))
+    return MazeSpec(**config.model_dump())
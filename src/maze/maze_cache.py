@@ -0,0 +1,217 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_cache.py                                     :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/17 11:05:12 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/17 11:05:12 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Content-addressed cache of generated mazes.
+
+The same configuration and seed always produce the same maze, so the
+result of a generation (the packed cells and the solution moves) can be
+stored under a hash of the validated configuration. The cache keeps the
+most recently used results in memory and, optionally, on disk; both
+levels are bounded and evict the least recently used entries first.
+"""
+
+import hashlib
+import json
+import os
+
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+# Bump whenever a change to the algorithms changes the generated mazes,
+# so results cached by an older version are never reused. Version 2
+# writes the '42' pattern as fully closed cells.
+ALGORITHM_VERSION = 2
+
+_MAGIC = b"MZC1"
+
+
+class CachedMaze(NamedTuple):
+    """A generation result stored in the cache.
+
+    Attributes:
+        cells: The packed cell nibbles (see `pack_cells`).
+        directions: The solution moves from entry to exit.
+    """
+    cells: bytes
+    directions: str
+
+
+class MazeCache():
+    """Two-level (memory, then disk) LRU cache of generation results.
+
+    Attributes:
+        directory (Path | None): Where results are stored on disk. If None,
+            the cache is in memory only.
+        max_entries (int): Maximum number of results kept in memory.
+        max_bytes (int): Maximum total size of the files on disk.
+    """
+
+    def __init__(self, directory: str | None = None, max_entries: int = 128,
+                 max_bytes: int = 64 * 1024 * 1024) -> None:
+        """Initializes the cache and scans the disk store if any.
+
+        Args:
+            directory: Folder of the disk store (created if missing), or
+                       None for a memory only cache.
+            max_entries: Maximum number of results kept in memory.
+            max_bytes: Maximum size of the disk store, in bytes.
+        """
+        self.directory = Path(directory) if directory is not None else None
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._memory: OrderedDict[str, CachedMaze] = OrderedDict()
+        self._written: Dict[str, Tuple[str, int, int]] = {}
+        self._disk_size = 0
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._disk_size = sum(entry.stat().st_size
+                                  for entry in self.directory.glob("*.mzc"))
+
+    @staticmethod
+    def key(generator: Any) -> str:
+        """Computes the cache key of a generator.
+
+        The key is a hash of every setting that changes the generated
+        maze (not the display or the output file), of the seed actually
+        used and of `ALGORITHM_VERSION`.
+
+        Args:
+            generator: The `MazeGenerator` about to generate.
+
+        Returns:
+            str: The hexadecimal key.
+        """
+        cfg = generator.cfg
+        canonical = json.dumps({
+            "version": ALGORITHM_VERSION,
+            "width": cfg.width,
+            "height": cfg.height,
+            "entry": list(cfg.entry),
+            "exit": list(cfg.exit),
+            "perfect": generator.perfect,
+            "seed": generator.seed,
+            "algorithm": str(generator.algorithm),
+            "tile_size": getattr(cfg, "tile_size", None),
+        }, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[CachedMaze]:
+        """Looks a result up, in memory first, then on disk.
+
+        Args:
+            key: A key computed by `MazeCache.key`.
+
+        Returns:
+            CachedMaze | None: The stored result, or None on a miss.
+        """
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+            return result
+
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.mzc"
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except OSError:
+            return None
+        if data[:4] != _MAGIC:
+            return None
+
+        length = int.from_bytes(data[4:8], "little")
+        result = CachedMaze(data[8 + length:],
+                            data[8:8 + length].decode("ascii"))
+        self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: CachedMaze) -> None:
+        """Stores a result in memory and on disk.
+
+        Args:
+            key: A key computed by `MazeCache.key`.
+            result: The result to store.
+        """
+        self._remember(key, result)
+        if self.directory is None:
+            return
+
+        path = self.directory / f"{key}.mzc"
+        if path.exists():
+            return
+        directions = result.directions.encode("ascii")
+        data = (_MAGIC + len(directions).to_bytes(4, "little") + directions
+                + result.cells)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        self._disk_size += len(data)
+        self._evict_disk()
+
+    def output_is_current(self, output_file: str, key: str) -> bool:
+        """Tells if `output_file` still holds the result of `key`.
+
+        Only files written through `record_output` by this cache are
+        trusted, and only while their size and modification time are
+        unchanged.
+
+        Args:
+            output_file: Path of the output file.
+            key: The key of the result about to be written.
+
+        Returns:
+            bool: True if writing the file again can be skipped.
+        """
+        record = self._written.get(output_file)
+        if record is None or record[0] != key:
+            return False
+        try:
+            stat = os.stat(output_file)
+        except OSError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) == record[1:]
+
+    def record_output(self, output_file: str, key: str) -> None:
+        """Remembers that `output_file` was just written for `key`.
+
+        Args:
+            output_file: Path of the output file.
+            key: The key of the result written in it.
+        """
+        stat = os.stat(output_file)
+        self._written[output_file] = (key, stat.st_mtime_ns, stat.st_size)
+
+    def _remember(self, key: str, result: CachedMaze) -> None:
+        """Inserts a result in the memory level, evicting if needed."""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        """Removes the least recently used files above `max_bytes`."""
+        if self.directory is None or self._disk_size <= self.max_bytes:
+            return
+        entries = sorted(self.directory.glob("*.mzc"),
+                         key=lambda entry: entry.stat().st_mtime_ns)
+        for entry in entries:
+            if self._disk_size <= self.max_bytes:
+                break
+            try:
+                size = entry.stat().st_size
+                entry.unlink()
+            except OSError:
+                continue
+            self._disk_size -= size
@@ -0,0 +1,192 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_cell_solver.py                               :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/03/01 10:04:37 by roandrie        #+#    #+#               #
+#  Updated: 2026/03/01 10:04:37 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Shortest path on the cell graph of a maze, read from its wall nibbles.
+
+`MazeSolver` searches the block grid of a `MazeGenerator`: four blocks per
+cell, and a generator to build them. The output file already holds the
+walls of each cell (see `maze_encoding`): a `CellSolver` searches the
+W x H cells directly, stepping to a neighbour when the wall between them
+is open, so a `Maze` or a maze file is solved without regenerating it.
+
+The BFS explores the neighbours in the same order as `MazeSolver` (south,
+east, north, west), and returns a shortest path on the cell graph. It is
+the path of the output file, except when the wall breaking of an
+imperfect hunt-and-kill maze opened a corner block (both coordinates
+even): the block BFS of `MazeSolver` can then cut through that corner,
+which no move between cells does, and the output file holds its moves
+instead. It keeps one byte per cell for the walls, one for the move that
+reached the cell, and a queue of cell indexes.
+"""
+
+from array import array
+from typing import List, Tuple
+
+from .maze_errors import MazeError
+from .maze_result import Maze
+from .output.maze_encoding import EAST, NORTH, SOUTH, WEST
+
+# Move codes, in exploration order; 0 is an unreached cell.
+_SOUTH, _EAST, _NORTH, _WEST, _SOURCE = 1, 2, 3, 4, 5
+_LETTERS = bytes.maketrans(b"\x01\x02\x03\x04", b"SENW")
+_WALLS = ((_SOUTH, SOUTH), (_EAST, EAST), (_NORTH, NORTH), (_WEST, WEST))
+_CLOSE = {wall: bytes(i | wall for i in range(256))
+          for wall in (NORTH, EAST, SOUTH, WEST)}
+
+
+class CellSolver():
+    """Solves a maze on its cells, from their wall nibbles.
+
+    The moves are the solution of the output file unless a corner block
+    was opened (see the module docstring).
+
+    Example:
+        >>> solver = CellSolver.load("maze.txt")
+        >>> solver.solve() == Maze.load("maze.txt").directions
+        True
+
+    Attributes:
+        width (int): Number of cells per row.
+        height (int): Number of rows.
+        entry (Tuple[int, int]): The (x, y) cell of the entry.
+        exit (Tuple[int, int]): The (x, y) cell of the exit.
+        explored (int): Cells taken out of the queue by the last search.
+    """
+
+    def __init__(self, maze: Maze) -> None:
+        """Copies the walls of `maze`, with its outer border closed.
+
+        A maze file with an open outer wall would otherwise lead the
+        search out of the grid.
+
+        Args:
+            maze: The maze to solve.
+
+        Raises:
+            MazeError: If the entry or the exit is outside of the maze.
+        """
+        self.width, self.height = maze.width, maze.height
+        self.entry, self.exit = maze.entry, maze.exit
+        self._index(maze.entry)
+        self._index(maze.exit)
+        width, size = self.width, self.width * self.height
+        cells = bytearray(maze.cells[:size])
+        if len(cells) != size:
+            raise MazeError("Truncated maze data")
+        cells[:width] = cells[:width].translate(_CLOSE[NORTH])
+        cells[size - width:] = cells[size - width:].translate(_CLOSE[SOUTH])
+        cells[::width] = cells[::width].translate(_CLOSE[WEST])
+        cells[width - 1::width] = cells[width - 1::width].translate(
+            _CLOSE[EAST])
+        self._cells = cells
+        self.explored = 0
+
+        offsets = {_SOUTH: width, _EAST: 1, _NORTH: -width, _WEST: -1}
+        self._back = [0] + [offsets[code] for code in range(1, 5)]
+        # The open neighbours of a cell, by wall nibble.
+        self._steps: List[Tuple[Tuple[int, int], ...]] = [
+            tuple((offsets[code], code) for code, wall in _WALLS
+                  if not nibble & wall)
+            for nibble in range(16)]
+
+    @classmethod
+    def load(cls, path: str, index: int = 0) -> "CellSolver":
+        """Reads a maze file, in any format `Maze.load` reads.
+
+        Args:
+            path: The maze file; its extension selects the format.
+            index: For a '.mza' archive, the position of the maze in it.
+
+        Returns:
+            CellSolver: The solver of the maze.
+
+        Raises:
+            MazeError: If the file is not a valid maze.
+        """
+        return cls(Maze.load(path, index))
+
+    def solve(self, entry: Tuple[int, int] | None = None,
+              exit: Tuple[int, int] | None = None) -> str | None:
+        """Finds the shortest path between two cells with a BFS.
+
+        Args:
+            entry: The starting cell, the entry of the maze by default.
+            exit: The target cell, the exit of the maze by default.
+
+        Returns:
+            str | None: The moves from `entry` to `exit`, one of 'NESW'
+            per cell (the solution line of the output file by default),
+            or None if `exit` cannot be reached.
+
+        Raises:
+            MazeError: If `entry` or `exit` is outside of the maze.
+        """
+        start = self._index(self.entry if entry is None else entry)
+        goal = self._index(self.exit if exit is None else exit)
+        moves, _, _ = self._search(start, goal)
+        if not moves[goal]:
+            return None
+
+        back = self._back
+        path = bytearray()
+        cell = goal
+        while cell != start:
+            code = moves[cell]
+            path.append(code)
+            cell -= back[code]
+        path.reverse()
+        return path.translate(_LETTERS).decode("ascii")
+
+    def _search(self, start: int,
+                goal: int) -> Tuple[bytearray, "array[int]", int]:
+        """Runs the BFS from cell `start` until cell `goal` is taken out of
+        the queue (or every reachable cell, with a goal of -1).
+
+        Args:
+            start: Flat index of the first cell.
+            goal: Flat index of the target cell, or -1.
+
+        Returns:
+            Tuple[bytearray, array[int], int]: The move code that reached
+            each cell (0 if unreached), the queue (the reached cells, in
+            BFS order) and the number of cells in it.
+        """
+        cells, steps = self._cells, self._steps
+        moves = bytearray(len(cells))
+        queue = array('I', [0]) * len(cells)
+        moves[start] = _SOURCE
+        queue[0] = start
+        head, tail = 0, 1
+        while head < tail:
+            cell = queue[head]
+            head += 1
+            if cell == goal:
+                break
+            for offset, code in steps[cells[cell]]:
+                neighbour = cell + offset
+                if not moves[neighbour]:
+                    moves[neighbour] = code
+                    queue[tail] = neighbour
+                    tail += 1
+        self.explored = head
+        return moves, queue, tail
+
+    def _index(self, cell: Tuple[int, int]) -> int:
+        """Returns the flat index of `cell`.
+
+        Raises:
+            MazeError: If `cell` is outside of the maze.
+        """
+        x, y = cell
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise MazeError(f"Cell ({x},{y}) is outside of the maze")
+        return y * self.width + x
@@ -0,0 +1,369 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_checkpoint.py                                :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/27 10:42:18 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/27 10:42:18 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Checkpoints of long generations, to resume them after a crash.
+
+A `MazeCheckpoint` given to a `MazeGenerator` saves the state of the
+carving every `interval` seconds to one file:
+
+- the blocks carved so far, one bit per block of the grid;
+- the stack of the depth-first search (recursive backtracking), or the
+  cell the kill phase is at (hunt-and-kill);
+- the state of the `random` module (`random.getstate()`).
+
+A new generator with the same settings and the same checkpoint file
+restores that state and carries on: the maze is the very one the
+uninterrupted run would have produced. For an imperfect maze, the state
+is saved once more between the carving and the wall breakers, which then
+run again from there. The file is removed once the maze is generated.
+
+The carving loops only take the checkpoint: the blocks carved since the
+last one (logged by `MazeGenerator.break_wall` in an `array('I')`, 4
+bytes per block, only while the carving is checkpointed), a copy of the
+stack and the random state are handed to a writer thread, which updates
+its own bitmap of the grid and replaces the file atomically. The file uses the
+native byte order, it is meant to be resumed on the same machine.
+
+Tiled generations are not checkpointed.
+"""
+
+import json
+import os
+import queue
+import random
+import struct
+import threading
+import time
+
+from array import array
+from typing import Any, NamedTuple, Tuple
+
+from .maze_customization import MAZE
+from .maze_errors import MazeError
+
+_MAGIC = b"MZK1"
+# Magic, key, grid width and height (in blocks), version of the random
+# state, whether a gaussian is pending and its value, stack length and
+# seed size. Then the seed (JSON), the random state, the stack (cells,
+# then options) and the bitmap of the carved blocks.
+_HEADER = struct.Struct("<4s32sIIB?dII")
+_RNG_WORDS = 625
+_CHECK_EVERY = 1024
+
+
+class Snapshot(NamedTuple):
+    """The state of a generation, as saved in a checkpoint file.
+
+    Attributes:
+        key (bytes): The `MazeCache.key` of the generator (raw bytes).
+        seed (Any): The seed of the generation.
+        width (int): Width of the grid, in blocks.
+        height (int): Height of the grid, in blocks.
+        rng (Tuple[Any, ...]): The state of the `random` module.
+        stack_cells (array[int]): Block index of each cell of the stack.
+        stack_options (array[int]): Packed neighbours left to try, for
+            each cell of the stack. An empty stack means the carving was
+            over.
+        grid (bytearray): One bit per block, set for the carved ones.
+    """
+    key: bytes
+    seed: Any
+    width: int
+    height: int
+    rng: Tuple[Any, ...]
+    stack_cells: "array[int]"
+    stack_options: "array[int]"
+    grid: bytearray
+
+
+class MazeCheckpoint():
+    """Periodically saves a generation, and resumes it.
+
+    Example:
+        >>> checkpoint = MazeCheckpoint("giant.ckpt", interval=60)
+        >>> maze = MazeGenerator(config, checkpoint=checkpoint).generate()
+
+    Attributes:
+        path (str): The checkpoint file.
+        interval (float): Minimum time between two saves, in seconds.
+        log (array[int]): Blocks carved since the last save, appended by
+            `MazeGenerator.break_wall` between `begin` and `end`.
+        saves (int): Number of states saved by the current generation.
+    """
+
+    def __init__(self, path: str, interval: float = 30.0) -> None:
+        """Initializes the checkpoint; nothing is read or written yet.
+
+        Args:
+            path: The checkpoint file.
+            interval: Minimum time between two saves, in seconds.
+        """
+        self.path = path
+        self.interval = interval
+        self.log: "array[int]" = array('I')
+        self.saves = 0
+        self._key = b""
+        self._seed: Any = None
+        self._shape = (0, 0)
+        self._resumed: Tuple["array[int]", "array[int]"] | None = None
+        self._countdown = _CHECK_EVERY
+        self._next_save = 0.0
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._error: OSError | None = None
+
+    def saved_seed(self) -> Any:
+        """Returns the seed of the saved generation.
+
+        Returns:
+            Any: The seed, or None if there is no checkpoint file.
+
+        Raises:
+            MazeError: If the file is not a maze checkpoint.
+        """
+        try:
+            with open(self.path, 'rb') as file:
+                fields = self._read_header(file)
+                return json.loads(file.read(fields[-1]))
+        except FileNotFoundError:
+            return None
+
+    def load(self) -> Snapshot | None:
+        """Reads the checkpoint file.
+
+        Returns:
+            Snapshot | None: The saved state, or None if there is no
+            checkpoint file.
+
+        Raises:
+            MazeError: If the file is not a maze checkpoint.
+        """
+        try:
+            file = open(self.path, 'rb')
+        except FileNotFoundError:
+            return None
+        with file:
+            (key, width, height, version, has_gauss, gauss, depth,
+             seed_size) = self._read_header(file)
+            seed = json.loads(file.read(seed_size))
+            words = array('I')
+            stack_cells = array('I')
+            stack_options = array('H')
+            try:
+                words.fromfile(file, _RNG_WORDS)
+                stack_cells.fromfile(file, depth)
+                stack_options.fromfile(file, depth)
+            except EOFError:
+                raise MazeError("Truncated maze checkpoint")
+            grid = bytearray(file.read())
+        if len(grid) != (width * height + 7) // 8:
+            raise MazeError("Truncated maze checkpoint")
+        rng = (version, tuple(words), gauss if has_gauss else None)
+        return Snapshot(key, seed, width, height, rng, stack_cells,
+                        stack_options, grid)
+
+    @staticmethod
+    def _read_header(file: Any) -> Tuple[Any, ...]:
+        """Reads and checks the header of a checkpoint file.
+
+        Returns:
+            Tuple[Any, ...]: The header fields after the magic.
+
+        Raises:
+            MazeError: If the file is not a maze checkpoint.
+        """
+        head = file.read(_HEADER.size)
+        if len(head) != _HEADER.size or head[:4] != _MAGIC:
+            raise MazeError("Not a maze checkpoint")
+        fields: Tuple[Any, ...] = _HEADER.unpack(head)[1:]
+        return fields
+
+    def begin(self, generator: Any, key: str) -> Tuple[bool, int]:
+        """Restores the saved state if it matches, and starts saving.
+
+        Called by `MazeGenerator` on a freshly filled grid, after seeding
+        `random`. A saved state of other settings or of another seed is
+        ignored, and overwritten by the first save.
+
+        Args:
+            generator: The `MazeGenerator` about to carve.
+            key: Its `MazeCache.key`.
+
+        Returns:
+            Tuple[bool, int]: True if the carving was already over, and
+            the number of cells already carved.
+
+        Raises:
+            MazeError: If the file is not a maze checkpoint.
+        """
+        width, height = generator.width, generator.height
+        self.log = array('I')
+        self.saves = 0
+        self._key = bytes.fromhex(key)
+        self._seed = generator.seed
+        self._shape = (width, height)
+        self._resumed = None
+        self._countdown = _CHECK_EVERY
+        self._next_save = time.monotonic() + self.interval
+        self._error = None
+
+        snapshot = self.load()
+        carved = False
+        cells = 0
+        if (snapshot is not None and snapshot.key == self._key
+                and (snapshot.width, snapshot.height) == self._shape):
+            grid = snapshot.grid
+            maze = generator.maze
+            for position, byte in enumerate(grid):
+                if not byte:
+                    continue
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        block = position * 8 + bit
+                        x, y = block % width, block // width
+                        maze[(x, y)] = MAZE.empty
+                        cells += x & y & 1
+            random.setstate(snapshot.rng)
+            if snapshot.stack_cells:
+                self._resumed = (snapshot.stack_cells,
+                                 snapshot.stack_options)
+            else:
+                carved = True
+        else:
+            grid = bytearray((width * height + 7) // 8)
+
+        self._thread = threading.Thread(target=self._write_loop,
+                                        args=(grid,), daemon=True)
+        self._thread.start()
+        return carved, cells
+
+    def take_resumed(self) -> Tuple["array[int]", "array[int]"] | None:
+        """Returns the restored stack, once, to the carving algorithm.
+
+        Returns:
+            Tuple[array[int], array[int]] | None: The cells and the
+            packed options of the stack, or None if the carving starts
+            from scratch.
+        """
+        resumed, self._resumed = self._resumed, None
+        return resumed
+
+    def due(self) -> bool:
+        """Tells if a save is due; the clock is only read once every
+        `_CHECK_EVERY` calls."""
+        self._countdown -= 1
+        if self._countdown > 0:
+            return False
+        self._countdown = _CHECK_EVERY
+        return time.monotonic() >= self._next_save
+
+    def save(self, generator: Any,
+             stack_cells: "array[int] | None" = None,
+             stack_options: "array[int] | None" = None) -> None:
+        """Hands the current state to the writer thread.
+
+        Must be called between two steps of the carving, when the grid,
+        the stack and the random state agree. Without a stack, the
+        carving is saved as over.
+
+        Args:
+            generator: The `MazeGenerator` being carved.
+            stack_cells: Block index of each cell of the stack.
+            stack_options: Packed neighbours left to try, for each cell.
+
+        Raises:
+            OSError: If the previous save could not be written.
+        """
+        if self._error is not None:
+            raise self._error
+        if self._thread is None:
+            return
+        log, self.log = self.log, array('I')
+        self._queue.put((log,
+                         b"" if stack_cells is None else stack_cells.tobytes(),
+                         b"" if stack_options is None
+                         else stack_options.tobytes(),
+                         random.getstate()))
+        self.saves += 1
+        self._next_save = time.monotonic() + self.interval
+
+    def end(self, done: bool) -> None:
+        """Stops saving, once the pending save is written.
+
+        Args:
+            done: True if the maze was generated: the checkpoint file is
+                  removed. Otherwise, it is kept to resume from it.
+
+        Raises:
+            OSError: If the last save could not be written.
+        """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        self.log = array('I')
+        self._resumed = None
+        if done:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+        elif self._error is not None:
+            raise self._error
+
+    def _write_loop(self, grid: bytearray) -> None:
+        """Writer thread: applies the carved blocks and writes the states.
+
+        Only the latest of the states waiting in the queue is written.
+
+        Args:
+            grid: The bitmap of the carved blocks, owned by the thread.
+        """
+        while True:
+            items = [self._queue.get()]
+            while not self._queue.empty():
+                items.append(self._queue.get())
+            states = [item for item in items if item is not None]
+            for log, _, _, _ in states:
+                for block in log:
+                    grid[block >> 3] |= 1 << (block & 7)
+            if states and self._error is None:
+                try:
+                    self._write(grid, *states[-1][1:])
+                except OSError as e:
+                    self._error = e
+            if len(states) != len(items):
+                return
+
+    def _write(self, grid: bytearray, stack_cells: bytes,
+               stack_options: bytes, rng: Tuple[Any, ...]) -> None:
+        """Replaces the checkpoint file with one state, atomically.
+
+        Raises:
+            OSError: If the file cannot be written.
+        """
+        version, words, gauss = rng
+        seed = json.dumps(self._seed).encode()
+        header = _HEADER.pack(_MAGIC, self._key, *self._shape, version,
+                              gauss is not None, gauss or 0.0,
+                              len(stack_cells) // 4, len(seed))
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(header)
+            file.write(seed)
+            file.write(array('I', words).tobytes())
+            file.write(stack_cells)
+            file.write(stack_options)
+            file.write(grid)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self.path)
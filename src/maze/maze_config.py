@@ -23,8 +23,8 @@ from typing import Any, Self, Tuple
 from pydantic import (BaseModel, Field, ValidationError, field_validator,
                       model_validator)
 
+from . import maze_rules as rules
 from .maze_errors import MazeConfigError
-from .maze_fortytwo_pattern import get_fortytwo_pattern as ft_patt
 
 
 class MazeConfig(BaseModel):
@@ -38,21 +38,31 @@ class MazeConfig(BaseModel):
         height (int): Grid height (min: 3).
         entry (Tuple[int, int]): Coordinates (x, y) of the starting point.
         exit (Tuple[int, int]): Coordinates (x, y) of the ending point.
-        output_file (str): Path for the output file (must end in .txt).
+        output_file (str): Path for the output file (its extension picks
+            the format, see `maze_codecs`).
         perfect (bool): If True, generates a perfect maze (no loops).
         seed (str | int | None): Seed for the random number generator.
         display (str | None): Rendering mode ('ascii' or 'emoji').
         algorithm (str | None): Algorithm choice ('rb' or 'huntandkill').
+        tile_size (int | None): If set, splits the maze into tiles of this
+            many cells per side, carved in parallel (min: 4).
+        workers (int | None): Number of processes used for tiled
+            generation (default: one per CPU).
+        grid_file (str | None): If set, the block grid is stored in this
+            memory-mapped file instead of memory (see `maze_grid`).
     """
-    width: int = Field(ge=3)
-    height: int = Field(ge=3)
+    width: int = Field(ge=rules.MIN_SIZE)
+    height: int = Field(ge=rules.MIN_SIZE)
     entry: Tuple[int, int]
     exit: Tuple[int, int]
-    output_file: str = Field(pattern=r'.+\.txt$')
+    output_file: str = Field(pattern=rules.OUTPUT_FILE_PATTERN)
     perfect: bool
     seed: str | int | None = None
     display: str | None = "ascii"
     algorithm: str | None = "rb"
+    tile_size: int | None = Field(default=None, ge=rules.MIN_TILE_SIZE)
+    workers: int | None = Field(default=None, ge=rules.MIN_WORKERS)
+    grid_file: str | None = Field(default=None, min_length=1)
 
     @field_validator('entry', 'exit', mode='before')
     @classmethod
@@ -60,7 +70,7 @@ class MazeConfig(BaseModel):
         """Parses a coordinate string into a tuple of integers.
 
         Allows the user to provide coordinates in the config file as a
-        string "x,y".
+        string "x,y" (see `maze_rules.parse_coordinate`).
 
         Args:
             coord: A string in format "x,y" or an already parsed tuple.
@@ -71,31 +81,8 @@ class MazeConfig(BaseModel):
         Raises:
             ValueError: If the format is incorrect or values are not integers.
         """
-        if isinstance(coord, tuple):
-            return coord
-
-        if isinstance(coord, str):
-            if len(coord) < 3:
-                raise ValueError("Coordinates are invalid. (Use this format: "
-                                 "'0,0')")
-            if ',' not in coord:
-                raise ValueError("Coordinates are invalid. (Use this format: "
-                                 "'0,0')")
-
-            splited_coord = coord.split(',')
-            if len(splited_coord) != 2:
-                raise ValueError("Coordinates are invalid. (Use this format: "
-                                 "'0,0')")
-
-            try:
-                coord_x = int(splited_coord[0])
-                coord_z = int(splited_coord[1])
-            except ValueError:
-                raise ValueError("ENTRY and EXIT need to be int()")
-
-            tuple_coord = (coord_x, coord_z)
-            return tuple_coord
-        return coord
+        coordinates: Tuple[int, int] = rules.parse_coordinate(coord)
+        return coordinates
 
     @field_validator('display')
     @classmethod
@@ -111,16 +98,7 @@ class MazeConfig(BaseModel):
         Raises:
             MazeConfigError: If the mode is unknown.
         """
-        valid_display = ["ascii", "emoji"]
-
-        if display is not None:
-            value = display.lower()
-        else:
-            value = "emoji"
-
-        if value not in valid_display:
-            raise MazeConfigError(f"Invalid display mode. Use {valid_display}")
-        return value
+        return rules.normalize_display(display)
 
     @field_validator('algorithm')
     @classmethod
@@ -136,16 +114,7 @@ class MazeConfig(BaseModel):
         Raises:
             MazeConfigError: If the algorithm is unknown.
         """
-        valid_algo = ["rb", "huntandkill"]
-
-        if algo is not None:
-            value = algo.lower()
-        else:
-            value = "rb"
-
-        if value not in valid_algo:
-            raise MazeConfigError(f"Invalid algorithm mode. Use {valid_algo}")
-        return value
+        return rules.normalize_algorithm(algo)
 
     @model_validator(mode='after')
     def valid_config_input(self) -> Self:
@@ -156,42 +125,16 @@ class MazeConfig(BaseModel):
         2. Entry and Exit are not identical.
         3. Entry and Exit do not overlap with the reserved '42' pattern.
 
+        The '42' pattern is memoized per size, so validating many
+        configurations of the same size computes it once.
+
         Returns:
             Self: The validated model instance.
 
         Raises:
             MazeConfigError: If any logical constraint is violated.
         """
-        entry_x, entry_y = self.entry
-        if not (0 <= entry_x < self.width and 0 <= entry_y < self.height):
-            raise MazeConfigError(f"Entry coords: {self.entry} is outside maze"
-                                  " dimensions.")
-
-        exit_x, exit_y = self.exit
-        if not (0 <= exit_x < self.width and 0 <= exit_y < self.height):
-            raise MazeConfigError(f"Exit coords: {self.exit} is outside maze"
-                                  " dimensions.")
-
-        if self.width == 3 and self.height == 3:
-            raise MazeConfigError("Maze dimensions are invalid")
-
-        if self.entry == self.exit:
-            raise MazeConfigError("Entry and Exit cannot be at the exact same "
-                                  "position.")
-
-        forty_two_coords = ft_patt(self.width, self.height)
-        if self.entry in forty_two_coords:
-            raise MazeConfigError("Can't place Entry here. Reserved to '42'")
-        if self.exit in forty_two_coords:
-            raise MazeConfigError("Can't place Exit here. Reserved to '42'")
-
-        neighbor_entry = [(self.entry[0] + 1, self.entry[1]),
-                          (self.entry[0], self.entry[1] - 1),
-                          (self.entry[0] - 1, self.entry[1]),
-                          (self.entry[0], self.entry[1] + 1)]
-        if self.exit in neighbor_entry:
-            raise MazeConfigError("Entry and Exit cannot be side by side.")
-
+        rules.check_layout(self.width, self.height, self.entry, self.exit)
         return self
 
     @classmethod
@@ -216,8 +159,6 @@ class MazeConfig(BaseModel):
         if not path.is_file():
             raise FileNotFoundError("Missing config file")
 
-        valid_config_key = {"width", "height", "entry", "exit", "output_file",
-                            "perfect", "seed", "display", "algorithm"}
         raw_config: dict[str, Any] = {}
 
         try:
@@ -234,7 +175,7 @@ class MazeConfig(BaseModel):
                     key = key.strip().lower()
                     value = value.strip()
 
-                    if key not in valid_config_key:
+                    if key not in rules.CONFIG_KEYS:
                         raise MazeConfigError(f"Key: '{key}' at line {i}"
                                               " is not valid")
                     else:
@@ -247,11 +188,4 @@ class MazeConfig(BaseModel):
         except ValidationError as e:
             # Custom error formatting to make Pydantic errors readable
             # for the end user.
-            for error in e.errors():
-                msg = error['msg']
-                if error['type'] == "string_pattern_mismatch":
-                    msg = "File must end with '.txt'"
-                elif error['type'] == "greater_than_equal":
-                    msg = (f"Too small. Must be at least {error['ctx']['ge']}")
-                error_message = f"{error['loc'][0]}: {msg}"
-            raise MazeConfigError(error_message)
+            raise MazeConfigError(rules.describe_errors(e.errors()))
@@ -19,8 +19,6 @@ throughout the package to keep rendering consistent.
 
 from enum import Enum
 
-from colorama import Fore, Style
-
 
 class VISUAL(str, Enum):
     """Defines string constants for ASCII block rendering.
@@ -64,26 +62,27 @@ class MAZE(Enum):
 class COLORS(Enum):
     """Defines ANSI color codes for terminal output.
 
-    This class wraps `colorama.Fore` constants to provide a unified
-    access point for text coloration throughout the application.
+    The values are the `colorama.Fore` sequences, spelled out so that
+    importing the package does not import colorama. They provide a
+    unified access point for text coloration throughout the application.
     """
-    green = Fore.GREEN
-    black = Fore.BLACK
-    blue = Fore.BLUE
-    cyan = Fore.CYAN
-    white = Fore.WHITE
-    lightblack = Fore.LIGHTBLACK_EX
-    lightblue = Fore.LIGHTBLUE_EX
-    lightcyan = Fore.LIGHTCYAN_EX
-    lightgreen = Fore.LIGHTGREEN_EX
-    lightmagenta = Fore.LIGHTMAGENTA_EX
-    lightred = Fore.LIGHTRED_EX
-    lightwhite = Fore.LIGHTWHITE_EX
-    lightyellow = Fore.LIGHTYELLOW_EX
-    magenta = Fore.MAGENTA
-    red = Fore.RED
-    reset = Fore.RESET
-    yellow = Fore.YELLOW
+    green = "\033[32m"
+    black = "\033[30m"
+    blue = "\033[34m"
+    cyan = "\033[36m"
+    white = "\033[37m"
+    lightblack = "\033[90m"
+    lightblue = "\033[94m"
+    lightcyan = "\033[96m"
+    lightgreen = "\033[92m"
+    lightmagenta = "\033[95m"
+    lightred = "\033[91m"
+    lightwhite = "\033[97m"
+    lightyellow = "\033[93m"
+    magenta = "\033[35m"
+    red = "\033[31m"
+    reset = "\033[39m"
+    yellow = "\033[33m"
 
     def __str__(self) -> str:
         """Return the ANSI escape sequence as a string."""
@@ -115,11 +114,12 @@ class EMOJI(str, Enum):
 class STYLE(Enum):
     """Defines ANSI style codes (brightness/dimming).
 
-    Wraps `colorama.Style` to control text weight and reset states.
+    The values are the `colorama.Style` sequences, spelled out like in
+    `COLORS`. They control text weight and reset states.
     """
-    bright = Style.BRIGHT
-    dim = Style.DIM
-    reset = Style.RESET_ALL
+    bright = "\033[1m"
+    dim = "\033[2m"
+    reset = "\033[0m"
 
     def __str__(self) -> str:
         """Return the ANSI style sequence as a string."""
@@ -0,0 +1,144 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_dedupe.py                                    :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/24 10:17:52 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/24 10:17:52 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Content-addressed store of generated mazes, on top of an archive.
+
+Different seeds and settings sometimes produce the very same maze,
+especially at small sizes. Each maze is identified by its fingerprint
+(see `Maze.fingerprint`): a maze already in the archive is not stored
+again, its seed is recorded as an alias of the stored one (see
+`maze_archive`). A maze already stored under the same key and with the
+same seed (the same spec added again, e.g. a batch run twice) is not
+recorded at all.
+
+The fingerprints of the mazes already in the archive are computed when
+the store is opened, on their packed cells, without decoding them.
+"""
+
+from typing import Dict, NamedTuple, Tuple
+
+from .maze_archive import MazeArchive, MazeArchiveWriter, archive_key
+from .maze_result import Maze
+
+
+class DedupeResult(NamedTuple):
+    """Where a maze added to a `MazeDedupeStore` went.
+
+    Attributes:
+        position (int): Its position in the archive.
+        duplicate_of (int | None): The position of the identical maze
+            already stored, or None if the maze was new.
+        existing (bool): True if the archive already had this maze under
+            the same key and seed: nothing was written, `position` is the
+            existing entry.
+    """
+    position: int
+    duplicate_of: int | None
+    existing: bool = False
+
+
+class MazeDedupeStore():
+    """Appends mazes to an archive, storing each distinct maze once.
+
+    Example:
+        >>> with MazeDedupeStore("batch.mza") as store:
+        ...     store.add(maze, key)
+        ...     print(store.ratio)
+
+    Attributes:
+        added (int): Number of mazes added since the store was opened.
+        duplicates (int): How many of them were stored as aliases of an
+            identical maze.
+        existing (int): How many of them were already in the archive,
+            under the same key and seed, and were skipped.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Opens the archive for appending and indexes its mazes.
+
+        Args:
+            path: The `.mza` file, created if missing.
+
+        Raises:
+            MazeError: If the files exist but are not a maze archive.
+        """
+        self._writer = MazeArchiveWriter(path)
+        self._stored: Dict[bytes, int] = {}
+        # Position of each (stored maze, key, seed) already indexed.
+        self._entries: Dict[Tuple[int, bytes, str | int | None], int] = {}
+        self.added = 0
+        self.duplicates = 0
+        self.existing = 0
+        if len(self._writer):
+            with MazeArchive(path) as archive:
+                for position in range(len(archive)):
+                    digest = archive.fingerprint(position)
+                    if archive.is_alias(position):
+                        original = self._stored.get(digest, position)
+                    else:
+                        original = self._stored.setdefault(digest, position)
+                    self._entries.setdefault(
+                        (original, archive.key(position),
+                         archive.seed(position)), position)
+
+    def __enter__(self) -> "MazeDedupeStore":
+        """Returns the store itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Closes the archive."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the archive."""
+        self._writer.close()
+
+    @property
+    def ratio(self) -> float | None:
+        """Mazes added per maze actually stored (1.0 without duplicates),
+        leaving out the ones already in the archive; None if no maze was
+        stored."""
+        stored = self.added - self.duplicates - self.existing
+        if not stored:
+            return None
+        return (self.added - self.existing) / stored
+
+    def add(self, maze: Maze, key: str | bytes) -> DedupeResult:
+        """Adds a maze, as an alias if an identical one is stored.
+
+        Args:
+            maze: The maze to add.
+            key: Its key, usually `MazeCache.key` of its generator.
+
+        Returns:
+            DedupeResult: Its position, and the one of the identical maze
+            if it was a duplicate.
+        """
+        self.added += 1
+        digest = maze.fingerprint()
+        original = self._stored.get(digest)
+        if original is not None:
+            entry = (original, archive_key(key), maze.seed)
+            existing = self._entries.get(entry)
+            if existing is not None:
+                self.existing += 1
+                return DedupeResult(
+                    existing, None if existing == original else original,
+                    True)
+            self.duplicates += 1
+            position = self._writer.alias(original, key, maze.seed)
+            self._entries[entry] = position
+            return DedupeResult(position, original)
+        position = self._writer.append(maze, key)
+        self._stored[digest] = position
+        self._entries[(position, archive_key(key), maze.seed)] = position
+        return DedupeResult(position, None)
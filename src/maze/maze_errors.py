@@ -44,3 +44,13 @@ class MazeGenerationError(MazeError):
     the production of an unsolvable maze or an invalid internal state.
     """
     pass
+
+
+class MazeGenerationCancelled(MazeGenerationError):
+    """Exception raised when a generation is stopped before its end.
+
+    Raised by `MazeProgress` when the deadline of the generation is
+    reached, or when it was cancelled. The grid is left half carved: the
+    generator must generate again before being used.
+    """
+    pass
@@ -17,12 +17,30 @@ the "42" pattern is placed and must not be overwritten by entry,
 exit or generation algorithms.
 """
 
-from typing import Set, Tuple
+from functools import lru_cache
+from typing import FrozenSet, Set, Tuple
 
 
 def get_fortytwo_pattern(width: int, height: int) -> Set[Tuple[int, int]]:
+    """Returns a new, mutable copy of `fortytwo_pattern(width, height)`.
+
+    Args:
+        width: The total width of the maze grid.
+        height: The total height of the maze grid.
+
+    Returns:
+        Set[Tuple[int, int]]: The coordinates reserved for the '42' pattern.
+    """
+    return set(fortytwo_pattern(width, height))
+
+
+@lru_cache(maxsize=1024)
+def fortytwo_pattern(width: int, height: int) -> FrozenSet[Tuple[int, int]]:
     """Calculates the set of coordinates forming the '42' shape.
 
+    The result only depends on the dimensions, so it is memoized: checking
+    thousands of configurations of the same size computes it once.
+
     The pattern is mathematically centered based on the provided dimensions.
     If the maze dimensions are insufficient (<= 9x9) to display the pattern
     without clipping, an empty set is returned.
@@ -32,12 +50,12 @@ def get_fortytwo_pattern(width: int, height: int) -> Set[Tuple[int, int]]:
         height: The total height of the maze grid.
 
     Returns:
-        Set[Tuple[int, int]]: A set of (x, y) tuples representing the
+        FrozenSet[Tuple[int, int]]: The (x, y) tuples representing the
         coordinates reserved for the '42' pattern. Returns an empty set
         if the maze is too small.
     """
     if width <= 9 or height <= 9:
-        return set()
+        return frozenset()
 
     center_x, center_y = width // 2, height // 2
 
@@ -47,7 +65,7 @@ def get_fortytwo_pattern(width: int, height: int) -> Set[Tuple[int, int]]:
     if center_y % 2 == 0:
         center_y += 1
 
-    return {
+    return frozenset({
         (center_x - 3, center_y), (center_x - 3, center_y - 1),
         (center_x - 3, center_y - 2), (center_x - 1, center_y),
         (center_x - 2, center_y), (center_x - 1, center_y + 1),
@@ -57,4 +75,4 @@ def get_fortytwo_pattern(width: int, height: int) -> Set[Tuple[int, int]]:
         (center_x + 2, center_y), (center_x + 3, center_y),
         (center_x + 3, center_y - 1), (center_x + 3, center_y - 2),
         (center_x + 2, center_y - 2), (center_x + 1, center_y - 2)
-    }
+    })
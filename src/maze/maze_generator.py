@@ -22,17 +22,27 @@ import random
 import string
 import time
 
-from typing import Any, Dict, Tuple
-from colorama import Cursor
+from collections.abc import MutableMapping
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 
-from .maze_config import MazeConfig
 from .maze_errors import MazeGenerationError
-from .maze_fortytwo_pattern import get_fortytwo_pattern as ft_patt
+from .maze_grid import MazeGrid
+from .maze_fortytwo_pattern import fortytwo_pattern as ft_patt
 from .maze_customization import (COLORS, STYLE, ANIM, DISPLAY_MODE, ALGO_MODE,
                                  MAZE, VISUAL, EMOJI)
-from .algorithms import (recursive_backtracking, hunt_and_kill,
-                         break_random_walls)
-from .output import maze_output
+from .maze_result import Maze
+from .output.maze_encoding import (decode_cells, pack_cells, unpack_cells,
+                                   directions_to_path)
+
+# The configuration, the cache and the algorithms are only imported when
+# used: a plain `import maze` stays cheap (no pydantic, no colorama).
+if TYPE_CHECKING:
+    from .maze_batch import MazeSpec
+    from .maze_config import MazeConfig
+    from .maze_cache import MazeCache, CachedMaze
+    from .maze_checkpoint import MazeCheckpoint
+    from .maze_progress import MazeProgress
+    from .maze_solver import MazeSolver
 
 
 class MazeGenerator():
@@ -51,8 +61,11 @@ class MazeGenerator():
     # Global variable to render text in bright white.
     txt_white = f"{COLORS.white}{STYLE.bright}"
 
-    def __init__(self, config: MazeConfig) -> None:
-        """Initialize the generator from a `MazeConfig`.
+    def __init__(self, config: "MazeConfig | MazeSpec",
+                 cache: "MazeCache | None" = None,
+                 progress: "MazeProgress | None" = None,
+                 checkpoint: "MazeCheckpoint | None" = None) -> None:
+        """Initialize the generator from a `MazeConfig` or a `MazeSpec`.
 
         If no seed is provided, generate a random one and start the
         randomization based on it. Correct the coordinates (entry, exit, grid)
@@ -63,10 +76,26 @@ class MazeGenerator():
 
         Args:
             config: MazeConfig containing all the config validate by the
-            MazeConfig class.
+            MazeConfig class, or a `MazeSpec` read by `load_specs`.
+            cache: Optional `MazeCache`. When given, a maze already
+            generated with the same configuration and seed is restored
+            from it instead of being generated and solved again.
+            progress: Optional `MazeProgress`. When given, the algorithms
+            report the cells carved to it, and the generation raises
+            `MazeGenerationCancelled` once its deadline is reached.
+            checkpoint: Optional `MazeCheckpoint`. When given, the state of
+            the generation is saved to it periodically, and a generation
+            interrupted earlier with the same settings resumes from it.
+            Without a seed in `config`, the seed of the saved generation
+            is used.
         """
         # Import config.
         self.cfg = config
+        self.cache = cache
+        self.progress = progress
+        self.checkpoint = checkpoint
+        # The checkpoint logging the carved blocks, while one is saving.
+        self._carve_log: "MazeCheckpoint | None" = None
         # Export config into the class.
         self.width = config.width * 2 + 1
         self.height = config.height * 2 + 1
@@ -79,6 +108,8 @@ class MazeGenerator():
         self.algorithm = config.algorithm
 
         # Generate seed if user didn't give it and launch the random sequence.
+        if self.seed is None and checkpoint is not None:
+            self.seed = checkpoint.saved_seed()
         if self.seed is None:
             self._generate_random_seed()
         random.seed(self.seed)
@@ -95,8 +126,16 @@ class MazeGenerator():
         # Check the 42 pattern.
         self.fourtytwo_coord = ft_patt(self.width, self.height)
 
-        # Create the maze dict to store all informations.
-        self.maze: Dict[Tuple[int, int], Any] = {}
+        # Create the maze dict to store all informations (or a grid in a
+        # memory-mapped file, for mazes larger than memory).
+        self.maze: MutableMapping[Tuple[int, int], Any] = {}
+        grid_file = getattr(config, "grid_file", None)
+        if grid_file is not None:
+            from .maze_grid import MmapMazeGrid
+            self.maze = MmapMazeGrid(grid_file, self.width, self.height)
+
+        # Solution of the current maze, dropped whenever a wall changes.
+        self.solver: "MazeSolver | None" = None
 
         # Defaults color and visual.
         self.color_wall = COLORS.lightwhite
@@ -128,8 +167,9 @@ class MazeGenerator():
             self.visual_wall = "#"
             self.step_x = 1
 
-    def maze_generator(self, rendering: bool = False,
-                       regen: bool = False) -> None:
+    def maze_generator(self, rendering: bool = False, regen: bool = False,
+                       prefetched: "Tuple[str, CachedMaze] | None" = None
+                       ) -> None:
         """Orchestrates the full maze generation workflow.
 
         This method executes the pipeline in the following order:
@@ -141,11 +181,19 @@ class MazeGenerator():
            'imperfect' mazes).
         6. Writes the result to the output file.
 
+        With a cache, steps 3 to 5 are replaced by a lookup when the same
+        maze was generated before, and step 6 is skipped if the output
+        file already holds it.
+
         Args:
             rendering: If True, displays real-time animations and menus
                        to the terminal.
             regen: If True, generates a new random seed before running;
                    otherwise, uses the existing configuration seed.
+            prefetched: A `(seed, result)` pair generated ahead of time (see
+                        `MazePrefetcher`). With `regen`, its seed is used
+                        instead of a random one and its result is restored
+                        instead of generating the maze again.
 
         Raises:
             MazeGenerationError: If the generated maze is theoretically
@@ -206,37 +254,241 @@ class MazeGenerator():
         print(f"\r{filling}{text_algo_display}{STYLE.reset}")
 
         # Regenerate a maze if the maze is re-generated.
+        result = None
         if regen is True:
-            self._generate_random_seed()
+            if prefetched is not None:
+                self.seed, result = prefetched
+            else:
+                self._generate_random_seed()
             random.seed(self.seed)
 
-        self._fill_maze()
+        solver, key = self._build(rendering, result)
+        self.solver = solver
 
+        if (self.cache is None or key is None or
+                not self.cache.output_is_current(self.output_file, key)):
+            self.to_maze().write(self.output_file)
+            if self.cache is not None and key is not None:
+                self.cache.record_output(self.output_file, key)
+
+        # Put the cursor at the bottom of the screen
         if rendering:
+            from colorama import Cursor
+            print(Cursor.POS(1, self.y_offset), end="")
             self.print_maze()
+            if (len(self.fourtytwo_coord) <= 0):
+                print(f"{COLORS.red}{STYLE.bright}ERROR: '42' pattern can't be"
+                      f" printed!{STYLE.reset}")
+            print(Cursor.POS(1, self.height + self.y_offset))
 
-        self._choose_algo(rendering)
+    def generate(self, regen: bool = False) -> Maze:
+        """Generates the maze and returns it, without any side effect.
+
+        Unlike `maze_generator`, nothing is printed and the output file is
+        not written: serialize the result with `Maze.write` (or `to_hex`,
+        `to_bytes`) if needed. The cache, if any, is still used.
+
+        Args:
+            regen: If True, generates a new random seed first; otherwise,
+                   uses the configuration seed.
+
+        Returns:
+            Maze: The generated maze and its solution.
+
+        Raises:
+            MazeGenerationError: If the generated maze is unsolvable.
+            MazeGenerationCancelled: If the deadline of `self.progress` is
+                                     reached, or it was cancelled.
+        """
+        if regen:
+            self._generate_random_seed()
+        random.seed(self.seed)
+        self.solver, _ = self._build(rendering=False)
+        return self.to_maze()
+
+    @classmethod
+    def from_result(cls, maze: Maze,
+                    config: "MazeConfig | MazeSpec | None" = None
+                    ) -> "MazeGenerator":
+        """Builds a generator holding an already generated maze.
+
+        The maze (e.g. loaded from a file or an archive) is stored in a
+        memory `MazeCache` under the key of the new generator, so it is
+        restored instead of generated: here, and by `maze_generator` and
+        `generate` later on.
+
+        Args:
+            maze: The maze to restore.
+            config: The settings not stored in a `Maze` (output file,
+                    display...). Its size, entry, exit and seed are
+                    replaced by the ones of `maze`.
+
+        Returns:
+            MazeGenerator: A generator whose grid and solution are `maze`.
+
+        Raises:
+            MazeGenerationError: If `maze` has no solution.
+        """
+        from .maze_batch import MazeSpec
+        from .maze_cache import CachedMaze, MazeCache
+
+        fields = (config.model_dump() if config is not None
+                  else {"output_file": "maze.txt", "perfect": True})
+        fields.update(width=maze.width, height=maze.height,
+                      entry=maze.entry, exit=maze.exit, seed=maze.seed)
+        cache = MazeCache(max_entries=1)
+        generator = cls(MazeSpec(**fields), cache=cache)
+        cache.put(cache.key(generator),
+                  CachedMaze(pack_cells(maze.cells), maze.directions))
+        generator.generate()
+        return generator
+
+    def to_maze(self) -> Maze:
+        """Returns the current maze as an immutable `Maze`.
+
+        Returns:
+            Maze: The grid, the entry, the exit, the seed and the solution.
+
+        Raises:
+            MazeGenerationError: If no maze was generated yet.
+        """
+        if self.solver is None:
+            raise MazeGenerationError("No maze was generated yet.")
+        return self._maze(self.solver)
+
+    def __enter__(self) -> "MazeGenerator":
+        """Returns the generator itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Closes the grid file, if any."""
+        self.close()
+
+    def close(self) -> None:
+        """Writes the grid back to its file and unmaps it, when the
+        configuration sets `grid_file` (nothing to do otherwise).
+
+        The generator cannot generate nor print a maze afterwards; the
+        `Maze` results it returned stay valid.
+        """
+        if isinstance(self.maze, MazeGrid):
+            self.maze.close()
+
+    def _build(self, rendering: bool, result: "CachedMaze | None" = None
+               ) -> Tuple["MazeSolver", str | None]:
+        """Fills the grid, then carves and solves the maze.
+
+        The maze is restored from `result` (or from the cache) when
+        possible, otherwise the selected algorithm runs and the maze is
+        solved. Nothing is written to the output file.
+
+        Args:
+            rendering: If True, prints the grid and animates the algorithm.
+            result: A result previously generated for the current seed.
+
+        Returns:
+            Tuple[MazeSolver, str | None]: The solver holding the path, and
+            the cache key of the maze (None without a cache).
+
+        Raises:
+            MazeGenerationError: If the generated maze is unsolvable.
+            MazeGenerationCancelled: If the deadline of `self.progress` is
+                                     reached while generating.
+        """
+        self._fill_maze()
+
+        if rendering:
+            self.print_maze()
 
-        # Check if the maze can be solved
         from .maze_solver import MazeSolver
         solver = MazeSolver(self)
+
+        key = None
+        if self.cache is not None:
+            key = self.cache.key(self)
+            if result is None:
+                result = self.cache.get(key)
+
+        if result is not None:
+            cell_count = self.cfg.width * self.cfg.height
+            decode_cells(self, unpack_cells(result.cells, cell_count))
+            solver.path = directions_to_path(self, result.directions)
+            if self.cache is not None and key is not None:
+                self.cache.put(key, result)
+            return solver, key
+
+        checkpoint = self.checkpoint
+        if self.cfg.tile_size is not None:
+            checkpoint = None
+        carved, cells = False, 0
+        if checkpoint is not None:
+            from .maze_cache import MazeCache
+            carved, cells = checkpoint.begin(self, MazeCache.key(self))
+            if not carved:
+                self._carve_log = checkpoint
+
+        if self.progress is not None:
+            pattern_cells = sum(1 for x, y in self.fourtytwo_coord
+                                if x % 2 and y % 2)
+            self.progress.start(self.cfg.width * self.cfg.height
+                                - pattern_cells, cells)
+        try:
+            self._choose_algo(rendering, carved)
+        except BaseException:
+            if checkpoint is not None:
+                checkpoint.end(done=False)
+            raise
+        finally:
+            self._carve_log = None
+        if checkpoint is not None:
+            checkpoint.end(done=True)
+        if self.progress is not None:
+            self.progress.finish()
+
+        # Check if the maze can be solved
         solver.find_path()
-        if len(solver.path) <= 0:
+        if solver.directions is None and len(solver.path) <= 0:
             if rendering:
+                from colorama import Cursor
                 print(Cursor.POS(1, self.height + self.y_offset))
             raise MazeGenerationError("This maze cannot be resolve. Omg, "
                                       "this is so rare!")
 
-        maze_output(self, solver.path)
+        if self.cache is not None and key is not None:
+            self.cache.put(key, self._result(solver))
+        return solver, key
 
-        # Put the cursor at the bottom of the screen
-        if rendering:
-            print(Cursor.POS(1, self.y_offset), end="")
-            self.print_maze()
-            if (len(self.fourtytwo_coord) <= 0):
-                print(f"{COLORS.red}{STYLE.bright}ERROR: '42' pattern can't be"
-                      f" printed!{STYLE.reset}")
-            print(Cursor.POS(1, self.height + self.y_offset))
+    def _result(self, solver: "MazeSolver") -> "CachedMaze":
+        """Packs the current grid and solution into a compact result.
+
+        Args:
+            solver: The solver holding the path of the current maze.
+
+        Returns:
+            CachedMaze: The packed cells and the solution moves.
+        """
+        from .maze_cache import CachedMaze
+
+        maze = self._maze(solver)
+        return CachedMaze(pack_cells(maze.cells), maze.directions)
+
+    def _maze(self, solver: "MazeSolver") -> Maze:
+        """Builds the `Maze` of the current grid and solution.
+
+        After a search on the cells of a `MazeGrid`, the solver already
+        holds the wall nibbles and the moves: they are reused, and its
+        `path` is never built.
+
+        Args:
+            solver: The solver holding the path of the current maze.
+
+        Returns:
+            Maze: The grid, the entry, the exit, the seed and the solution.
+        """
+        if solver.directions is not None:
+            return Maze.from_generator(self, [], solver.cells,
+                                       solver.directions)
+        return Maze.from_generator(self, solver.path, solver.cells)
 
     def get_maze_parameters(self) -> Dict[str, Any]:
         """Retrieves the current configuration state of the generator.
@@ -262,7 +514,8 @@ class MazeGenerator():
 
         Updates the internal grid state and, if rendering is enabled,
         updates the specific character on the terminal screen without
-        redrawing the entire maze.
+        redrawing the entire maze. The stored solution is dropped since
+        it may no longer be the shortest path.
 
         Args:
             x: The grid X coordinate of the wall to remove.
@@ -271,8 +524,14 @@ class MazeGenerator():
                        animation.
         """
         self.maze[(x, y)] = MAZE.empty
+        self.solver = None
+        if self.progress is not None:
+            self.progress.advance(x & y & 1)
+        if self._carve_log is not None:
+            self._carve_log.log.append(y * self.width + x)
 
         if rendering:
+            from colorama import Cursor
             curs_x = (x * self.step_x) + 1
             curs_y = y + self.y_offset
 
@@ -298,14 +557,30 @@ class MazeGenerator():
             if self.height < 100 or self.width < 100:
                 time.sleep(0.001)
 
+    def get_solver(self) -> "MazeSolver":
+        """Returns the solver holding the solution of the current maze.
+
+        The solution found while generating is reused; the maze is only
+        solved again if its walls changed since.
+
+        Returns:
+            MazeSolver: A solver whose `path` goes from exit to entry.
+        """
+        if self.solver is None:
+            from .maze_solver import MazeSolver
+            self.solver = MazeSolver(self)
+            self.solver.find_path()
+        return self.solver
+
     def print_maze(self) -> None:
         """Renders the current state of the entire maze to the terminal.
 
         Iterates through every cell in the grid and prints the
         appropriate symbol (ASCII or Emoji) and color code based on the
-        current display settings.
+        current display settings. Each row is printed in a single write.
         """
         for y in range(self.height):
+            row = []
             for x in range(self.width):
                 cell = self.maze[(x, y)]
                 current_color = COLORS.reset
@@ -336,9 +611,8 @@ class MazeGenerator():
                     current_color = self.color_wall
                     symbol_to_print = self.visual_wall
 
-                print(f"{current_color}{symbol_to_print}{COLORS.reset}",
-                      end="")
-            print()
+                row.append(f"{current_color}{symbol_to_print}{COLORS.reset}")
+            print("".join(row))
 
     def _is_breakable(self, x: int, y: int) -> bool:
         """Checks if the wall at the given coordinates is breakable.
@@ -362,27 +636,54 @@ class MazeGenerator():
             return True
         return False
 
-    def _choose_algo(self, rendering: bool) -> None:
+    def _choose_algo(self, rendering: bool, carved: bool = False) -> None:
         """Dispatches the generation process to the selected algorithm.
 
         Based on `self.algorithm` and `self.perfect`, this method calls
         the appropriate external function (Recursive Backtracking or
-        Hunt-and-Kill).
+        Hunt-and-Kill). If a `tile_size` is configured, the perfect maze is
+        carved by `tiled_generation` across several processes instead.
+
+        With a checkpoint, the carved grid of an imperfect maze is saved
+        before the walls are broken.
 
         Args:
             rendering: Passed to the algorithm functions to enable or
                 disable real-time visualization during generation.
+            carved: If True, the grid was restored from a checkpoint
+                saved after the carving: only the walls are broken.
         """
-        if self.algorithm == ALGO_MODE.rb and self.perfect:
-            recursive_backtracking(self, rendering)
-        elif self.algorithm == ALGO_MODE.rb and self.perfect is False:
-            recursive_backtracking(self, rendering)
-            break_random_walls(self, rendering)
+        if self.cfg.tile_size is not None:
+            from .algorithms.tiled import tiled_generation
+            tiled_generation(self, rendering)
+            if not self.perfect and self.algorithm == ALGO_MODE.rb:
+                from .algorithms.backtracking import break_random_walls
+                break_random_walls(self, rendering)
+            elif not self.perfect:
+                from .algorithms.hunt_and_kill import break_walls_hak
+                break_walls_hak(self, rendering)
+
+        elif self.algorithm == ALGO_MODE.rb:
+            from .algorithms.backtracking import (recursive_backtracking,
+                                                  break_random_walls)
+            if not carved:
+                recursive_backtracking(self, rendering)
+            if self.perfect is False:
+                if self.checkpoint is not None and not carved:
+                    self.checkpoint.save(self)
+                    # The broken walls are not saved: no need to log them.
+                    self._carve_log = None
+                break_random_walls(self, rendering)
 
         elif self.algorithm == ALGO_MODE.hunt_kill:
-            hunt_and_kill(self, rendering)
+            from .algorithms.hunt_and_kill import (hunt_and_kill,
+                                                   break_walls_hak)
+            if not carved:
+                hunt_and_kill(self, rendering)
             if not self.perfect:
-                from .algorithms.hunt_and_kill import break_walls_hak
+                if self.checkpoint is not None and not carved:
+                    self.checkpoint.save(self)
+                    self._carve_log = None
                 break_walls_hak(self, rendering)
 
     def _correcting_coords(self) -> None:
@@ -453,6 +754,14 @@ class MazeGenerator():
         respective types. All other cells are initialized as walls,
         ready to be carved by the generation algorithm.
         """
+        self.solver = None
+        if isinstance(self.maze, MazeGrid):
+            self.maze.fill(MAZE.wall)
+            for coord in self.fourtytwo_coord:
+                self.maze[coord] = MAZE.fortytwo
+            self.maze[self.exit_coord] = MAZE.exit
+            self.maze[self.entry_coord] = MAZE.entry
+            return
         for y in range(self.height):
             for x in range(self.width):
                 if (x, y) == self.entry_coord:
@@ -494,6 +803,7 @@ class MazeGenerator():
             choice = int(user_choice)
 
             if choice >= 1 and choice <= 6:
+                from colorama import Cursor
                 print(Cursor.UP(4) + ANIM.clear, end="")
                 self._apply_wall_color(choice)
                 return "ok"
@@ -504,6 +814,7 @@ class MazeGenerator():
             print(f"{COLORS.red}Invalid choice. Choose between 1 and 6.",
                   end="", flush=True)
             time.sleep(1)
+            from colorama import Cursor
             print(Cursor.UP(5) + "\r" + ANIM.clear, end="")
         return ""
 
@@ -515,10 +826,17 @@ class MazeGenerator():
         This ensures unique maze generation when no specific seed is
         provided by the user.
         """
-        random_seed = ''.join(random.choices(string.ascii_letters +
-                                             string.digits,
-                                             k=random.randint(1, 101)))
-        self.seed = random_seed
+        self.seed = self._new_random_seed()
+
+    @staticmethod
+    def _new_random_seed() -> str:
+        """Draws a random alphanumeric seed string.
+
+        Returns:
+            str: A string of letters and digits (length 1 to 101).
+        """
+        return ''.join(random.choices(string.ascii_letters + string.digits,
+                                      k=random.randint(1, 101)))
 
     def _apply_wall_color(self, choice: int, rotate: bool = False) -> None:
         """Applies a color theme or emoji set to the maze walls.
@@ -0,0 +1,207 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_grid.py                                      :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/28 09:12:44 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/28 09:12:44 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Block grids stored as one byte per block.
+
+`MazeGenerator.maze` maps each block `(x, y)` to a `MAZE` type. By
+default it is a dict, the fastest to read and write but about a hundred
+bytes per block. A `MazeGrid` is a mapping with the same interface,
+stored as one byte per block (the `MAZE` value), row-major, in any
+writable buffer; a `MmapMazeGrid` keeps that buffer in a memory-mapped
+file, so the grid can be larger than memory (set `GRID_FILE` in the
+configuration).
+
+Reading a block goes through Python code, slower than a dict lookup:
+the whole-grid passes (filling the grid, encoding the cells, finding
+the walkable blocks) read the buffer row by row instead.
+"""
+
+import mmap
+
+from collections.abc import MutableMapping
+from typing import Any, Iterable, Iterator, Tuple
+
+from .maze_customization import MAZE
+
+# The `MAZE` members, by value.
+_MEMBERS = tuple(sorted(MAZE, key=lambda member: member.value))
+
+
+class MazeGrid(MutableMapping[Tuple[int, int], MAZE]):
+    """A block grid of one byte per block, behaving like the grid dict.
+
+    Blocks cannot be added or deleted: every `(x, y)` of the grid exists,
+    and any other key is missing (`get` returns the default).
+
+    Attributes:
+        width (int): Width of the grid, in blocks.
+        height (int): Height of the grid, in blocks.
+        buffer (Any): The `MAZE` value of each block, row-major.
+    """
+
+    def __init__(self, width: int, height: int, buffer: Any = None) -> None:
+        """Initializes the grid; every block is empty at first.
+
+        Args:
+            width: Width of the grid, in blocks.
+            height: Height of the grid, in blocks.
+            buffer: A writable buffer of `width * height` bytes to store
+                    the grid in, or None for a new `bytearray`.
+        """
+        self.width = width
+        self.height = height
+        self.buffer = bytearray(width * height) if buffer is None else buffer
+
+    def __getitem__(self, key: Tuple[int, int]) -> MAZE:
+        """Returns the type of block `key`.
+
+        Raises:
+            KeyError: If `key` is outside of the grid.
+        """
+        x, y = key
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return _MEMBERS[self.buffer[y * self.width + x]]
+        raise KeyError(key)
+
+    def __setitem__(self, key: Tuple[int, int], value: MAZE) -> None:
+        """Sets the type of block `key`.
+
+        Raises:
+            KeyError: If `key` is outside of the grid.
+        """
+        x, y = key
+        if 0 <= x < self.width and 0 <= y < self.height:
+            self.buffer[y * self.width + x] = value.value
+        else:
+            raise KeyError(key)
+
+    def __delitem__(self, key: Tuple[int, int]) -> None:
+        """Blocks cannot be deleted.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("The blocks of a grid cannot be deleted")
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """Yields the coordinates of the blocks, row-major."""
+        for y in range(self.height):
+            for x in range(self.width):
+                yield (x, y)
+
+    def __reversed__(self) -> Iterator[Tuple[int, int]]:
+        """Yields the coordinates of the blocks, last one first."""
+        for y in range(self.height - 1, -1, -1):
+            for x in range(self.width - 1, -1, -1):
+                yield (x, y)
+
+    def __len__(self) -> int:
+        """Returns the number of blocks."""
+        return self.width * self.height
+
+    def __contains__(self, key: object) -> bool:
+        """Tells if `key` is the coordinates of a block of the grid."""
+        if not isinstance(key, tuple) or len(key) != 2:
+            return False
+        x, y = key
+        return bool(0 <= x < self.width and 0 <= y < self.height)
+
+    def get(self, key: Tuple[int, int], default: Any = None) -> Any:
+        """Returns the type of block `key`, or `default` outside of the
+        grid."""
+        x, y = key
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return _MEMBERS[self.buffer[y * self.width + x]]
+        return default
+
+    def select(self, types: Iterable[MAZE]) -> bytearray:
+        """Returns one byte per block, row-major: 1 if the type of the
+        block is in `types`, else 0.
+
+        Args:
+            types: The block types to select.
+
+        Returns:
+            bytearray: The flags, `width * height` bytes.
+        """
+        wanted = {member.value for member in types}
+        table = bytes(value in wanted for value in range(256))
+        return bytearray(self.buffer[:len(self)]).translate(table)
+
+    def fill(self, value: MAZE) -> None:
+        """Sets every block to `value`, one row at a time.
+
+        Args:
+            value: The type of every block.
+        """
+        row = bytes([value.value]) * self.width
+        for start in range(0, len(self), self.width):
+            self.buffer[start:start + self.width] = row
+
+    def close(self) -> None:
+        """Releases the buffer (nothing to do in memory)."""
+
+
+class MmapMazeGrid(MazeGrid):
+    """A `MazeGrid` stored in a memory-mapped file.
+
+    The file holds the raw grid: `width * height` bytes, row-major, one
+    `MAZE` value per block. It is created (or overwritten) at the right
+    size, and kept when the grid is closed.
+
+    Example:
+        >>> with MmapMazeGrid("maze.grid", 20001, 20001) as grid:
+        ...     grid[(1, 1)] = MAZE.empty
+
+    Attributes:
+        path (str): The grid file.
+    """
+
+    def __init__(self, path: str, width: int, height: int) -> None:
+        """Creates the grid file and maps it.
+
+        Args:
+            path: The grid file, overwritten if it exists.
+            width: Width of the grid, in blocks.
+            height: Height of the grid, in blocks.
+
+        Raises:
+            OSError: If the file cannot be created.
+        """
+        self.path = path
+        self._file = open(path, 'w+b')
+        try:
+            self._file.truncate(width * height)
+            self._mapping = mmap.mmap(self._file.fileno(), width * height)
+        except (OSError, ValueError):
+            self._file.close()
+            raise
+        super().__init__(width, height, self._mapping)
+
+    def __enter__(self) -> "MmapMazeGrid":
+        """Returns the grid itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Writes the grid back to its file and unmaps it."""
+        self.close()
+
+    def flush(self) -> None:
+        """Writes the modified blocks back to the file."""
+        self._mapping.flush()
+
+    def close(self) -> None:
+        """Writes the grid back to its file and unmaps it."""
+        if not self._mapping.closed:
+            self._mapping.flush()
+            self._mapping.close()
+        self._file.close()
@@ -0,0 +1,296 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_landmarks.py                                 :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/03/04 09:33:50 by roandrie        #+#    #+#               #
+#  Updated: 2026/03/04 09:33:50 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Landmark (ALT) index: A* guided by precomputed distances.
+
+An imperfect maze is not a tree, so `PathIndex` cannot answer its
+queries; a BFS per query explores everything closer than the target. A
+`LandmarkIndex` picks K landmarks spread over the maze (each one the
+cell farthest from the ones already picked) and keeps the BFS distance
+from each landmark to every cell. By the triangle inequality,
+|d(L, t) - d(L, v)| never exceeds d(v, t): the largest of these bounds
+over the landmarks is an admissible and consistent heuristic, and A*
+with it only explores the cells close to a shortest path.
+
+Each distance table is an `array('I')` of one entry per cell
+(`UNREACHED` for the cells the landmarks cannot reach). The tables are
+saved next to the maze file (`maze.txt.alt`), with the fingerprint of
+the maze, so another process loads them instead of running the K BFS
+again:
+
+    MZL1 | width | height | count | fingerprint (16 bytes) | tables
+
+The integers are little-endian, 4 bytes each.
+"""
+
+import heapq
+import struct
+import sys
+
+from array import array
+from typing import Dict, List, Tuple
+
+from .maze_cell_solver import _LETTERS, CellSolver
+from .maze_errors import MazeError
+from .maze_result import Maze
+
+UNREACHED = 0xFFFFFFFF
+DEFAULT_LANDMARKS = 8
+LANDMARKS_SUFFIX = ".alt"
+
+_MAGIC = b"MZL1"
+_HEADER = struct.Struct("<4sIII16s")
+
+
+class LandmarkIndex(CellSolver):
+    """Answers path queries with A* and landmark distance bounds.
+
+    Example:
+        >>> index = LandmarkIndex.for_maze_file("maze.txt")
+        >>> index.path((0, 0), (12, 7))
+
+    Attributes:
+        landmarks (List[Tuple[int, int]]): The landmark cells.
+        explored (int): Cells expanded by the last query.
+    """
+
+    def __init__(self, maze: Maze, count: int = DEFAULT_LANDMARKS,
+                 tables: "List[array[int]] | None" = None) -> None:
+        """Picks the landmarks and computes their distance tables.
+
+        Args:
+            maze: The maze to query.
+            count: The number of landmarks.
+            tables: The distance tables, already computed (see `load_tables`):
+                    `count` is then ignored.
+
+        Raises:
+            MazeError: If the entry or the exit is outside of the maze.
+            ValueError: If `count` is not positive.
+        """
+        super().__init__(maze)
+        if tables is None:
+            if count < 1:
+                raise ValueError("At least one landmark is needed")
+            tables = self._pick_landmarks(count)
+        self._tables = tables
+        self.landmarks = [(table.index(0) % self.width,
+                           table.index(0) // self.width) for table in tables]
+
+    def _distances(self, start: int) -> "array[int]":
+        """Returns the BFS distance from cell `start` to every cell."""
+        moves, order, reached = self._search(start, -1)
+        back = self._back
+        distances = array('I', [UNREACHED]) * len(moves)
+        distances[start] = 0
+        for cell in order[1:reached]:
+            distances[cell] = distances[cell - back[moves[cell]]] + 1
+        return distances
+
+    def _pick_landmarks(self, count: int) -> "List[array[int]]":
+        """Picks `count` landmarks by farthest point sampling, from the
+        entry, and returns their distance tables."""
+        entry = self._distances(self._index(self.entry))
+        # Distance to the nearest landmark; 0 for the unreachable cells,
+        # which are never picked.
+        nearest = array('I', entry)
+        for cell, distance in enumerate(entry):
+            if distance == UNREACHED:
+                nearest[cell] = 0
+        tables: "List[array[int]]" = []
+        for _ in range(count):
+            farthest = max(range(len(nearest)), key=nearest.__getitem__)
+            if tables and not nearest[farthest]:
+                break
+            table = self._distances(farthest)
+            tables.append(table)
+            nearest = array('I', map(min, nearest, table))
+        return tables
+
+    def _astar(self, start: int, goal: int) -> Dict[int, int] | None:
+        """Runs A* from `start` to `goal`.
+
+        Returns:
+            Dict[int, int] | None: The move code that reached each cell
+            expanded, or None if `goal` cannot be reached.
+        """
+        self.explored = 0
+        if ((self._tables[0][start] == UNREACHED)
+                != (self._tables[0][goal] == UNREACHED)):
+            return None
+        # The lower bound of a cell is the largest |d(L, goal) - d(L, v)|.
+        targets = [(table, table[goal]) for table in self._tables]
+        cells, steps = self._cells, self._steps
+        came = {start: 0}
+        best = {start: 0}
+        heap = [(0, 0, start)]
+        push, pop = heapq.heappush, heapq.heappop
+        while heap:
+            _, negative, cell = pop(heap)
+            walked = -negative
+            if walked > best[cell]:
+                continue
+            self.explored += 1
+            if cell == goal:
+                return came
+            walked += 1
+            for offset, code in steps[cells[cell]]:
+                neighbour = cell + offset
+                if walked >= best.get(neighbour, UNREACHED):
+                    continue
+                best[neighbour] = walked
+                came[neighbour] = code
+                bound = 0
+                for table, target in targets:
+                    gap = table[neighbour] - target
+                    if gap < 0:
+                        gap = -gap
+                    if gap > bound:
+                        bound = gap
+                # Ties go to the deepest cell: fewer cells expanded.
+                push(heap, (walked + bound, -walked, neighbour))
+        return None
+
+    def path(self, start: Tuple[int, int] | None = None,
+             end: Tuple[int, int] | None = None) -> str | None:
+        """Returns the moves of a shortest path between two cells.
+
+        Any shortest path: in an imperfect maze, it may differ from the
+        solution of the output file when several paths are as short.
+
+        Args:
+            start: The starting cell, the entry of the maze by default.
+            end: The target cell, the exit of the maze by default.
+
+        Returns:
+            str | None: The moves from `start` to `end`, one of 'NESW' per
+            cell, or None if `end` cannot be reached.
+
+        Raises:
+            MazeError: If a cell is outside of the maze.
+        """
+        first = self._index(self.entry if start is None else start)
+        goal = self._index(self.exit if end is None else end)
+        came = self._astar(first, goal)
+        if came is None:
+            return None
+        back = self._back
+        moves = bytearray()
+        cell = goal
+        while cell != first:
+            code = came[cell]
+            moves.append(code)
+            cell -= back[code]
+        moves.reverse()
+        return moves.translate(_LETTERS).decode("ascii")
+
+    def distance(self, start: Tuple[int, int], end: Tuple[int, int]) -> int:
+        """Returns the number of moves of a shortest path between two
+        cells.
+
+        Args:
+            start: The (x, y) cell to start from.
+            end: The (x, y) cell to reach.
+
+        Returns:
+            int: The number of moves, or -1 if `end` cannot be reached.
+
+        Raises:
+            MazeError: If a cell is outside of the maze.
+        """
+        moves = self.path(start, end)
+        return -1 if moves is None else len(moves)
+
+    def save_tables(self, path: str, maze: Maze) -> None:
+        """Writes the distance tables to `path`.
+
+        Args:
+            path: The index file, usually the maze file + `.alt`.
+            maze: The maze of the index, whose fingerprint is stored.
+        """
+        with open(path, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, self.width, self.height,
+                                    len(self._tables), maze.fingerprint()))
+            for table in self._tables:
+                if sys.byteorder == "big":
+                    table = array('I', table)
+                    table.byteswap()
+                table.tofile(file)
+
+    @classmethod
+    def load_tables(cls, path: str, maze: Maze) -> "LandmarkIndex":
+        """Reads the distance tables saved for `maze`.
+
+        Args:
+            path: The index file.
+            maze: The maze the index was saved for.
+
+        Returns:
+            LandmarkIndex: The index, without any BFS.
+
+        Raises:
+            OSError: If the file cannot be read.
+            MazeError: If the file is not an index of this maze.
+        """
+        size = maze.width * maze.height
+        with open(path, 'rb') as file:
+            header = file.read(_HEADER.size)
+            if len(header) != _HEADER.size:
+                raise MazeError("Not a landmark index")
+            magic, width, height, count, digest = _HEADER.unpack(header)
+            if magic != _MAGIC or not count:
+                raise MazeError("Not a landmark index")
+            if ((width, height) != (maze.width, maze.height)
+                    or digest != maze.fingerprint()):
+                raise MazeError("The landmark index is for another maze")
+            tables = []
+            for _ in range(count):
+                table = array('I')
+                try:
+                    table.fromfile(file, size)
+                except EOFError:
+                    raise MazeError("Truncated landmark index")
+                if sys.byteorder == "big":
+                    table.byteswap()
+                tables.append(table)
+        return cls(maze, tables=tables)
+
+    @classmethod
+    def for_maze_file(cls, path: str,
+                      count: int = DEFAULT_LANDMARKS) -> "LandmarkIndex":
+        """Returns the index of the maze file at `path`.
+
+        The index saved next to it is loaded if it matches the maze;
+        otherwise the index is computed and saved there (if the
+        directory is writable).
+
+        Args:
+            path: The maze file, in any format `Maze.load` reads.
+            count: The number of landmarks of a new index.
+
+        Returns:
+            LandmarkIndex: The index.
+
+        Raises:
+            MazeError: If the maze file is not valid.
+        """
+        maze = Maze.load(path)
+        try:
+            return cls.load_tables(path + LANDMARKS_SUFFIX, maze)
+        except (OSError, MazeError):
+            pass
+        index = cls(maze, count)
+        try:
+            index.save_tables(path + LANDMARKS_SUFFIX, maze)
+        except OSError:
+            pass
+        return index
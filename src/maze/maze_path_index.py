@@ -0,0 +1,218 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_path_index.py                                :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/03/03 10:21:09 by roandrie        #+#    #+#               #
+#  Updated: 2026/03/03 10:21:09 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Path queries answered in O(log n) on perfect mazes.
+
+The corridors of a perfect maze form a tree: between two cells there is
+exactly one path, through their lowest common ancestor (LCA) once the
+tree is rooted. A `PathIndex` roots it at the entry with one BFS, keeps
+the depth of each cell and the move that reached it from its parent, and
+builds binary lifting tables (the ancestor 2^k levels up, for each k).
+Then:
+
+- `distance(a, b)`: depth[a] + depth[b] - 2 * depth[lca], in O(log n);
+- `next_step(a, b)`: the parent of `a`, or the ancestor of `b` just
+  below `a` when `a` is the LCA, in O(log n);
+- `path(a, b)`: the moves up from `a` to the LCA, then down to `b`, in
+  O(length of the path).
+
+An imperfect maze is not a tree (some cells are reached twice): every
+query then falls back to a BFS (see `CellSolver`). The '42' pattern and
+any other closed cell are simply out of the tree.
+
+The tables take 4 bytes per cell and per level (log2 of the depth of
+the tree), on top of the cells of the maze.
+"""
+
+from array import array
+from typing import List, Tuple
+
+from .maze_cell_solver import _LETTERS, CellSolver
+from .maze_result import Maze
+
+# Move up to the parent: the opposite of the move that reached the cell.
+_UP_LETTERS = bytes.maketrans(b"\x01\x02\x03\x04", b"NWSE")
+# Number of open walls of a cell, by wall nibble.
+_OPEN_WALLS = bytes(4 - bin(nibble).count("1") for nibble in range(16))
+
+
+class PathIndex(CellSolver):
+    """Answers path queries between cells of a maze.
+
+    Example:
+        >>> index = PathIndex(Maze.load("maze.txt"))
+        >>> steps = index.distance(enemy, player)
+        >>> enemy = index.next_step(enemy, player)
+
+    Attributes:
+        perfect (bool): True if the maze is a tree and the queries use the
+            index, False if they fall back to a BFS.
+        levels (int): Number of binary lifting levels.
+    """
+
+    def __init__(self, maze: Maze) -> None:
+        """Roots the tree of corridors at the entry and builds the index.
+
+        Args:
+            maze: The maze to query.
+
+        Raises:
+            MazeError: If the entry or the exit is outside of the maze.
+        """
+        super().__init__(maze)
+        size = self.width * self.height
+        root = self._index(self.entry)
+        moves, order, reached = self._search(root, -1)
+
+        # A connected graph is a tree when it has one edge less than nodes.
+        edges = sum(map(_OPEN_WALLS.__getitem__,
+                        map(self._cells.__getitem__, order[:reached]))) // 2
+        self.perfect = edges == reached - 1
+        self._moves = moves
+        self._depth: "array[int]" = array('i', [-1]) * size
+        self._up: List["array[int]"] = []
+        self.levels = 0
+        if not self.perfect:
+            return
+
+        # Cells out of the tree are their own parent.
+        parent = array('i', range(size))
+        depth, back = self._depth, self._back
+        depth[root] = 0
+        for cell in order[1:reached]:
+            above = cell - back[moves[cell]]
+            parent[cell] = above
+            depth[cell] = depth[above] + 1
+        self._up.append(parent)
+        deepest = max(depth)
+        while 1 << len(self._up) <= deepest:
+            half = self._up[-1]
+            self._up.append(array('i', map(half.__getitem__, half)))
+        self.levels = len(self._up)
+
+    def _ancestor(self, cell: int, levels: int) -> int:
+        """Returns the ancestor `levels` levels above `cell`."""
+        level = 0
+        while levels:
+            if levels & 1:
+                cell = self._up[level][cell]
+            levels >>= 1
+            level += 1
+        return cell
+
+    def _lca(self, first: int, second: int) -> int:
+        """Returns the lowest common ancestor of two cells of the tree."""
+        depth = self._depth
+        if depth[first] < depth[second]:
+            first, second = second, first
+        first = self._ancestor(first, depth[first] - depth[second])
+        if first == second:
+            return first
+        for up in reversed(self._up):
+            if up[first] != up[second]:
+                first, second = up[first], up[second]
+        return self._up[0][first]
+
+    def distance(self, start: Tuple[int, int], end: Tuple[int, int]) -> int:
+        """Returns the number of moves of the shortest path between two
+        cells.
+
+        Args:
+            start: The (x, y) cell to start from.
+            end: The (x, y) cell to reach.
+
+        Returns:
+            int: The number of moves, or -1 if `end` cannot be reached.
+
+        Raises:
+            MazeError: If a cell is outside of the maze.
+        """
+        first, second = self._index(start), self._index(end)
+        if not self.perfect:
+            moves = self.solve(start, end)
+            return -1 if moves is None else len(moves)
+        depth = self._depth
+        if depth[first] < 0 or depth[second] < 0:
+            return -1 if first != second else 0
+        return (depth[first] + depth[second]
+                - 2 * depth[self._lca(first, second)])
+
+    def next_step(self, start: Tuple[int, int],
+                  end: Tuple[int, int]) -> Tuple[int, int]:
+        """Returns the neighbour of `start` one step closer to `end`.
+
+        Args:
+            start: The (x, y) cell to move from.
+            end: The (x, y) cell to reach.
+
+        Returns:
+            Tuple[int, int]: The next cell, or `start` itself if it is
+            `end` or cannot reach it.
+
+        Raises:
+            MazeError: If a cell is outside of the maze.
+        """
+        first, second = self._index(start), self._index(end)
+        if not self.perfect:
+            moves = self.solve(start, end)
+            if not moves:
+                return start
+            step = "NESW".index(moves[0])
+            return (start[0] + (0, 1, 0, -1)[step],
+                    start[1] + (-1, 0, 1, 0)[step])
+        depth = self._depth
+        if first == second or depth[first] < 0 or depth[second] < 0:
+            return start
+        if self._lca(first, second) != first:
+            cell = self._up[0][first]
+        else:
+            cell = self._ancestor(second, depth[second] - depth[first] - 1)
+        return (cell % self.width, cell // self.width)
+
+    def path(self, start: Tuple[int, int] | None = None,
+             end: Tuple[int, int] | None = None) -> str | None:
+        """Returns the moves of the shortest path between two cells.
+
+        Args:
+            start: The starting cell, the entry of the maze by default.
+            end: The target cell, the exit of the maze by default.
+
+        Returns:
+            str | None: The moves from `start` to `end`, one of 'NESW' per
+            cell, or None if `end` cannot be reached.
+
+        Raises:
+            MazeError: If a cell is outside of the maze.
+        """
+        start = self.entry if start is None else start
+        end = self.exit if end is None else end
+        if not self.perfect:
+            return self.solve(start, end)
+        first, second = self._index(start), self._index(end)
+        depth = self._depth
+        if first == second:
+            return ""
+        if depth[first] < 0 or depth[second] < 0:
+            return None
+        lca = self._lca(first, second)
+        parent, moves = self._up[0], self._moves
+        up = bytearray()
+        while first != lca:
+            up.append(moves[first])
+            first = parent[first]
+        down = bytearray()
+        while second != lca:
+            down.append(moves[second])
+            second = parent[second]
+        down.reverse()
+        return (up.translate(_UP_LETTERS).decode("ascii")
+                + down.translate(_LETTERS).decode("ascii"))
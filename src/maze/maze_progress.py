@@ -0,0 +1,146 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_progress.py                                  :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/26 14:05:37 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/26 14:05:37 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Progress reports, deadline and cancellation of a generation.
+
+A `MazeProgress` given to a `MazeGenerator` is advanced by the algorithms
+as they carve (see `MazeGenerator.break_wall`) and as they scan the grid
+without carving (the hunt phase, the wall breakers, `path_checker`). The
+clock is only read once every `CHECK_EVERY` steps, so the hook costs a
+counter decrement in the hot loops.
+
+When the clock is read, the generation is stopped with
+`MazeGenerationCancelled` if its deadline passed or if `cancel` was
+called (from another thread, a signal handler...), and the callback is
+called with the cells carved so far if `interval` seconds passed since
+the last report.
+"""
+
+import time
+
+from typing import Callable
+
+from .maze_errors import MazeGenerationCancelled
+
+CHECK_EVERY = 64
+
+
+class MazeProgress():
+    """Reports the progress of a generation and enforces its deadline.
+
+    Example:
+        >>> progress = MazeProgress(lambda done, total: print(done, total),
+        ...                         timeout=2.0)
+        >>> MazeGenerator(config, progress=progress).generate()
+
+    Attributes:
+        carved (int): Cells carved so far.
+        total (int): Cells to carve (the cells of the '42' pattern are
+            not counted).
+        deadline (float | None): The `time.monotonic()` time after which
+            the generation is cancelled, or None.
+        interval (float): Minimum time between two reports, in seconds.
+    """
+
+    def __init__(self, callback: Callable[[int, int], None] | None = None,
+                 interval: float = 0.5, timeout: float | None = None,
+                 deadline: float | None = None) -> None:
+        """Initializes the hook.
+
+        Args:
+            callback: Called with `(carved, total)` at most every
+                      `interval` seconds, and once at the end.
+            interval: Minimum time between two reports, in seconds.
+            timeout: Seconds from now before the generation is cancelled.
+            deadline: A `time.monotonic()` time before which the generation
+                      must end (the earliest of `timeout` and `deadline`
+                      is kept). It is shared between processes on the same
+                      machine, so it can be computed before a task is sent
+                      to a worker.
+        """
+        self.callback = callback
+        self.interval = interval
+        if timeout is not None:
+            end = time.monotonic() + timeout
+            deadline = end if deadline is None else min(deadline, end)
+        self.deadline = deadline
+        self.carved = 0
+        self.total = 0
+        self._countdown = CHECK_EVERY
+        self._next_report = 0.0
+        self._cancelled = False
+
+    def start(self, total: int, carved: int = 0) -> None:
+        """Resets the counters at the start of a generation.
+
+        Args:
+            total: Number of cells to carve.
+            carved: Number of cells already carved (by a generation
+                    resumed from a checkpoint).
+
+        Raises:
+            MazeGenerationCancelled: If the deadline already passed.
+        """
+        self.carved = carved
+        self.total = total
+        self._next_report = time.monotonic() + self.interval
+        self.check()
+
+    def advance(self, cells: int = 0) -> None:
+        """Counts one step of an algorithm.
+
+        Args:
+            cells: Number of cells carved by this step (0 for a step that
+                   only reads the grid).
+
+        Raises:
+            MazeGenerationCancelled: If the deadline passed or the
+                                     generation was cancelled.
+        """
+        self.carved += cells
+        self._countdown -= 1
+        if self._countdown <= 0:
+            self.check()
+
+    def check(self) -> None:
+        """Reads the clock: stops the generation or reports if needed.
+
+        Raises:
+            MazeGenerationCancelled: If the deadline passed or the
+                                     generation was cancelled.
+        """
+        self._countdown = CHECK_EVERY
+        now = time.monotonic()
+        if self._cancelled:
+            raise MazeGenerationCancelled(
+                f"Generation cancelled after {self.carved} of {self.total} "
+                f"cells")
+        if self.deadline is not None and now >= self.deadline:
+            raise MazeGenerationCancelled(
+                f"Generation deadline reached after {self.carved} of "
+                f"{self.total} cells")
+        if self.callback is not None and now >= self._next_report:
+            self._next_report = now + self.interval
+            self.callback(self.carved, self.total)
+
+    def finish(self) -> None:
+        """Reports the final count, whatever the time since the last
+        report."""
+        if self.callback is not None:
+            self.callback(self.carved, self.total)
+
+    def cancel(self) -> None:
+        """Stops the generation at its next clock check.
+
+        Safe to call from another thread or from a signal handler.
+        """
+        self._cancelled = True
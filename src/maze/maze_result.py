@@ -0,0 +1,260 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_result.py                                    :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/21 10:04:19 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/21 10:04:19 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Immutable result of a maze generation.
+
+A `Maze` holds what the output file describes, and nothing else: one wall
+nibble per cell (see `maze_encoding`), the entry, the exit, the seed and
+the solution moves. It does no I/O by itself; the serializations are
+separate methods:
+
+- `to_hex()` / `dump(file)`: the text format of the output file (one
+  hexadecimal digit per cell, then the entry, the exit and the solution).
+- `to_bytes()` / `from_bytes()`: a compact binary format (`.mzb`), two
+  cells per byte.
+- `write(path)` / `load(path)`: a file in any format of `maze_codecs`
+  (text or binary, optionally compressed), picked from its extension and
+  streamed by chunks.
+"""
+
+import io
+
+from typing import Any, Iterator, List, NamedTuple, TextIO, Tuple
+
+from .output.maze_codecs import (CHUNK_SIZE, MZB_HEADER, MZB_MAGIC,
+                                 SEED_INT, SEED_NONE, SEED_STR, codec_for,
+                                 open_maze_file)
+from .output.maze_encoding import (encode_cells, fingerprint, pack_cells,
+                                   path_to_directions)
+from .output.maze_reader import MazeReader
+
+_HEX = bytes.maketrans(bytes(range(16)), b"0123456789ABCDEF")
+
+
+class Maze(NamedTuple):
+    """A generated maze, detached from its generator.
+
+    Attributes:
+        width (int): Number of cells per row.
+        height (int): Number of rows.
+        cells (bytes): One wall nibble per cell, row-major (bit 0 = North,
+            1 = East, 2 = South, 3 = West, set = closed).
+        entry (Tuple[int, int]): The (x, y) cell of the entry.
+        exit (Tuple[int, int]): The (x, y) cell of the exit.
+        seed (str | int | None): The seed the maze was generated with.
+        directions (str): The solution moves from entry to exit ('NESW').
+    """
+    width: int
+    height: int
+    cells: bytes
+    entry: Tuple[int, int]
+    exit: Tuple[int, int]
+    seed: str | int | None
+    directions: str
+
+    @classmethod
+    def from_generator(cls, generator: Any, path: List[Tuple[int, int]],
+                       cells: bytes | None = None,
+                       directions: str | None = None) -> "Maze":
+        """Builds the result of a generated `MazeGenerator`.
+
+        Args:
+            generator: A generated `MazeGenerator` instance.
+            path: Its `MazeSolver.path` (not modified).
+            cells: Its wall nibbles, if already encoded (`MazeSolver.cells`
+                   after a search on the cells of a `MazeGrid`); encoded
+                   from the grid otherwise.
+            directions: Its solution moves, if already known
+                        (`MazeSolver.directions`); `path` is then not read.
+
+        Returns:
+            Maze: The result. The '42' pattern counts as closed walls.
+        """
+        entry_x, entry_y = generator.entry_coord
+        exit_x, exit_y = generator.exit_coord
+        return cls((generator.width - 1) // 2, (generator.height - 1) // 2,
+                   bytes(encode_cells(generator)) if cells is None
+                   else cells,
+                   ((entry_x - 1) // 2, (entry_y - 1) // 2),
+                   ((exit_x - 1) // 2, (exit_y - 1) // 2),
+                   generator.seed, path_to_directions(generator, path)
+                   if directions is None else directions)
+
+    def walls(self, x: int, y: int) -> int:
+        """Returns the wall nibble of the cell (x, y).
+
+        Args:
+            x: The column of the cell.
+            y: The row of the cell.
+
+        Returns:
+            int: The closed walls of the cell (see `Maze.cells`).
+        """
+        return self.cells[y * self.width + x]
+
+    def fingerprint(self) -> bytes:
+        """Returns the canonical fingerprint of the maze.
+
+        Mazes with the same size, entry, exit and walls share it, whatever
+        their seed (see `maze_encoding.fingerprint`).
+
+        Returns:
+            bytes: A 16 bytes digest.
+        """
+        return fingerprint(self.width, self.height, self.entry, self.exit,
+                           pack_cells(self.cells))
+
+    def dump(self, file: TextIO) -> None:
+        """Writes the text format to `file`.
+
+        Args:
+            file: Any object with a `write(str)` method.
+        """
+        for chunk in self._hex_chunks():
+            file.write(chunk.decode("ascii"))
+
+    def to_hex(self) -> str:
+        """Returns the text format, as written to the output file.
+
+        Returns:
+            str: The hexadecimal grid, the entry, the exit and the moves.
+        """
+        return b"".join(self._hex_chunks()).decode("ascii")
+
+    def write(self, path: str) -> None:
+        """Writes the maze to the file at `path`, in the format of its
+        extension ('.txt', '.txt.gz', '.txt.xz', '.mzb', '.mzb.gz' or
+        '.mzb.xz').
+
+        Args:
+            path: The output file, created or replaced.
+
+        Raises:
+            ValueError: If the extension is not a known format.
+        """
+        codec = codec_for(path)
+        with open_maze_file(path, 'wb') as file:
+            for chunk in self.chunks(codec.binary):
+                file.write(chunk)
+
+    def chunks(self, binary: bool = False) -> Iterator[bytes]:
+        """Yields the text or the binary format by chunks of about
+        `CHUNK_SIZE` bytes, to stream it without building it as a whole.
+
+        Args:
+            binary: True for the binary format, False for the text one.
+
+        Yields:
+            bytes: Consecutive parts of the format.
+        """
+        return self._mzb_chunks() if binary else self._hex_chunks()
+
+    @classmethod
+    def load(cls, path: str, index: int = 0) -> "Maze":
+        """Reads a maze file written by `write`, in any of its formats, or
+        one maze of an archive (see `maze_archive`).
+
+        Args:
+            path: The maze file; its extension selects the format.
+            index: For a '.mza' archive, the position of the maze in it.
+
+        Returns:
+            Maze: The maze. The seed is None for the text formats, which
+            do not store it.
+
+        Raises:
+            ValueError: If the extension is not a known format.
+            IndexError: If the archive has no maze at `index`.
+            MazeError: If the file is not a valid maze.
+        """
+        if path.endswith(".mza"):
+            from .maze_archive import MazeArchive
+
+            with MazeArchive(path) as archive:
+                return archive[index]
+        with MazeReader.open(path) as reader:
+            return cls._read(reader)
+
+    @classmethod
+    def _read(cls, reader: MazeReader) -> "Maze":
+        """Builds a maze from the rows and the description of `reader`."""
+        cells = b"".join(reader.rows())
+        return cls(reader.width, reader.height, cells, reader.entry,
+                   reader.exit, reader.seed, reader.directions)
+
+    def _hex_chunks(self) -> Iterator[bytes]:
+        """Yields the text format as ASCII bytes, by chunks of rows.
+
+        Each chunk of cells is converted to hexadecimal digits with one
+        `translate` call, then split into lines: the grid is never copied
+        as a whole and no Python code runs per cell.
+
+        Yields:
+            bytes: Consecutive parts of the text format.
+        """
+        width = self.width
+        view = memoryview(self.cells)
+        step = width * max(1, CHUNK_SIZE // (width + 1))
+        for start in range(0, len(view), step):
+            digits = view[start:start + step].tobytes().translate(_HEX)
+            yield b"\n".join([digits[i:i + width]
+                              for i in range(0, len(digits), width)]) + b"\n"
+        yield (f"\n{self.entry[0]},{self.entry[1]}\n"
+               f"{self.exit[0]},{self.exit[1]}\n"
+               f"{self.directions}\n").encode("ascii")
+
+    def to_bytes(self) -> bytes:
+        """Returns the compact binary format (`.mzb`).
+
+        Returns:
+            bytes: The header, the seed, the moves and the packed cells.
+        """
+        return b"".join(self._mzb_chunks())
+
+    def _mzb_chunks(self) -> Iterator[bytes]:
+        """Yields the binary format: the header, then the packed cells by
+        chunks of `CHUNK_SIZE` bytes.
+
+        Yields:
+            bytes: Consecutive parts of the binary format.
+        """
+        if self.seed is None:
+            kind, seed = SEED_NONE, b""
+        elif isinstance(self.seed, int):
+            kind, seed = SEED_INT, str(self.seed).encode()
+        else:
+            kind, seed = SEED_STR, self.seed.encode()
+        directions = self.directions.encode("ascii")
+        yield MZB_HEADER.pack(MZB_MAGIC, self.width, self.height,
+                              self.entry[0], self.entry[1],
+                              self.exit[0], self.exit[1],
+                              kind, len(seed), len(directions))
+        yield seed + directions
+        # An even number of cells per chunk: no byte is shared by two.
+        step = CHUNK_SIZE * 2
+        for start in range(0, len(self.cells), step):
+            yield pack_cells(self.cells[start:start + step])
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Maze":
+        """Reads a maze from its binary format.
+
+        Args:
+            data: Bytes produced by `to_bytes`.
+
+        Returns:
+            Maze: The maze.
+
+        Raises:
+            MazeError: If the data is not a maze in the binary format.
+        """
+        return cls._read(MazeReader(io.BytesIO(data), binary=True))
@@ -0,0 +1,184 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_rules.py                                     :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/20 14:08:12 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/20 14:08:12 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Validation rules shared by `MazeConfig` and the batch loader.
+
+The rules and their error messages live here, without pydantic, so that
+`maze_batch` can check thousands of specs with plain Python while staying
+in agreement with the configuration model.
+"""
+
+import re
+
+from typing import Any, Iterable, List, Mapping, Tuple
+
+from .maze_errors import MazeConfigError
+from .maze_fortytwo_pattern import fortytwo_pattern
+from .output.maze_codecs import OUTPUT_SUFFIXES
+
+CONFIG_KEYS = frozenset({"width", "height", "entry", "exit", "output_file",
+                         "perfect", "seed", "display", "algorithm",
+                         "tile_size", "workers", "grid_file"})
+
+MIN_SIZE = 3
+MIN_TILE_SIZE = 4
+MIN_WORKERS = 1
+# Any format of `maze_codecs`, e.g. 'maze.txt' or 'maze.txt.gz'.
+OUTPUT_FILE_PATTERN = (r'.+(' + '|'.join(map(re.escape, OUTPUT_SUFFIXES))
+                       + r')$')
+
+VALID_DISPLAY = ["ascii", "emoji"]
+VALID_ALGORITHMS = ["rb", "huntandkill"]
+
+
+def parse_coordinate(coord: Any) -> Any:
+    """Parses a coordinate string into a tuple of integers.
+
+    Allows the user to provide coordinates in the config file as a
+    string "x,y". Anything else is returned as is, for the type
+    validation to check.
+
+    Args:
+        coord: A string in format "x,y" or an already parsed tuple.
+
+    Returns:
+        Any: The parsed (x, y) coordinates, or `coord` unchanged.
+
+    Raises:
+        ValueError: If the format is incorrect or values are not integers.
+    """
+    if isinstance(coord, str):
+        if len(coord) < 3:
+            raise ValueError("Coordinates are invalid. (Use this format: "
+                             "'0,0')")
+        if ',' not in coord:
+            raise ValueError("Coordinates are invalid. (Use this format: "
+                             "'0,0')")
+
+        splited_coord = coord.split(',')
+        if len(splited_coord) != 2:
+            raise ValueError("Coordinates are invalid. (Use this format: "
+                             "'0,0')")
+
+        try:
+            coord_x = int(splited_coord[0])
+            coord_z = int(splited_coord[1])
+        except ValueError:
+            raise ValueError("ENTRY and EXIT need to be int()")
+
+        return (coord_x, coord_z)
+    return coord
+
+
+def normalize_display(display: str | None) -> str:
+    """Normalizes and validates the display mode.
+
+    Args:
+        display: The raw string from the config (case-insensitive).
+
+    Returns:
+        str: The normalized mode ('ascii' or 'emoji').
+
+    Raises:
+        MazeConfigError: If the mode is unknown.
+    """
+    value = display.lower() if display is not None else "emoji"
+    if value not in VALID_DISPLAY:
+        raise MazeConfigError(f"Invalid display mode. Use {VALID_DISPLAY}")
+    return value
+
+
+def normalize_algorithm(algo: str | None) -> str:
+    """Normalizes and validates the algorithm selection.
+
+    Args:
+        algo: The raw string from the config (case-insensitive).
+
+    Returns:
+        str: The normalized algorithm identifier ('rb' or 'huntandkill').
+
+    Raises:
+        MazeConfigError: If the algorithm is unknown.
+    """
+    value = algo.lower() if algo is not None else "rb"
+    if value not in VALID_ALGORITHMS:
+        raise MazeConfigError(f"Invalid algorithm mode. Use "
+                              f"{VALID_ALGORITHMS}")
+    return value
+
+
+def check_layout(width: int, height: int, entry: Tuple[int, int],
+                 exit: Tuple[int, int]) -> None:
+    """Checks the placement of the entry and the exit.
+
+    Checks that:
+    1. Entry and Exit coordinates are within grid bounds.
+    2. Entry and Exit are not identical.
+    3. Entry and Exit do not overlap with the reserved '42' pattern.
+    4. Entry and Exit are not side by side.
+
+    Args:
+        width: The maze width, in cells.
+        height: The maze height, in cells.
+        entry: The (x, y) cell of the entry.
+        exit: The (x, y) cell of the exit.
+
+    Raises:
+        MazeConfigError: If any logical constraint is violated.
+    """
+    entry_x, entry_y = entry
+    if not (0 <= entry_x < width and 0 <= entry_y < height):
+        raise MazeConfigError(f"Entry coords: {entry} is outside maze"
+                              " dimensions.")
+
+    exit_x, exit_y = exit
+    if not (0 <= exit_x < width and 0 <= exit_y < height):
+        raise MazeConfigError(f"Exit coords: {exit} is outside maze"
+                              " dimensions.")
+
+    if width == 3 and height == 3:
+        raise MazeConfigError("Maze dimensions are invalid")
+
+    if entry == exit:
+        raise MazeConfigError("Entry and Exit cannot be at the exact same "
+                              "position.")
+
+    forty_two_coords = fortytwo_pattern(width, height)
+    if entry in forty_two_coords:
+        raise MazeConfigError("Can't place Entry here. Reserved to '42'")
+    if exit in forty_two_coords:
+        raise MazeConfigError("Can't place Exit here. Reserved to '42'")
+
+    if abs(entry_x - exit_x) + abs(entry_y - exit_y) == 1:
+        raise MazeConfigError("Entry and Exit cannot be side by side.")
+
+
+def describe_errors(errors: Iterable[Mapping[str, Any]]) -> str:
+    """Turns pydantic validation errors into a user-friendly message.
+
+    Like the original config parser, only the last error is reported.
+
+    Args:
+        errors: The `ValidationError.errors()` list.
+
+    Returns:
+        str: The message, formatted as "field: reason".
+    """
+    messages: List[str] = []
+    for error in errors:
+        msg = error['msg']
+        if error['type'] == "string_pattern_mismatch":
+            msg = f"File must end with one of {OUTPUT_SUFFIXES}"
+        elif error['type'] == "greater_than_equal":
+            msg = (f"Too small. Must be at least {error['ctx']['ge']}")
+        messages.append(f"{error['loc'][0]}: {msg}")
+    return messages[-1]
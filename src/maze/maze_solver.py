@@ -15,17 +15,91 @@
 This module provides the `MazeSolver` class, which implements algorithms
 to solve generated mazes. It includes a Breadth-First Search (BFS) for
 finding the shortest path and a recursive Depth-First Search (DFS) for
-counting all possible solution paths. It also handles the visual rendering
-of these paths in the terminal.
+counting all possible solution paths. The BFS runs on flat arrays
+indexed by `y * width + x` and can also produce a full distance map. It
+also handles the visual rendering of these paths in the terminal.
+
+On imperfect mazes, whose broken walls open long straight corridors,
+`find_path` can also run a jump-point search (JPS) for 4-connected
+grids: an A* whose successors are only the jump points, the blocks
+where a straight run has to turn or meets a side opening it could not
+have reached sooner. The blocks in between are scanned, never queued.
+Both searches count the blocks they expand in `expanded`.
 """
 
 import time
 
-from typing import Any, Dict, List, Tuple
-from colorama import Cursor
+from array import array
+from heapq import heappop, heappush
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple
 
-from .maze_generator import MazeGenerator
 from .maze_customization import COLORS, MAZE, DISPLAY_MODE
+from .maze_grid import MazeGrid
+
+if TYPE_CHECKING:
+    from .maze_generator import MazeGenerator
+
+
+def _run(walkable: bytearray, cell: int, step: int, goal: int,
+         width: int) -> int:
+    """Walks horizontally from `cell` until a jump point.
+
+    Args:
+        walkable: One byte per block, 0 for the blocks that cannot be
+                  walked on (the outer border included).
+        cell: The block the run starts from (excluded).
+        step: 1 to walk right, -1 to walk left.
+        goal: The block searched for.
+        width: The width of the grid, in blocks.
+
+    Returns:
+        int: The goal, or the first block with a forced neighbour (a
+        block above or below it that is open while the one before it on
+        that side is closed), or -1 if the run hits a wall first.
+    """
+    while True:
+        cell += step
+        if not walkable[cell]:
+            return -1
+        if cell == goal:
+            return cell
+        if ((walkable[cell - width] and not walkable[cell - width - step])
+                or (walkable[cell + width]
+                    and not walkable[cell + width - step])):
+            return cell
+
+
+def _jump(walkable: bytearray, cell: int, step: int, goal: int,
+          width: int) -> int:
+    """Walks from `cell` in the direction of `step` until a jump point.
+
+    A vertical run also stops on a block from which a horizontal run
+    (see `_run`) finds a jump point: vertical moves come first in the
+    canonical paths, so the side corridors are only searched from there.
+
+    Args:
+        walkable: One byte per block, as for `_run`.
+        cell: The block the run starts from (excluded).
+        step: 1 or -1 (right, left), `width` or `-width` (down, up).
+        goal: The block searched for.
+        width: The width of the grid, in blocks.
+
+    Returns:
+        int: The jump point, or -1 if the run hits a wall first.
+    """
+    if step in (1, -1):
+        return _run(walkable, cell, step, goal, width)
+    while True:
+        cell += step
+        if not walkable[cell]:
+            return -1
+        if cell == goal:
+            return cell
+        if ((walkable[cell - 1] and not walkable[cell - 1 - step])
+                or (walkable[cell + 1] and not walkable[cell + 1 - step])
+                or _run(walkable, cell, 1, goal, width) >= 0
+                or _run(walkable, cell, -1, goal, width) >= 0):
+            return cell
 
 
 class MazeSolver():
@@ -41,126 +115,342 @@ class MazeSolver():
         path (List[Tuple[int, int]]): A list of (x, y) coordinates
             representing the solved path. The path is stored in reverse
             order (from exit to entry).
+        directions (str | None): The moves of the path ('NESW'), when the
+            last `find_path` searched the cells of a `MazeGrid`: `path` is
+            then only built from them if read.
+        expanded (int): The number of blocks expanded by the last search
+            (`find_path` or `distance_map`), or of cells when `find_path`
+            searched the cells of a `MazeGrid`.
+        cells (bytes | None): The wall nibbles of the cells, when the last
+            `find_path` searched them (see `Maze.cells`).
     """
 
-    def __init__(self, maze: MazeGenerator) -> None:
+    def __init__(self, maze: "MazeGenerator") -> None:
         """Initializes the solver with a target maze.
 
         Args:
             maze: The `MazeGenerator` instance to be solved.
         """
         self.maze = maze
-        self.path: List[Tuple[int, int]] = []
-
-    def find_path(self) -> None:
+        self._path: List[Tuple[int, int]] | None = []
+        self.directions: str | None = None
+        self._distances: "array[int]" = array('i')
+        self._parents: "array[int]" = array('i')
+        self._queue: "array[int]" = array('i')
+        self._unreached: "array[int]" = array('i')
+        self._reached = 0
+        self.expanded = 0
+        self.cells: bytes | None = None
+
+    @property
+    def path(self) -> List[Tuple[int, int]]:
+        """The solved path, from the exit back to the entry (excluded)."""
+        if self._path is None:
+            from .output.maze_encoding import directions_to_path
+
+            self._path = directions_to_path(self.maze, self.directions or "")
+        return self._path
+
+    @path.setter
+    def path(self, path: List[Tuple[int, int]]) -> None:
+        self._path = path
+        self.directions = None
+
+    def find_path(self, jump_points: bool = False) -> None:
         """Discovers the shortest path from entry to exit using BFS.
 
         Uses the Breadth-First Search algorithm to explore the grid layer
         by layer. Once the exit is found, the path is reconstructed
-        backwards using a `came_from` map.
+        backwards from the parent of each cell.
 
         The resulting path is stored in `self.path` starting from the
         exit coordinates down to the entry coordinates (excluded).
-        """
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        start = (self.maze.entry_x, self.maze.entry_y)
-        end = (self.maze.exit_x, self.maze.exit_y)
-
-        visited = []
-        queue = []
-        came_from: Dict[Tuple[int, int], Tuple[int, int]] = {}
+        On a `MazeGrid`, the BFS runs on the cells instead of the blocks
+        (see `_find_path_on_cells`): the path is the same, unless a
+        corner block was opened.
 
-        visited.append(start)
-        queue.append(start)
+        Args:
+            jump_points: If True, runs a jump-point search instead of the
+                         BFS. The path has the same length, but it may
+                         take other blocks when several paths are the
+                         shortest, so it is not the one of the output
+                         file.
+        """
+        width = self.maze.width
+        start = self.maze.entry_y * width + self.maze.entry_x
+        end = self.maze.exit_y * width + self.maze.exit_x
+
+        if jump_points:
+            parents = self._jump_point_search(start, end)
+            if parents is None:
+                return
+            # Consecutive jump points are on the same row or column: walk
+            # back along it, one block at a time.
+            cell = end
+            while cell != start:
+                parent = parents[cell]
+                if parent // width == cell // width:
+                    step = 1 if parent > cell else -1
+                else:
+                    step = width if parent > cell else -width
+                while cell != parent:
+                    self.path.append((cell % width, cell // width))
+                    cell += step
+            return
+
+        if isinstance(self.maze.maze, MazeGrid):
+            self._find_path_on_cells()
+            return
+
+        distances = self.distance_map([self.maze.entry_coord],
+                                      target=self.maze.exit_coord)
+        if distances[end] < 0:
+            return
+
+        cell = end
+        while cell != start:
+            self.path.append((cell % width, cell // width))
+            cell = self._parents[cell]
+
+    def _find_path_on_cells(self) -> None:
+        """Runs the BFS of `find_path` on the cells of a `MazeGrid`.
+
+        The grid holds one byte per block, maybe in a mapped file: the
+        four block arrays of `distance_map` alone would take 16 bytes per
+        block on the heap. A `CellSolver` explores the cells in the same
+        order with a few bytes per cell. It finds the same path, unless
+        the wall breaking of an imperfect hunt-and-kill maze opened a
+        corner block (both coordinates even): the block BFS can cut
+        through it, the cell BFS cannot, so the mapped grid then writes
+        other moves than a dict grid would. Only the moves are kept
+        (`self.directions`, one byte per cell of the path), with the wall
+        nibbles (`self.cells`), for `Maze.from_generator`.
+        """
+        from .maze_cell_solver import CellSolver
+        from .maze_result import Maze
+        from .output.maze_encoding import encode_cells
+
+        self.cells = bytes(encode_cells(self.maze))
+        solver = CellSolver(Maze.from_generator(self.maze, [], self.cells))
+        directions = solver.solve()
+        self.expanded = solver.explored
+        if directions is not None:
+            self._path, self.directions = None, directions
+
+    def distance_map(self, sources: Iterable[Tuple[int, int]],
+                     passable: Tuple[MAZE, ...] = (MAZE.empty, MAZE.exit),
+                     target: Tuple[int, int] | None = None,
+                     limit: int = -1) -> "array[int]":
+        """Computes the walking distance from `sources` to every block.
+
+        The BFS explores neighbours in the same order as `find_path`
+        always did (down, right, up, left), so ties are broken the same
+        way. The arrays are allocated once per solver and reused by every
+        call: the returned map is overwritten by the next call.
 
-        while len(queue) > 0:
-            cell = queue.pop(0)
+        Args:
+            sources: The blocks at distance 0.
+            passable: The block types that can be walked on. Blocks of the
+                      outer border never are.
+            target: If set, the search stops once this block is reached.
+            limit: If not negative, blocks farther than `limit` are not
+                   explored.
 
-            if cell == end:
-                while cell != self.maze.entry_coord:
-                    self.path.append(cell)
-                    cell = came_from[cell]
+        Returns:
+            array[int]: The distance of each block, indexed by
+            `y * width + x`, or -1 for blocks that were not reached.
+        """
+        width, height = self.maze.width, self.maze.height
+        size = width * height
+        if len(self._distances) != size:
+            self._unreached = array('i', [-1]) * size
+            self._distances = array('i', self._unreached)
+            self._parents = array('i', self._unreached)
+            self._queue = array('i', [0]) * size
+        else:
+            self._distances[:] = self._unreached
+
+        walkable = self._walkable(passable)
+        distances, parents, queue = (self._distances, self._parents,
+                                     self._queue)
+        head = tail = 0
+        for x, y in sources:
+            source = y * width + x
+            if distances[source] < 0:
+                distances[source] = 0
+                queue[tail] = source
+                tail += 1
+
+        goal = -1 if target is None else target[1] * width + target[0]
+        while head < tail:
+            cell = queue[head]
+            head += 1
+            if cell == goal:
                 break
+            distance = distances[cell]
+            if distance == limit:
+                continue
+
+            for neighbour in (cell + width, cell + 1, cell - width,
+                              cell - 1):
+                if walkable[neighbour] and distances[neighbour] < 0:
+                    distances[neighbour] = distance + 1
+                    parents[neighbour] = cell
+                    queue[tail] = neighbour
+                    tail += 1
+
+        self._reached = tail
+        self.expanded = head
+        return distances
+
+    def _jump_point_search(self, start: int,
+                           end: int) -> Dict[int, int] | None:
+        """Searches a shortest path from `start` to `end` with JPS.
+
+        An A* over the jump points (see `_jump`), guided by the Manhattan
+        distance to `end`. A block reached by a horizontal move only
+        looks forward, up and down; one reached by a vertical move only
+        forward, left and right.
 
-            cell_x, cell_y = cell
+        Args:
+            start: The flat index of the entry.
+            end: The flat index of the exit.
 
-            for move_x, move_y in directions:
-                neighbour_x = cell_x + move_x
-                neighbour_y = cell_y + move_y
-                neighbour = (neighbour_x, neighbour_y)
+        Returns:
+            Dict[int, int] | None: The previous jump point of each jump
+            point reached (the start is its own), or None if `end` cannot
+            be reached.
+        """
+        width = self.maze.width
+        walkable = self._walkable((MAZE.empty, MAZE.exit))
+        goal_x, goal_y = end % width, end // width
+        parents = {start: start}
+        best = {start: 0}
+        heap = [(abs(start % width - goal_x) + abs(start // width - goal_y),
+                 start)]
+        expanded = 0
+        while heap:
+            estimate, cell = heappop(heap)
+            distance = best[cell]
+            x, y = cell % width, cell // width
+            if estimate != distance + abs(x - goal_x) + abs(y - goal_y):
+                continue
+            expanded += 1
+            if cell == end:
+                self.expanded = expanded
+                return parents
+
+            parent = parents[cell]
+            if parent == cell:
+                steps: Tuple[int, ...] = (width, 1, -width, -1)
+            elif parent // width == y:
+                forward = 1 if cell > parent else -1
+                steps = (forward, width, -width)
+            else:
+                forward = width if cell > parent else -width
+                steps = (forward, 1, -1)
+
+            for step in steps:
+                point = _jump(walkable, cell, step, end, width)
+                if point < 0:
+                    continue
+                reached = distance + abs(point - cell) // abs(step)
+                if reached < best.get(point, reached + 1):
+                    best[point] = reached
+                    parents[point] = cell
+                    heappush(heap, (reached + abs(point % width - goal_x)
+                                    + abs(point // width - goal_y), point))
+        self.expanded = expanded
+        return None
+
+    def _walkable(self, passable: Tuple[MAZE, ...]) -> bytearray:
+        """Returns one byte per block, 1 for the blocks that can be walked
+        on (of a type in `passable` and not on the outer border)."""
+        width, height = self.maze.width, self.maze.height
+        size = width * height
+        grid = self.maze.maze
+        if isinstance(grid, MazeGrid):
+            # One byte per block already: translate it, then close the
+            # outer border.
+            walkable = grid.select(passable)
+            walkable[:width] = walkable[size - width:] = bytes(width)
+            walkable[::width] = walkable[width - 1::width] = bytes(height)
+        else:
+            walkable = bytearray(size)
+            for (x, y), cell in grid.items():
+                if (cell in passable and 0 < x < width - 1
+                        and 0 < y < height - 1):
+                    walkable[y * width + x] = 1
+        return walkable
 
-                if ((0 <= neighbour_x < self.maze.width and
-                     0 <= neighbour_y < self.maze.height) and
-                        neighbour not in visited and
-                        self.maze.maze[(neighbour_x, neighbour_y)] in
-                        (MAZE.empty, MAZE.exit)):
+    def reached(self) -> "array[int]":
+        """Returns the blocks reached by the last `distance_map` call.
 
-                    queue.append(neighbour)
-                    came_from[neighbour_x, neighbour_y] = (cell_x, cell_y)
-                    visited.append(neighbour)
+        Returns:
+            array[int]: The flat indexes of the reached blocks, in BFS
+            order (so by increasing distance).
+        """
+        return self._queue[:self._reached]
 
     def path_checker(self) -> int:
         """Determines the number of valid paths from entry to exit.
 
-        This method uses a recursive Depth-First Search (DFS) with backtracking
-        to explore possible routes. It includes an optimization to stop the
+        This method uses a Depth-First Search (DFS) with backtracking to
+        explore possible routes. It includes an optimization to stop the
         search immediately once more than one path is found, as its primary
         purpose is to distinguish between a perfect maze (unique path) and an
-        imperfect one.
+        imperfect one. The search runs on an explicit stack, so long paths
+        are not bound by the recursion limit.
 
         Returns:
             int: The number of paths found. Returns 0 if unsolvable, 1 if
                  unique, and caps at 2 if multiple paths exist.
+
+        Raises:
+            MazeGenerationCancelled: If the deadline of the generator's
+                                     `progress` is reached.
         """
-        number_of_paths = 0
+        progress = self.maze.progress
+        exit_coord = (self.maze.exit_x, self.maze.exit_y)
+        entry_coord = (self.maze.entry_x, self.maze.entry_y)
+        if entry_coord == exit_coord:
+            return 1
 
-        def explore_recursive(x: int, y: int,
-                              visited: set[Any]) -> bool | None:
-            """Recursively explores the maze to find valid paths to the exit.
-
-            This inner function performs a Depth-First Search (DFS) from
-            the given coordinates. It updates the nonlocal `number_of_paths`
-            counter when the exit is reached.
-
-            Args:
-                x: Current x-coordinate.
-                y: Current y-coordinate.
-                visited: A set of coordinates already visited in the current
-                         recursion stack to prevent cycles.
-
-            Returns:
-                bool: True if the search should be aborted (i.e., more than one
-                      path has been found), False otherwise.
-            """
-            nonlocal number_of_paths
-            if number_of_paths > 1:
-                return True
-
-            if (x, y) == (self.maze.exit_x, self.maze.exit_y):
-                number_of_paths += 1
-                return number_of_paths > 1
-
-            directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-
-            for move_x, move_y in directions:
-                neighbor_x = x + move_x
-                neighbor_y = y + move_y
-                neighbor = (neighbor_x, neighbor_y)
-
-                if ((0 <= neighbor_x < self.maze.width and
-                    0 <= neighbor_y < self.maze.height) and
-                        neighbor not in visited and
-                        self.maze.maze[(neighbor_x, neighbor_y)] in
-                        (MAZE.empty, MAZE.exit)):
-
-                    visited.add(neighbor)
-                    if explore_recursive(neighbor_x, neighbor_y, visited):
-                        return True
-                    visited.remove(neighbor)
-            return False
-
-        visited = {(self.maze.entry_x, self.maze.entry_y)}
-        explore_recursive(self.maze.entry_x, self.maze.entry_y, visited)
+        directions = ((0, 1), (1, 0), (0, -1), (-1, 0))
+        number_of_paths = 0
+        # Blocks of the current path, and for each one the index of the
+        # next direction to explore from it.
+        visited = {entry_coord}
+        stack = [(entry_coord[0], entry_coord[1], 0)]
+
+        while stack:
+            x, y, direction = stack.pop()
+            if direction == len(directions):
+                if stack:
+                    visited.remove((x, y))
+                continue
+            stack.append((x, y, direction + 1))
+
+            move_x, move_y = directions[direction]
+            neighbor_x = x + move_x
+            neighbor_y = y + move_y
+            neighbor = (neighbor_x, neighbor_y)
+
+            if ((0 <= neighbor_x < self.maze.width and
+                0 <= neighbor_y < self.maze.height) and
+                    neighbor not in visited and
+                    self.maze.maze[(neighbor_x, neighbor_y)] in
+                    (MAZE.empty, MAZE.exit)):
+                if progress is not None:
+                    progress.advance()
+
+                if neighbor == exit_coord:
+                    number_of_paths += 1
+                    if number_of_paths > 1:
+                        break
+                    continue
+                visited.add(neighbor)
+                stack.append((neighbor_x, neighbor_y, 0))
 
         return number_of_paths
 
@@ -172,9 +462,11 @@ class MazeSolver():
         symbol defined in the maze configuration.
 
         This method is typically used to redraw the maze statically after
-        computation.
+        computation. Each row is printed in a single write.
         """
+        path = set(self.path)
         for y in range(self.maze.height):
+            row = []
             for x in range(self.maze.width):
                 cell = self.maze.maze[(x, y)]
                 current_color = COLORS.reset
@@ -202,7 +494,7 @@ class MazeSolver():
                         symbol_to_print = self.maze.visual_wall
 
                 elif cell == MAZE.empty:
-                    if (x, y) in self.path:
+                    if (x, y) in path:
                         if self.maze.display == DISPLAY_MODE.emoji:
                             symbol_to_print = self.maze.visual_path
                         else:
@@ -218,9 +510,8 @@ class MazeSolver():
                         current_color = self.maze.color_wall
                         symbol_to_print = self.maze.visual_wall
 
-                print(f"{current_color}{symbol_to_print}{COLORS.reset}",
-                      end="")
-            print()
+                row.append(f"{current_color}{symbol_to_print}{COLORS.reset}")
+            print("".join(row))
 
     def print_path(self) -> None:
         """Animates the solution path on the terminal.
@@ -229,6 +520,8 @@ class MazeSolver():
         to Exit) and calls `_anim_path` to draw each step with a delay.
         Finally, moves the cursor below the maze to prevent overwriting.
         """
+        from colorama import Cursor
+
         for x, y in reversed(self.path):
             if (x, y) == self.maze.exit_coord:
                 break
@@ -247,6 +540,8 @@ class MazeSolver():
             x: The grid X coordinate of the cell.
             y: The grid Y coordinate of the cell.
         """
+        from colorama import Cursor
+
         curs_x = (x * self.maze.step_x) + 1
         curs_y = y + self.maze.y_offset + 1
 
@@ -0,0 +1,285 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_wall_follower.py                             :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/03/02 09:48:15 by roandrie        #+#    #+#               #
+#  Updated: 2026/03/02 09:48:15 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Wall follower solving a maze file in place, with constant memory.
+
+A maze too big to load is solved straight from its file, mapped with
+`mmap`: only the uncompressed formats (`.txt` and `.mzb`) give direct
+access to a cell. The walker keeps one hand on a wall: at each step it
+reads the nibble of its cell and turns towards the first open wall on the
+side of its hand (then straight, the other side, back). In a perfect maze
+this walks around the tree of corridors and always reaches the exit; in
+an imperfect one, it does when the entry and the exit are on the border
+(the walk starts with the hand on the outer wall).
+
+The moves are written to a sink as they are walked, by chunks. With
+`prune`, a move going straight back cancels the previous one: the dead
+ends are removed on the fly and, in a perfect maze, the sink ends up
+holding the unique path, the moves of the output file. The cancelled
+moves can be older than the chunk in memory, so the sink must then be
+seekable: they are read back from it.
+"""
+
+import mmap
+
+from typing import BinaryIO, Tuple
+
+from .maze_errors import MazeError
+from .output.maze_codecs import MZB_HEADER, MZB_MAGIC, codec_for
+from .output.maze_reader import _parse_cell
+
+# Directions, clockwise: the wall bit of direction d is 1 << d.
+_STEPS = ((0, -1), (1, 0), (0, 1), (-1, 0))
+_LETTERS = b"NESW"
+_OPPOSITE = dict(zip(b"NESW", b"SWNE"))
+_BLOCKED = 4
+
+
+def _turns(side: int) -> bytes:
+    """Returns the direction to take for each heading and wall nibble.
+
+    Args:
+        side: 1 to keep the right hand on the wall, 3 for the left hand.
+
+    Returns:
+        bytes: The new direction (or `_BLOCKED` if every wall is closed),
+        indexed by `heading * 16 + nibble`.
+    """
+    table = bytearray()
+    for heading in range(4):
+        order = [(heading + side) % 4, heading, (heading - side) % 4,
+                 (heading + 2) % 4]
+        for nibble in range(16):
+            table.append(next((direction for direction in order
+                               if not nibble & 1 << direction), _BLOCKED))
+    return bytes(table)
+
+
+_SIDES = {"right": 1, "left": 3}
+_TURNS = {hand: _turns(side) for hand, side in _SIDES.items()}
+_HEX_VALUE = bytes(int(chr(i), 16) if chr(i) in "0123456789ABCDEFabcdef"
+                   else 16 for i in range(256))
+# Moves kept in memory before the oldest half goes to the sink.
+_CHUNK = 1 << 16
+
+
+class WallFollower():
+    """Walks a memory-mapped maze file from its entry to its exit.
+
+    Example:
+        >>> with WallFollower("maze.txt") as walker:
+        ...     with open("path.txt", "w+b") as sink:
+        ...         walker.solve(sink, prune=True)
+
+    Attributes:
+        path (str): The maze file.
+        hand (str): The hand kept on the wall, 'right' or 'left'.
+        width (int): Number of cells per row.
+        height (int): Number of rows.
+        entry (Tuple[int, int]): The (x, y) cell of the entry.
+        exit (Tuple[int, int]): The (x, y) cell of the exit.
+        cells_read (int): Cell nibbles read from the file by the last walk.
+        steps (int): Moves walked by the last walk, dead ends included.
+    """
+
+    def __init__(self, path: str, hand: str = "right") -> None:
+        """Maps the maze file and reads its size, entry and exit.
+
+        Args:
+            path: A '.txt' or '.mzb' maze file.
+            hand: The hand kept on the wall, 'right' or 'left'.
+
+        Raises:
+            ValueError: If the file is compressed or not a maze file, or
+                        `hand` is unknown.
+            MazeError: If the file is not a valid maze.
+        """
+        if hand not in _TURNS:
+            raise ValueError("hand must be 'right' or 'left'")
+        codec = codec_for(path)
+        if codec.compression is not None:
+            raise ValueError(f"{path}: a compressed maze cannot be mapped")
+        self.path = path
+        self.hand = hand
+        self._binary = codec.binary
+        self.width = self.height = self._start = 0
+        self.entry: Tuple[int, int] = (0, 0)
+        self.exit: Tuple[int, int] = (0, 0)
+        self.cells_read = 0
+        self.steps = 0
+        self._file = open(path, 'rb')
+        try:
+            self._data = mmap.mmap(self._file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise MazeError("The maze has no cells")
+        try:
+            if self._binary:
+                self._read_binary_header()
+            else:
+                self._read_text_layout()
+            for x, y in (self.entry, self.exit):
+                if not (0 <= x < self.width and 0 <= y < self.height):
+                    raise MazeError(f"Cell ({x},{y}) is outside of the maze")
+        except MazeError:
+            self.close()
+            raise
+
+    def __enter__(self) -> "WallFollower":
+        """Returns the walker itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Unmaps and closes the file."""
+        self.close()
+
+    def close(self) -> None:
+        """Unmaps and closes the file."""
+        self._data.close()
+        self._file.close()
+
+    def _read_binary_header(self) -> None:
+        """Reads the size, entry and exit of a '.mzb' file, and where its
+        cells start."""
+        data = self._data
+        if len(data) < MZB_HEADER.size:
+            raise MazeError("Truncated maze data")
+        (magic, self.width, self.height, entry_x, entry_y, exit_x, exit_y,
+         _, seed_size, moves) = MZB_HEADER.unpack_from(data)
+        if magic != MZB_MAGIC:
+            raise MazeError("Not a maze in the binary format")
+        self.entry = (entry_x, entry_y)
+        self.exit = (exit_x, exit_y)
+        self._start = MZB_HEADER.size + seed_size + moves
+        if len(data) < self._start + (self.width * self.height + 1) // 2:
+            raise MazeError("Truncated maze data")
+
+    def _read_text_layout(self) -> None:
+        """Reads the size, entry and exit of a '.txt' file.
+
+        The rows all have the same length, so the size comes from the
+        first line and from the blank line after the last row; only the
+        entry and exit lines are parsed.
+        """
+        data = self._data
+        self.width = data.find(b"\n")
+        end = data.find(b"\n\n")
+        if self.width <= 0 or end < 0:
+            raise MazeError("Truncated maze data")
+        if (end + 1) % (self.width + 1):
+            raise MazeError("The rows of the maze have different lengths")
+        self.height = (end + 1) // (self.width + 1)
+        entry_end = data.find(b"\n", end + 2)
+        exit_end = data.find(b"\n", entry_end + 1)
+        if entry_end < 0 or exit_end < 0:
+            raise MazeError("Truncated maze data")
+        self.entry = _parse_cell(data[end + 2:entry_end], self.height + 2)
+        self.exit = _parse_cell(data[entry_end + 1:exit_end],
+                                self.height + 3)
+        self._start = 0
+
+    def _walls(self, x: int, y: int) -> int:
+        """Reads the wall nibble of cell (x, y) from the file.
+
+        Raises:
+            MazeError: If the cell is not a hexadecimal digit.
+        """
+        self.cells_read += 1
+        if self._binary:
+            index = y * self.width + x
+            byte = self._data[self._start + (index >> 1)]
+            return byte & 0xF if index & 1 else byte >> 4
+        nibble = _HEX_VALUE[self._data[y * (self.width + 1) + x]]
+        if nibble > 15:
+            raise MazeError(f"Invalid cell ({x},{y})")
+        return nibble
+
+    def _first_heading(self) -> int:
+        """Returns the heading to start with: on the border, the one that
+        puts the hand on the outer wall, so the walk follows it and reaches
+        any exit on the border, even in an imperfect maze."""
+        x, y = self.entry
+        for border, on_it in enumerate((y == 0, x == self.width - 1,
+                                        y == self.height - 1, x == 0)):
+            if on_it:
+                return (border - _SIDES[self.hand]) % 4
+        return 0
+
+    def solve(self, sink: BinaryIO, prune: bool = False) -> int:
+        """Walks from the entry to the exit, writing the moves to `sink`.
+
+        Args:
+            sink: A binary stream receiving one of b'NESW' per move, from
+                  its current position.
+            prune: If True, dead ends are removed as they are walked back:
+                   `sink` must be readable and seekable, and is truncated
+                   after the last move. In a perfect maze, it then holds
+                   the shortest path.
+
+        Returns:
+            int: The number of moves written.
+
+        Raises:
+            MazeError: If the walk comes back to its first step without
+                       reaching the exit (the exit is on an island of
+                       walls the hand never touches, or unreachable), or
+                       the walls lead out of the maze.
+        """
+        turns = _TURNS[self.hand]
+        width, height = self.width, self.height
+        x, y = self.entry
+        heading = self._first_heading()
+        first = None
+        self.cells_read = self.steps = 0
+        base = sink.tell() if prune else 0
+        pending = bytearray()
+        written = 0
+
+        while (x, y) != self.exit:
+            heading = turns[heading << 4 | self._walls(x, y)]
+            if heading == _BLOCKED:
+                raise MazeError(f"Cell ({x},{y}) has no open wall")
+            step_x, step_y = _STEPS[heading]
+            x, y = x + step_x, y + step_y
+            if not (0 <= x < width and 0 <= y < height):
+                raise MazeError("The walls lead out of the maze")
+            if first is None:
+                first = (x, y, heading)
+            elif (x, y, heading) == first:
+                raise MazeError("The exit cannot be reached by following "
+                                "the walls")
+            self.steps += 1
+
+            move = _LETTERS[heading]
+            if prune:
+                if not pending and written:
+                    # The previous move was already written: read it back.
+                    count = min(written, _CHUNK)
+                    written -= count
+                    sink.seek(base + written)
+                    pending += sink.read(count)
+                    sink.seek(base + written)
+                if pending and pending[-1] == _OPPOSITE[move]:
+                    pending.pop()
+                    continue
+            pending.append(move)
+            if len(pending) >= 2 * _CHUNK:
+                sink.write(pending[:_CHUNK])
+                del pending[:_CHUNK]
+                written += _CHUNK
+
+        sink.write(pending)
+        written += len(pending)
+        if prune:
+            sink.truncate()
+        return written
@@ -0,0 +1,113 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_codecs.py                                    :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/22 09:12:47 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/22 09:12:47 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Output formats of a maze, chosen from the file extension.
+
+| Extension  | Format                        | Compression |
+|:-----------|:------------------------------|:------------|
+| `.txt`     | hexadecimal text              | none        |
+| `.txt.gz`  | hexadecimal text              | gzip        |
+| `.txt.xz`  | hexadecimal text              | xz (LZMA)   |
+| `.mzb`     | binary, two cells per byte    | none        |
+| `.mzb.gz`  | binary, two cells per byte    | gzip        |
+| `.mzb.xz`  | binary, two cells per byte    | xz (LZMA)   |
+
+Every codec is a stream of the standard library: a file is written and
+read by chunks, never as a whole. `gzip` and `lzma` are only imported
+when a compressed file is opened.
+"""
+
+import struct
+
+from typing import BinaryIO, NamedTuple, cast
+
+# Size of the buffers of the files and of the chunks written to them.
+CHUNK_SIZE = 1 << 20
+
+# gzip level: 6 compresses the hexadecimal text almost as well as 9, and
+# several times faster.
+_GZIP_LEVEL = 6
+
+# Binary format: magic, width, height, entry x/y, exit x/y, then the seed
+# (kind and length), the solution length, and the seed, the moves and the
+# packed cells follow the header.
+MZB_MAGIC = b"MZB1"
+MZB_HEADER = struct.Struct("<4sIIIIIIBII")
+SEED_NONE, SEED_INT, SEED_STR = 0, 1, 2
+
+
+class Codec(NamedTuple):
+    """The format and the compression of an output file.
+
+    Attributes:
+        suffix (str): The extension of the file, e.g. '.txt.gz'.
+        binary (bool): True for the binary format, False for the text one.
+        compression (str | None): 'gz', 'xz' or None.
+    """
+    suffix: str
+    binary: bool
+    compression: str | None
+
+
+CODECS = (
+    Codec(".txt", False, None),
+    Codec(".txt.gz", False, "gz"),
+    Codec(".txt.xz", False, "xz"),
+    Codec(".mzb", True, None),
+    Codec(".mzb.gz", True, "gz"),
+    Codec(".mzb.xz", True, "xz"),
+)
+
+OUTPUT_SUFFIXES = [codec.suffix for codec in CODECS]
+
+
+def codec_for(path: str) -> Codec:
+    """Returns the codec matching the extension of `path`.
+
+    Args:
+        path: The path of a maze file.
+
+    Returns:
+        Codec: The format and the compression of the file.
+
+    Raises:
+        ValueError: If the extension is not one of `OUTPUT_SUFFIXES`.
+    """
+    for codec in CODECS:
+        if str(path).endswith(codec.suffix):
+            return codec
+    raise ValueError(f"File must end with one of {OUTPUT_SUFFIXES}")
+
+
+def open_maze_file(path: str, mode: str) -> BinaryIO:
+    """Opens a maze file in binary mode, through its compression codec.
+
+    Args:
+        path: The path of the file; its extension selects the codec.
+        mode: 'rb' or 'wb'.
+
+    Returns:
+        BinaryIO: The (de)compressing stream.
+
+    Raises:
+        ValueError: If the extension is unknown.
+        OSError: If the file cannot be opened.
+    """
+    codec = codec_for(path)
+    if codec.compression == "gz":
+        import gzip
+        return cast(BinaryIO, gzip.open(path, mode,
+                                        compresslevel=_GZIP_LEVEL))
+    if codec.compression == "xz":
+        import lzma
+        return cast(BinaryIO, lzma.open(path, mode))
+    return cast(BinaryIO, open(path, mode, buffering=CHUNK_SIZE))
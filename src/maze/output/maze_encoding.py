@@ -0,0 +1,262 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_encoding.py                                  :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/17 10:21:40 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/17 10:21:40 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Compact encodings of a generated maze.
+
+The block grid of a `MazeGenerator` ((2W + 1) x (2H + 1) blocks) is
+reduced to one wall nibble per cell, with the same bits as the output
+file (bit 0 = North, 1 = East, 2 = South, 3 = West, 1 = closed). The
+solution path is reduced to its string of N/E/S/W moves. Both can be
+decoded back into the exact same block grid and path.
+"""
+
+import struct
+
+from itertools import islice, repeat
+from operator import add, is_not, itemgetter, mul, sub
+from typing import Any, List, Tuple
+
+from maze.maze_customization import MAZE
+from maze.maze_grid import MazeGrid
+
+NORTH, EAST, SOUTH, WEST = 1, 2, 4, 8
+CLOSED = 0xF
+
+# Translation tables: turn a block (its `MAZE` value) into the bit of its
+# wall, move a nibble to the high half, split a packed byte.
+_WALL_BITS = {bit: bytes(bit if i != MAZE.empty.value else 0
+                         for i in range(256))
+              for bit in (NORTH, EAST, SOUTH, WEST)}
+_TO_HIGH_NIBBLE = bytes((i << 4) & 0xFF for i in range(256))
+_HIGH_NIBBLE = bytes(i >> 4 for i in range(256))
+_LOW_NIBBLE = bytes(i & 0xF for i in range(256))
+_MOVE_LETTERS = bytes.maketrans(b"\x00\x01\x03\x04", b"WNSE")
+
+_MOVES = {"N": (0, -1), "E": (1, 0), "S": (0, 1), "W": (-1, 0)}
+
+# Size, entry and exit, hashed before the cells by `fingerprint`.
+_FINGERPRINT_HEADER = struct.Struct("<IIIIII")
+FINGERPRINT_SIZE = 16
+
+
+def encode_cells(generator: Any) -> bytearray:
+    """Encodes the block grid of `generator` as one nibble per cell.
+
+    A wall is closed when its block is not an empty passage, so both the
+    regular walls and the '42' pattern count as closed: the cells of the
+    pattern are written fully closed ("F").
+
+    The grid is first reduced to one byte per block (1 = closed) in a
+    single pass, then each row of nibbles is built from four strided
+    slices of it (north, east, south and west walls), combined as big
+    integers: the bits do not overlap, so no per-cell Python code runs.
+    A `MazeGrid` already stores one byte per block (its `MAZE` value): its
+    buffer is sliced directly, three rows at a time, without a copy of
+    the whole grid.
+
+    Args:
+        generator: A generated `MazeGenerator` instance.
+
+    Returns:
+        bytearray: One wall nibble per cell, row-major.
+    """
+    width, height = generator.width, generator.height
+    if isinstance(generator.maze, MazeGrid):
+        closed = generator.maze.buffer
+    else:
+        closed = _closed_blocks(generator)
+    row_size = (width - 1) // 2
+
+    cells = bytearray()
+    for y in range(1, height - 1, 2):
+        top, row, bottom = (y - 1) * width, y * width, (y + 1) * width
+        value = (int.from_bytes(closed[top + 1:row:2]
+                                .translate(_WALL_BITS[NORTH]), "big")
+                 | int.from_bytes(closed[row + 2:bottom:2]
+                                  .translate(_WALL_BITS[EAST]), "big")
+                 | int.from_bytes(closed[bottom + 1:bottom + width:2]
+                                  .translate(_WALL_BITS[SOUTH]), "big")
+                 | int.from_bytes(closed[row:bottom - 1:2]
+                                  .translate(_WALL_BITS[WEST]), "big"))
+        cells += value.to_bytes(row_size, "big")
+    return cells
+
+
+def _closed_blocks(generator: Any) -> bytes:
+    """Returns one byte per block, row-major: 1 if closed, 0 if empty.
+
+    `_fill_maze` inserts every block in row-major order and the
+    algorithms only update them, so the values of the grid dict are
+    already in order and are read in one pass. Any other grid is read
+    block by block.
+
+    Args:
+        generator: A generated `MazeGenerator` instance.
+
+    Returns:
+        bytes: The closed flags, `width * height` bytes.
+    """
+    maze = generator.maze
+    width, height = generator.width, generator.height
+    if (len(maze) == width * height and next(iter(maze)) == (0, 0)
+            and next(reversed(maze)) == (width - 1, height - 1)):
+        return bytes(map(is_not, maze.values(), repeat(MAZE.empty)))
+    empty = MAZE.empty
+    return bytes(maze[(x, y)] is not empty
+                 for y in range(height) for x in range(width))
+
+
+def decode_cells(generator: Any, cells: Any) -> None:
+    """Carves the cells of an encoded maze into the grid of `generator`.
+
+    The grid must have been filled by `_fill_maze` first. Fully closed
+    cells and the blocks of the '42' pattern are left untouched, every
+    other cell and its open east/south walls become empty passages.
+
+    Args:
+        generator: The `MazeGenerator` whose grid is updated.
+        cells: One wall nibble per cell, row-major (any buffer).
+    """
+    maze = generator.maze
+    fortytwo = MAZE.fortytwo
+    grid_width = (generator.width - 1) // 2
+    grid_height = (generator.height - 1) // 2
+    for cell_y in range(grid_height):
+        y = cell_y * 2 + 1
+        row = cell_y * grid_width
+        for cell_x in range(grid_width):
+            value = cells[row + cell_x]
+            x = cell_x * 2 + 1
+            if value == CLOSED or maze[(x, y)] is fortytwo:
+                continue
+            maze[(x, y)] = MAZE.empty
+            if not value & EAST and maze[(x + 1, y)] is not fortytwo:
+                maze[(x + 1, y)] = MAZE.empty
+            if not value & SOUTH and maze[(x, y + 1)] is not fortytwo:
+                maze[(x, y + 1)] = MAZE.empty
+
+
+def pack_cells(cells: Any) -> bytes:
+    """Packs two cell nibbles per byte (first cell in the high nibble).
+
+    Args:
+        cells: One wall nibble per cell.
+
+    Returns:
+        bytes: The packed cells, padded with a closed cell if needed.
+    """
+    cells = bytes(cells)
+    size = (len(cells) + 1) // 2
+    high = cells[0::2].translate(_TO_HIGH_NIBBLE)
+    low = cells[1::2] + bytes([CLOSED]) * (len(cells) % 2)
+    return (int.from_bytes(high, "big")
+            | int.from_bytes(low, "big")).to_bytes(size, "big")
+
+
+def unpack_cells(packed: Any, count: int) -> bytearray:
+    """Reverses `pack_cells`.
+
+    Args:
+        packed: The packed cells.
+        count: Number of cells to unpack.
+
+    Returns:
+        bytearray: One wall nibble per cell.
+    """
+    packed = bytes(packed[:(count + 1) // 2])
+    cells = bytearray(len(packed) * 2)
+    cells[0::2] = packed.translate(_HIGH_NIBBLE)
+    cells[1::2] = packed.translate(_LOW_NIBBLE)
+    del cells[count:]
+    return cells
+
+
+def fingerprint(width: int, height: int, entry: Tuple[int, int],
+                exit: Tuple[int, int], packed: Any) -> bytes:
+    """Returns the canonical fingerprint of a maze.
+
+    Two mazes get the same fingerprint when they have the same size, the
+    same entry and exit and the same walls, whatever the seed or the
+    settings that produced them. The solution is left out: it only
+    depends on the rest. The hash (BLAKE2b) runs over the packed cells, so
+    a stored maze is fingerprinted without being decoded.
+
+    Args:
+        width: Number of cells per row.
+        height: Number of rows.
+        entry: The (x, y) cell of the entry.
+        exit: The (x, y) cell of the exit.
+        packed: The packed cells (see `pack_cells`), any buffer.
+
+    Returns:
+        bytes: The `FINGERPRINT_SIZE` bytes digest.
+    """
+    from hashlib import blake2b
+
+    digest = blake2b(_FINGERPRINT_HEADER.pack(width, height, entry[0],
+                                              entry[1], exit[0], exit[1]),
+                     digest_size=FINGERPRINT_SIZE)
+    digest.update(packed)
+    return digest.digest()
+
+
+def path_to_directions(generator: Any,
+                       path: List[Tuple[int, int]]) -> str:
+    """Converts a solver path into its string of moves.
+
+    The path is the chain of parents of the BFS, from the exit back to
+    the entry: each cell comes with the wall block crossed to reach it,
+    so the move into a cell is the step from its wall block to it. The
+    moves are computed in one pass over the path (no reversed copy of
+    it), then put back in entry to exit order.
+
+    Args:
+        generator: The `MazeGenerator` the path belongs to.
+        path: A `MazeSolver.path` (block coordinates, from the exit back
+              to the entry). The list is not modified.
+
+    Returns:
+        str: The moves from entry to exit, one of 'NESW' per cell.
+    """
+    cells_x = map(itemgetter(0), islice(path, 0, None, 2))
+    cells_y = map(itemgetter(1), islice(path, 0, None, 2))
+    walls_x = map(itemgetter(0), islice(path, 1, None, 2))
+    walls_y = map(itemgetter(1), islice(path, 1, None, 2))
+    # 2 * dx + dy + 2 is 0 (W), 1 (N), 3 (S) or 4 (E).
+    step_x = map(sub, cells_x, walls_x)
+    step_y = map(sub, cells_y, walls_y)
+    codes = bytes(map(add, map(mul, step_x, repeat(2)),
+                      map(add, step_y, repeat(2))))
+    return codes[::-1].translate(_MOVE_LETTERS).decode("ascii")
+
+
+def directions_to_path(generator: Any,
+                       directions: str) -> List[Tuple[int, int]]:
+    """Rebuilds a `MazeSolver.path` from a string of moves.
+
+    Args:
+        generator: The `MazeGenerator` the moves belong to.
+        directions: The moves from entry to exit.
+
+    Returns:
+        List[Tuple[int, int]]: The blocks of the path, from the exit back
+        to the entry (excluded), like `MazeSolver.find_path` builds it.
+    """
+    x, y = generator.entry_coord
+    path = []
+    for move in directions:
+        move_x, move_y = _MOVES[move]
+        path.append((x + move_x, y + move_y))
+        x, y = x + move_x * 2, y + move_y * 2
+        path.append((x, y))
+    path.reverse()
+    return path
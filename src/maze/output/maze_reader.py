@@ -0,0 +1,233 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  maze_reader.py                                    :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/22 10:03:15 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/22 10:03:15 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Streaming reader of the maze files, in every format of `maze_codecs`.
+
+The cells are yielded one row at a time, as wall nibbles (see
+`maze_encoding`): a maze file of any size is read with the memory of one
+row (plus one read buffer of `CHUNK_SIZE` for the binary format).
+
+Example:
+    >>> with MazeReader.open("maze.txt.gz") as reader:
+    ...     for row in reader.rows():
+    ...         ...
+    ...     print(reader.entry, reader.exit, reader.directions)
+"""
+
+from typing import BinaryIO, Iterator, Tuple
+
+from maze.maze_errors import MazeError
+from maze.output.maze_codecs import (CHUNK_SIZE, MZB_HEADER, MZB_MAGIC,
+                                     SEED_INT, SEED_STR, codec_for,
+                                     open_maze_file)
+from maze.output.maze_encoding import unpack_cells
+
+_HEX_DIGITS = b"0123456789ABCDEFabcdef"
+_FROM_HEX = bytes.maketrans(_HEX_DIGITS,
+                            bytes(range(16)) + bytes(range(10, 16)))
+
+
+class MazeReader:
+    """Reads the cells, then the description, of a maze file.
+
+    For the binary format, every attribute is known as soon as the reader
+    is created. For the text format, `width` is known after the first row,
+    and `height`, `entry`, `exit` and `directions` once `rows()` is
+    exhausted.
+
+    Attributes:
+        width (int): Number of cells per row.
+        height (int): Number of rows.
+        entry (Tuple[int, int]): The (x, y) cell of the entry.
+        exit (Tuple[int, int]): The (x, y) cell of the exit.
+        seed (str | int | None): The seed (binary format only).
+        directions (str): The solution moves from entry to exit.
+    """
+
+    def __init__(self, stream: BinaryIO, binary: bool) -> None:
+        """Starts reading `stream`.
+
+        Args:
+            stream: A binary stream, positioned at the start of the maze.
+            binary: True for the binary format, False for the text one.
+
+        Raises:
+            MazeError: If the header of a binary maze is invalid.
+        """
+        self._stream = stream
+        self._binary = binary
+        self.width = 0
+        self.height = 0
+        self.entry: Tuple[int, int] = (0, 0)
+        self.exit: Tuple[int, int] = (0, 0)
+        self.seed: str | int | None = None
+        self.directions = ""
+        if binary:
+            self._read_header()
+
+    @classmethod
+    def open(cls, path: str) -> "MazeReader":
+        """Opens the maze file at `path`, with the codec of its extension.
+
+        Args:
+            path: The maze file.
+
+        Returns:
+            MazeReader: The reader, to use as a context manager.
+
+        Raises:
+            ValueError: If the extension is not a known format.
+            MazeError: If the header of a binary maze is invalid.
+            OSError: If the file cannot be opened.
+        """
+        codec = codec_for(path)
+        stream = open_maze_file(path, 'rb')
+        try:
+            return cls(stream, codec.binary)
+        except BaseException:
+            stream.close()
+            raise
+
+    def __enter__(self) -> "MazeReader":
+        """Returns the reader itself."""
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Closes the underlying stream."""
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying stream."""
+        self._stream.close()
+
+    def rows(self) -> Iterator[bytes]:
+        """Yields the rows of cells, from the top one.
+
+        Yields:
+            bytes: One wall nibble per cell of the row.
+
+        Raises:
+            MazeError: If the file is truncated or malformed.
+        """
+        if self._binary:
+            return self._binary_rows()
+        return self._text_rows()
+
+    def _read(self, size: int) -> bytes:
+        """Reads exactly `size` bytes.
+
+        Raises:
+            MazeError: If the stream ends before.
+        """
+        data = self._stream.read(size)
+        if len(data) != size:
+            raise MazeError("Truncated maze data")
+        return data
+
+    def _read_header(self) -> None:
+        """Reads the header, the seed and the moves of a binary maze."""
+        (magic, self.width, self.height, entry_x, entry_y, exit_x, exit_y,
+         kind, seed_size, moves) = MZB_HEADER.unpack(
+            self._read(MZB_HEADER.size))
+        if magic != MZB_MAGIC:
+            raise MazeError("Not a maze in the binary format")
+        self.entry = (entry_x, entry_y)
+        self.exit = (exit_x, exit_y)
+        seed = self._read(seed_size)
+        if kind == SEED_INT:
+            self.seed = int(seed)
+        elif kind == SEED_STR:
+            self.seed = seed.decode()
+        self.directions = self._read(moves).decode("ascii")
+
+    def _binary_rows(self) -> Iterator[bytes]:
+        """Unpacks the cells of a binary maze by chunks, yields the rows."""
+        width = self.width
+        remaining = self.width * self.height
+        pending = bytearray()
+        while remaining:
+            count = min(remaining, CHUNK_SIZE * 2)
+            pending += unpack_cells(self._read((count + 1) // 2), count)
+            remaining -= count
+            start = 0
+            while len(pending) - start >= width:
+                yield bytes(pending[start:start + width])
+                start += width
+            del pending[:start]
+        if self._stream.read(1):
+            raise MazeError("Unexpected data after the maze cells")
+
+    def _text_rows(self) -> Iterator[bytes]:
+        """Parses the hexadecimal rows of a text maze, then its trailer."""
+        line_number = 0
+        for line_number, line in enumerate(self._stream, 1):
+            digits = line.rstrip(b"\r\n")
+            if not digits:
+                break
+            if digits.translate(None, _HEX_DIGITS):
+                raise MazeError(f"Invalid cell at line {line_number}")
+            if not self.width:
+                self.width = len(digits)
+            elif len(digits) != self.width:
+                raise MazeError(f"Row of {len(digits)} cells at line "
+                                f"{line_number}, expected {self.width}")
+            self.height += 1
+            yield digits.translate(_FROM_HEX)
+        else:
+            raise MazeError("Truncated maze data")
+
+        if not self.height:
+            raise MazeError("The maze has no cells")
+        lines = [self._stream.readline().rstrip(b"\r\n") for _ in range(3)]
+        self.entry = _parse_cell(lines[0], line_number + 1)
+        self.exit = _parse_cell(lines[1], line_number + 2)
+        directions = lines[2].decode("ascii", errors="replace")
+        if directions.strip("NESW"):
+            raise MazeError(f"Invalid moves at line {line_number + 3}")
+        self.directions = directions
+
+
+def _parse_cell(line: bytes, line_number: int) -> Tuple[int, int]:
+    """Parses an 'x,y' line of the text format.
+
+    Args:
+        line: The line, without its line break.
+        line_number: Its number, for the error message.
+
+    Returns:
+        Tuple[int, int]: The cell.
+
+    Raises:
+        MazeError: If the line is not two integers separated by a comma.
+    """
+    try:
+        x, y = line.split(b",")
+        return (int(x), int(y))
+    except ValueError:
+        raise MazeError(f"Invalid coordinates at line {line_number}")
+
+
+def iter_rows(path: str) -> Iterator[bytes]:
+    """Yields the rows of cells of the maze file at `path`.
+
+    Args:
+        path: A maze file, in any format of `maze_codecs`.
+
+    Yields:
+        bytes: One wall nibble per cell of each row, from the top one.
+
+    Raises:
+        ValueError: If the extension is not a known format.
+        MazeError: If the file is not a valid maze.
+    """
+    with MazeReader.open(path) as reader:
+        yield from reader.rows()
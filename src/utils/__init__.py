@@ -12,8 +12,10 @@
 
 from src.utils.modules_check import module_checker
 from src.utils.custom_errors import ArgumentsError
+from src.utils.prefetch import MazePrefetcher
 
 __all__ = [
     "module_checker",
-    "ArgumentsError"
+    "ArgumentsError",
+    "MazePrefetcher"
 ]
@@ -0,0 +1,163 @@
+# ************************************************************************* #
+#                                                                           #
+#                                                      :::      ::::::::    #
+#  prefetch.py                                       :+:      :+:    :+:    #
+#                                                  +:+ +:+         +:+      #
+#  By: roandrie, rruiz                           +#+  +:+       +#+         #
+#                                              +#+#+#+#+#+   +#+            #
+#  Created: 2026/02/18 09:40:27 by roandrie        #+#    #+#               #
+#  Updated: 2026/02/18 09:40:27 by roandrie        ###   ########.fr        #
+#                                                                           #
+# ************************************************************************* #
+
+"""Background pre-generation of the next maze for the interactive menu.
+
+While the user looks at the current maze, a worker process already
+generates and solves the next one with a freshly drawn seed. Regenerating
+then only has to restore and render it. A process is used rather than a
+thread because the algorithms draw from the global `random` module: a
+thread would interleave its draws with the menu and break seed
+reproducibility.
+
+The worker is a daemon process, and daemon processes cannot have
+children: it carves the tiles of a tiled maze (`TILE_SIZE`) itself, one
+after the other, instead of in a pool of `WORKERS` processes. The tiles
+are the same, so is the maze.
+"""
+
+import signal
+
+from typing import TYPE_CHECKING, Any, Dict, NoReturn, Tuple
+
+# multiprocessing is only imported once a prefetch starts.
+if TYPE_CHECKING:
+    import multiprocessing
+
+    from multiprocessing.connection import Connection
+    from maze import MazeGenerator
+    from maze.maze_cache import CachedMaze
+
+
+def _terminated(signum: int, frame: Any) -> NoReturn:
+    """Turns the SIGTERM of `cancel` into an exit, so the shared grid of a
+    tiled maze and the grid file are released."""
+    raise SystemExit(1)
+
+
+def _prefetch_worker(config: Dict[str, Any], conn: "Connection") -> None:
+    """Worker entry point: generates one maze and sends it back.
+
+    Args:
+        config: The `MazeConfig` fields, with the seed and algorithm of the
+                maze to generate.
+        conn: Pipe end used to send `(seed, result)`, or `(None, error)`
+              on failure.
+    """
+    signal.signal(signal.SIGTERM, _terminated)
+    try:
+        from maze import MazeConfig, MazeGenerator
+
+        with MazeGenerator(MazeConfig(**config)) as generator:
+            solver, _ = generator._build(rendering=False)
+            conn.send((str(generator.seed), generator._result(solver)))
+    except Exception as e:
+        conn.send((None, f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class MazePrefetcher():
+    """Generates the next maze of a `MazeGenerator` ahead of time.
+
+    Attributes:
+        algorithm (str | None): Algorithm of the maze being prefetched.
+        error (str | None): Why the last maze taken could not be
+            prefetched, if the worker failed.
+    """
+
+    def __init__(self) -> None:
+        """Initializes an idle prefetcher."""
+        self.algorithm: str | None = None
+        self.error: str | None = None
+        self._process: "multiprocessing.Process | None" = None
+        self._conn: "Connection | None" = None
+
+    def start(self, generator: "MazeGenerator") -> None:
+        """Starts generating the next maze of `generator` in background.
+
+        The seed is drawn right away in this process, like a regeneration
+        would, so the prefetched maze is the one the user would have got.
+
+        Args:
+            generator: The generator whose next maze is prefetched.
+        """
+        import multiprocessing
+
+        self.cancel()
+
+        config = generator.cfg.model_dump()
+        config["seed"] = generator._new_random_seed()
+        config["algorithm"] = str(generator.algorithm)
+        config["workers"] = 1
+        if config.get("grid_file") is not None:
+            # The grid file of `generator` is mapped: the worker maps its
+            # own, or it would overwrite the maze on screen.
+            config["grid_file"] += ".next"
+        self.algorithm = config["algorithm"]
+
+        self._conn, child_conn = multiprocessing.Pipe(duplex=False)
+        self._process = multiprocessing.Process(
+            target=_prefetch_worker, args=(config, child_conn), daemon=True)
+        self._process.start()
+        child_conn.close()
+
+    def restart(self, generator: "MazeGenerator") -> None:
+        """Drops the maze in progress and prefetches a new one.
+
+        Called when a setting that changes the maze (like the algorithm)
+        is modified.
+
+        Args:
+            generator: The generator whose next maze is prefetched.
+        """
+        self.start(generator)
+
+    def take(self, generator: "MazeGenerator"
+             ) -> Tuple[str, "CachedMaze"] | None:
+        """Returns the prefetched maze, waiting for it if still running.
+
+        Args:
+            generator: The generator about to regenerate. The maze is only
+                       returned if it was generated with its algorithm.
+
+        Returns:
+            Tuple[str, CachedMaze] | None: The seed and the result to pass
+            to `maze_generator(prefetched=...)`, or None if nothing usable
+            was prefetched (`error` then tells why, if the worker failed).
+        """
+        self.error = None
+        if self._conn is None or self.algorithm != str(generator.algorithm):
+            self.cancel()
+            return None
+
+        try:
+            seed, result = self._conn.recv()
+        except (EOFError, OSError):
+            seed, result = None, "The prefetch worker died"
+        self.cancel()
+        if seed is None:
+            self.error = result
+            return None
+        return seed, result
+
+    def cancel(self) -> None:
+        """Stops the worker, if any, and forgets its maze."""
+        if self._process is not None:
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process.join()
+            self._process = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self.algorithm = None
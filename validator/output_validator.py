@@ -1,25 +1,148 @@
 # This script does not check for errors or malformed files.
 # It only validates that neighbooring cells sharing a wall have
-#  both the correct encoding.
+#  both the correct encoding, and that the '42' pattern is closed: its
+#  cells are written 'F', and the walls it covers are closed on both sides.
+# The file is read row by row, in any output format: '.txt', '.mzb',
+#  optionally compressed ('.gz', '.xz'), or a '.mza' archive (every maze,
+#  or only maze #N through its index).
 # Usage: python3 output_validator.py output_maze.txt
+#        python3 output_validator.py archive.mza [N]
 
+import gzip
+import lzma
+import struct
 import sys
 
-if len(sys.argv) != 2:
-    print(f"Usage: python3 {sys.argv[0]} <output_file>")
+MZB_HEADER = struct.Struct("<4sIIIIIIBII")
+MZA_ENTRY = struct.Struct("<16sQQ")
+
+
+def open_file(path):
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    if path.endswith('.xz'):
+        return lzma.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def text_rows(file):
+    for line in file:
+        if line.strip() == b'':
+            break
+        yield [int(c, 16) for c in line.strip(b' \t\n\r').decode()]
+
+
+def text_size(path):
+    with open_file(path) as file:
+        rows = text_rows(file)
+        first = next(rows, [])
+        return len(first), 1 + sum(1 for _ in rows)
+
+
+def read_header(file, header=None):
+    header = MZB_HEADER.unpack(header or file.read(MZB_HEADER.size))
+    width, height, seed_size, moves = (header[1], header[2], header[8],
+                                       header[9])
+    file.read(seed_size + moves)
+    return width, height
+
+
+def binary_rows(file, width, height):
+    pending = []
+    for _ in range(height):
+        while len(pending) < width:
+            packed = file.read(1)[0]
+            pending += [packed >> 4, packed & 0xF]
+        yield pending[:width]
+        # The cells are packed across rows: keep the odd one.
+        pending = pending[width:]
+
+
+def check(r, above, row, below, name=''):
+    for c in range(len(row)):
+        v = row[c]
+        if not all([(above is None or v & 1 == (above[c] >> 2) & 1),
+                    (c >= len(row)-1 or (v >> 1) & 1 == (row[c+1] >> 3) & 1),
+                    (below is None or (v >> 2) & 1 == below[c] & 1),
+                    (c < 1 or (v >> 3) & 1 == (row[c-1] >> 1) & 1)]):
+            print(f'Wrong encoding for {name}({c},{r})')
+
+
+def pattern_walls(width, height):
+    # The '42' blocks of maze_fortytwo_pattern, turned into the walls they
+    # close: {row: {column: bits}}.
+    blocks_w, blocks_h = width * 2 + 1, height * 2 + 1
+    if blocks_w <= 9 or blocks_h <= 9:
+        return {}
+    cx, cy = blocks_w // 2, blocks_h // 2
+    cx += 1 - cx % 2
+    cy += 1 - cy % 2
+    blocks = [(-3, 0), (-3, -1), (-3, -2), (-1, 0), (-2, 0), (-1, 1),
+              (-1, 2), (3, 2), (2, 2), (1, 2), (1, 0), (1, 1), (2, 0),
+              (3, 0), (3, -1), (3, -2), (2, -2), (1, -2)]
+    walls = {}
+    for dx, dy in blocks:
+        x, y = cx + dx, cy + dy
+        if x % 2 and y % 2:
+            sides = [(x, y, 0xF)]
+        elif y % 2:
+            sides = [(x - 1, y, 2), (x + 1, y, 8)]
+        elif x % 2:
+            sides = [(x, y - 1, 4), (x, y + 1, 1)]
+        else:
+            continue
+        for x, y, bits in sides:
+            row = walls.setdefault((y - 1) // 2, {})
+            row[(x - 1) // 2] = row.get((x - 1) // 2, 0) | bits
+    return walls
+
+
+def validate(rows, name='', size=None):
+    walls = pattern_walls(*size) if size else {}
+    above, row = None, next(rows, None)
+    r = 0
+    while row is not None:
+        below = next(rows, None)
+        check(r, above, row, below, name)
+        for c, bits in walls.get(r, {}).items():
+            if row[c] & bits != bits:
+                print(f"Open '42' wall for {name}({c},{r})")
+        above, row = row, below
+        r += 1
+
+
+def validate_archive(path, number):
+    with open(path, 'rb') as file:
+        file.read(4)
+        if number is not None:
+            with open(path + '.idx', 'rb') as index:
+                index.seek(4 + number * MZA_ENTRY.size)
+                file.seek(MZA_ENTRY.unpack(index.read(MZA_ENTRY.size))[1])
+            size = read_header(file)
+            validate(binary_rows(file, *size), f'maze #{number} ', size)
+            return
+        number = 0
+        while True:
+            header = file.read(MZB_HEADER.size)
+            if not header:
+                break
+            # Aliases share a record: the records are numbered apart.
+            size = read_header(file, header)
+            validate(binary_rows(file, *size), f'record #{number} ', size)
+            number += 1
+
+
+if len(sys.argv) not in (2, 3):
+    print(f"Usage: python3 {sys.argv[0]} <output_file> [maze number]")
     sys.exit(1)
 
-g = []
-for line in open(sys.argv[1]):
-    if line.strip() == '':
-        break
-    g.append([int(c, 16) for c in line.strip(' \t\n\r')])
-
-for r in range(len(g)):
-    for c in range(len(g[0])):
-        v = g[r][c]
-        if not all([(r < 1 or v & 1 == (g[r-1][c] >> 2) & 1),
-                    (c >= len(g[0])-1 or (v >> 1) & 1 == (g[r][c+1] >> 3) & 1),
-                    (r >= len(g)-1 or (v >> 2) & 1 == g[r+1][c] & 1),
-                    (c < 1 or (v >> 3) & 1 == (g[r][c-1] >> 1) & 1)]):
-            print(f'Wrong encoding for ({c},{r})')
+path = sys.argv[1]
+if path.endswith('.mza'):
+    validate_archive(path, int(sys.argv[2]) if len(sys.argv) == 3 else None)
+else:
+    with open_file(path) as file:
+        if path.endswith(('.mzb', '.mzb.gz', '.mzb.xz')):
+            size = read_header(file)
+            validate(binary_rows(file, *size), '', size)
+        else:
+            validate(text_rows(file), '', text_size(path))